@@ -0,0 +1,183 @@
+"""
+Benchmark for the python-constraint resource checks.
+
+Compares the original `resource_constraint` function against `ResourceConstraint` on the
+bundled `data/p01_dataset_*.txt` instances. Two measurements are taken per instance:
+
+    - check: average time of a single call on random full assignments.
+    - solve: time for `Problem.getSolution()` using each constraint in the otherwise unchanged
+      original problem definition (only on instances small enough for the original function
+      to finish).
+
+Usage:
+    Run from the repository root:
+        PYTHONPATH=app python -m benchmarks.resource_constraint
+"""
+
+import glob
+import random
+import time
+
+from constraint import Problem
+
+from data_parsing import parse_file, ProjectData
+from csp_solvers.python_constraint.resource_constraint import (
+    resource_constraint,
+    ResourceConstraint,
+)
+from csp_solvers.python_constraint.successor_constraint import successor_constraint
+
+SAMPLES = 2000
+SOLVE_MAX_JOBS = 12
+
+
+def random_assignments(data: ProjectData, samples: int, seed: int = 0) -> list[list[int]]:
+    """
+    Draws random start times that keep every job inside the horizon.
+
+    Args:
+        data (ProjectData): The project data.
+        samples (int): Number of assignments to draw.
+        seed (int): Seed for the random generator.
+
+    Returns:
+        list[list[int]]: Start times per assignment, ordered like `durations_resources`.
+    """
+    rng = random.Random(seed)
+    horizon = data.general_info.horizon
+    return [
+        [rng.randint(0, horizon - dr.duration) for dr in data.durations_resources]
+        for _ in range(samples)
+    ]
+
+
+def baseline_problem(data: ProjectData, legacy: bool) -> Problem:
+    """
+    Builds the problem the way `define_problem` did before `ResourceConstraint`, with either
+    resource check.
+
+    Everything else (full horizon domains, the successor lambdas, the default solver) is the
+    same for both checks, so a difference in solve time comes from the resource constraint
+    alone and not from the later changes to `define_problem`.
+
+    Args:
+        data (ProjectData): The project data.
+        legacy (bool): Whether to check resources with the original `resource_constraint`
+                       function instead of `ResourceConstraint`.
+
+    Returns:
+        Problem: The problem to solve.
+    """
+    domain = range(data.general_info.horizon)
+    start_times = [f"job_{job.job_number}" for job in data.precedence_relations]
+
+    problem = Problem()
+    for job in data.precedence_relations:
+        number = job.job_number
+        problem.addVariable(f"job_{number}", domain)
+        for successor in job.successors:
+            duration = data.durations_resources[number - 1].duration
+            problem.addConstraint(
+                lambda start_j, start_s, duration=duration: successor_constraint(
+                    start_j, start_s, duration
+                ),
+                (f"job_{number}", f"job_{successor}"),
+            )
+
+    if legacy:
+        problem.addConstraint(
+            lambda *start_times: resource_constraint(
+                *start_times, time_slots=domain, project_data=data
+            ),
+            start_times,
+        )
+    else:
+        problem.addConstraint(ResourceConstraint(data), start_times)
+    return problem
+
+
+def bench_check(data: ProjectData) -> tuple[float, float]:
+    """
+    Times a single resource check with both implementations.
+
+    Returns:
+        tuple: Average seconds per call for the legacy function and for ResourceConstraint.
+    """
+    domain = range(data.general_info.horizon)
+    variables = [f"job_{dr.job_number}" for dr in data.durations_resources]
+    assignments = random_assignments(data, SAMPLES)
+
+    start = time.perf_counter()
+    legacy = [
+        resource_constraint(*starts, time_slots=domain, project_data=data)
+        for starts in assignments
+    ]
+    legacy_time = (time.perf_counter() - start) / SAMPLES
+
+    constraint = ResourceConstraint(data)
+    start = time.perf_counter()
+    current = [
+        constraint(variables, {}, dict(zip(variables, starts)))
+        for starts in assignments
+    ]
+    current_time = (time.perf_counter() - start) / SAMPLES
+
+    if legacy != current:
+        raise AssertionError("ResourceConstraint disagrees with resource_constraint")
+
+    return legacy_time, current_time
+
+
+def bench_solve(data: ProjectData) -> tuple[float, float]:
+    """
+    Times `getSolution()` on the same problem definition with each resource constraint.
+
+    Returns:
+        tuple: Seconds to the first solution with the legacy function and with
+               ResourceConstraint.
+    """
+    start = time.perf_counter()
+    baseline_problem(data, legacy=True).getSolution()
+    legacy_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    baseline_problem(data, legacy=False).getSolution()
+    current_time = time.perf_counter() - start
+
+    return legacy_time, current_time
+
+
+def instance_files() -> list[str]:
+    """
+    Lists the bundled instances ordered by their job count suffix.
+    """
+    return sorted(
+        glob.glob("data/p01_dataset_*.txt"),
+        key=lambda path: int(path.rsplit("_", 1)[1].split(".")[0]),
+    )
+
+
+def main():
+    print(f"{'instance':<24}{'check legacy':>14}{'check new':>12}{'speedup':>9}"
+          f"{'solve legacy':>14}{'solve new':>12}{'speedup':>9}")
+
+    for file_path in instance_files():
+        with open(file_path, "r") as file:
+            data = parse_file(file)
+
+        legacy_check, new_check = bench_check(data)
+        row = (f"{file_path.split('/')[-1]:<24}{legacy_check * 1e6:>12.1f}us"
+               f"{new_check * 1e6:>10.1f}us{legacy_check / new_check:>8.1f}x")
+
+        if data.general_info.jobs <= SOLVE_MAX_JOBS:
+            legacy_solve, new_solve = bench_solve(data)
+            row += (f"{legacy_solve:>13.3f}s{new_solve:>11.3f}s"
+                    f"{legacy_solve / new_solve:>8.1f}x")
+        else:
+            row += f"{'-':>14}{'-':>12}{'-':>9}"
+
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
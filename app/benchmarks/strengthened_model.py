@@ -0,0 +1,73 @@
+"""
+Benchmark of the strengthened OR-Tools model against the base model.
+
+Every instance is solved with `define_problem(..., strengthen=False)` and with
+`strengthen=True`, single threaded, and the median wall time to prove optimality (or to hit
+the time limit) is reported along with the number of constraints of each model.
+
+Usage:
+    Run from the repository root:
+        PYTHONPATH=app python -m benchmarks.strengthened_model [pattern] [--repeats N]
+"""
+
+import argparse
+import glob
+import logging
+import statistics
+import time
+
+from data_parsing import parse_file, ProjectData
+from csp_solvers import ortools
+
+
+def time_proof(data: ProjectData, strengthen: bool, repeats: int, time_limit: float):
+    """
+    Solves an instance several times and returns the median solve time.
+
+    Returns:
+        tuple: Median seconds, status name, objective value and number of constraints.
+    """
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        model, start_times = ortools.define_problem(data, strengthen=strengthen)
+        solver = ortools.create_solver(1, time_limit)
+        status, _, _ = ortools.solve(model, start_times, data, solver)
+        times.append(time.perf_counter() - start)
+
+    return (
+        statistics.median(times),
+        solver.StatusName(status),
+        solver.ObjectiveValue(),
+        len(model.Proto().constraints),
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare base and strengthened CP-SAT models.")
+    parser.add_argument("pattern", nargs="?", default="data/p01_dataset_*.txt")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--time-limit", type=float, default=60.0)
+    args = parser.parse_args()
+
+    # Keep the per solution logs of the progress callback out of the table
+    logging.getLogger().setLevel(logging.WARNING)
+
+    print(f"{'instance':<28}{'base':>10}{'strong':>10}{'speedup':>9}"
+          f"{'status':>10}{'obj':>6}{'cons base':>11}{'cons strong':>13}")
+
+    for file_path in sorted(glob.glob(args.pattern)):
+        with open(file_path, "r") as file:
+            data = parse_file(file)
+
+        base, _, _, base_constraints = time_proof(data, False, args.repeats, args.time_limit)
+        strong, status, objective, strong_constraints = time_proof(
+            data, True, args.repeats, args.time_limit
+        )
+
+        print(f"{file_path.split('/')[-1]:<28}{base:>9.4f}s{strong:>9.4f}s{base / strong:>8.2f}x"
+              f"{status:>10}{objective:>6.0f}{base_constraints:>11}{strong_constraints:>13}")
+
+
+if __name__ == "__main__":
+    main()
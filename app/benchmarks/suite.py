@@ -0,0 +1,279 @@
+"""
+Benchmark suite timing every solver type on a set of instances.
+
+Each (instance, solver) pair is run `--warmup` times untimed, then `--repeats` times with the
+phases timed separately using `time.perf_counter`:
+
+    - parse: parse_file on the instance file.
+    - build: building the model (define_problem, or the columnar view for the heuristic).
+    - solve: running the search (for the portfolio, the whole race, model building included).
+    - extract: reading the schedule back and normalising it with process_solution.
+
+One extra untimed run under `tracemalloc` records the peak Python memory of the pair (memory
+allocated inside native solvers is not included). Instances of the sizes given with `--generate`
+are created on the fly with the synthetic generator. Results are written to a JSON file together
+with the environment, and can be compared against a previous file to catch regressions.
+
+Usage:
+    Run from the repository root:
+        PYTHONPATH=app python -m benchmarks.suite --output bench.json
+        PYTHONPATH=app python -m benchmarks.suite --output new.json --compare bench.json
+        PYTHONPATH=app python -m benchmarks.suite --generate 100 1000 10000 --solvers HEURISTIC
+"""
+
+import argparse
+import glob
+import json
+import logging
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from importlib.metadata import version, PackageNotFoundError
+
+from data_parsing import parse_file
+from main_generate import generate_suite
+from csp_solvers import SolverType, process_solution
+
+PHASES = ("parse", "build", "solve", "extract")
+
+
+def run_once(file_path: str, solver_type: SolverType, time_limit: float) -> dict:
+    """
+    Runs every phase once for an instance and solver.
+
+    Returns:
+        dict: Seconds per phase, plus the status and makespan of the schedule.
+    """
+    timings = {}
+
+    start = time.perf_counter()
+    with open(file_path, "r") as file:
+        data = parse_file(file)
+    timings["parse"] = time.perf_counter() - start
+
+    match solver_type:
+        case SolverType.PYTHON_CONSTRAINT:
+            from csp_solvers import python_constraint
+
+            start = time.perf_counter()
+            problem = python_constraint.define_problem(data)
+            timings["build"] = time.perf_counter() - start
+
+            start = time.perf_counter()
+            solution = problem.getSolution()
+            timings["solve"] = time.perf_counter() - start
+            status = "FEASIBLE" if solution else "INFEASIBLE"
+
+            start = time.perf_counter()
+
+        case SolverType.OR_TOOLS:
+            from csp_solvers import ortools
+
+            start = time.perf_counter()
+            model, start_times = ortools.define_problem(data)
+            solver = ortools.create_solver(1, time_limit)
+            timings["build"] = time.perf_counter() - start
+
+            start = time.perf_counter()
+            result = solver.Solve(model)
+            timings["solve"] = time.perf_counter() - start
+            status = solver.StatusName(result)
+
+            start = time.perf_counter()
+            solution = None
+            if status in ("OPTIMAL", "FEASIBLE"):
+                solution = ortools.extract_solution(solver, start_times, data)
+
+        case SolverType.HEURISTIC:
+            from csp_solvers import heuristic
+
+            start = time.perf_counter()
+            data.arrays
+            timings["build"] = time.perf_counter() - start
+
+            start = time.perf_counter()
+            solution = heuristic.solve(data, passes=10, seed=0)
+            timings["solve"] = time.perf_counter() - start
+            status = "FEASIBLE"
+
+            start = time.perf_counter()
+
+        case SolverType.PORTFOLIO:
+            from csp_solvers import portfolio
+
+            # Every backend builds its model in its own process, that time is part of the race
+            timings["build"] = 0.0
+
+            start = time.perf_counter()
+            status, solution, _, _ = portfolio.solve(data, time_limit)
+            timings["solve"] = time.perf_counter() - start
+
+            start = time.perf_counter()
+
+    makespan = None
+    if solution:
+        solution = process_solution(solution, data)
+        makespan = max(
+            solution[f"job_{dr.job_number}"] + dr.duration for dr in data.durations_resources
+        )
+    timings["extract"] = time.perf_counter() - start
+
+    return {"timings": timings, "status": status, "makespan": makespan, "jobs": len(data.durations_resources)}
+
+
+def benchmark(file_path: str, solver_type: SolverType, args) -> dict:
+    """
+    Warms up, then times `args.repeats` runs and measures peak memory for one pair.
+
+    Returns:
+        dict: The result row of the pair.
+    """
+    for _ in range(args.warmup):
+        run_once(file_path, solver_type, args.time_limit)
+
+    runs = [run_once(file_path, solver_type, args.time_limit) for _ in range(args.repeats)]
+
+    tracemalloc.start()
+    run_once(file_path, solver_type, args.time_limit)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    row = {
+        "instance": file_path,
+        "jobs": runs[0]["jobs"],
+        "solver": solver_type.name,
+        "status": runs[-1]["status"],
+        "makespan": runs[-1]["makespan"],
+        "peak_memory_kb": round(peak / 1024, 1),
+    }
+    for phase in PHASES + ("total",):
+        values = [
+            sum(run["timings"].values()) if phase == "total" else run["timings"][phase]
+            for run in runs
+        ]
+        row[phase] = {"median": statistics.median(values), "min": min(values)}
+
+    return row
+
+
+def environment() -> dict:
+    """
+    Describes the interpreter and library versions the results were measured with.
+    """
+    packages = {}
+    for package in ("ortools", "python-constraint", "numpy"):
+        try:
+            packages[package] = version(package)
+        except PackageNotFoundError:
+            packages[package] = None
+
+    return {
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "packages": packages,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+def compare(results: list[dict], baseline_path: str, tolerance: float) -> list[str]:
+    """
+    Lists the pairs whose median total time grew by more than `tolerance` against a baseline.
+    """
+    with open(baseline_path, "r") as file:
+        baseline = {
+            (row["instance"], row["solver"]): row for row in json.load(file)["results"]
+        }
+
+    regressions = []
+    for row in results:
+        previous = baseline.get((row["instance"], row["solver"]))
+        if previous is None:
+            continue
+
+        before, after = previous["total"]["median"], row["total"]["median"]
+        if after > before * (1 + tolerance):
+            regressions.append(
+                f"{row['instance']} {row['solver']}: {before:.4f}s -> {after:.4f}s "
+                f"({after / before:.2f}x)"
+            )
+
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark every solver on a set of instances.")
+    parser.add_argument(
+        "--instances",
+        nargs="+",
+        default=["data/p01_dataset_*.txt"],
+        help="Glob patterns of the instance files.",
+    )
+    parser.add_argument(
+        "--solvers",
+        nargs="+",
+        choices=[solver.name for solver in SolverType],
+        default=[solver.name for solver in SolverType],
+    )
+    parser.add_argument(
+        "--generate",
+        type=int,
+        nargs="*",
+        default=[100, 1000],
+        help="Also benchmark generated instances with these numbers of jobs.",
+    )
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--time-limit", type=float, default=30.0, help="OR-Tools and portfolio seconds per run.")
+    parser.add_argument(
+        "--csp-max-jobs",
+        type=int,
+        default=32,
+        help="Skip python-constraint on larger instances, its search cannot be time limited.",
+    )
+    parser.add_argument("--output", default="benchmark_results.json")
+    parser.add_argument("--compare", help="A previous results file to check for regressions.")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args()
+
+    # Keep the per solution logs of the progress callback out of the table
+    logging.getLogger().setLevel(logging.WARNING)
+
+    files = sorted({path for pattern in args.instances for path in glob.glob(pattern)})
+    if args.generate:
+        files += generate_suite(args.generate, [0], tempfile.mkdtemp(prefix="benchmark_"))
+    results = []
+
+    print(f"{'instance':<28}{'solver':<19}" + "".join(f"{phase:>9}" for phase in PHASES)
+          + f"{'peak kb':>10}{'makespan':>9}")
+
+    for file_path in files:
+        for solver_type in map(SolverType.__getitem__, args.solvers):
+            if solver_type == SolverType.PYTHON_CONSTRAINT:
+                with open(file_path, "r") as file:
+                    if len(parse_file(file).durations_resources) > args.csp_max_jobs:
+                        continue
+
+            row = benchmark(file_path, solver_type, args)
+            results.append(row)
+
+            print(f"{file_path.split('/')[-1]:<28}{row['solver']:<19}"
+                  + "".join(f"{row[phase]['median'] * 1e3:>9.2f}" for phase in PHASES)
+                  + f"{row['peak_memory_kb']:>10.0f}{str(row['makespan']):>9}")
+
+    with open(args.output, "w") as file:
+        json.dump({"environment": environment(), "results": results}, file, indent=2)
+    print(f"\nResults written to {args.output} (times in ms, medians of {args.repeats} runs)")
+
+    if args.compare:
+        regressions = compare(results, args.compare, args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1 +1,13 @@
-from .utils import SolverType, process_solution
+from .utils import SolverType, DueDateMode, process_solution, compute_makespan
+from .time_windows import compute_time_windows, topological_order
+from .validation import (
+    ScheduleReport,
+    resource_profile,
+    overload_intervals,
+    validate_arrays,
+    schedule_array,
+    validate,
+    is_feasible,
+)
+from .solution_cache import SolutionCache
+from .rescheduling import ChangeType, Change, apply_changes, residual_project, reschedule
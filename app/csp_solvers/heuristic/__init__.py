@@ -0,0 +1,4 @@
+from .priority_rules import PriorityRule, compute_priorities
+from .schedule_generation import ScheduleScheme, serial_sgs, parallel_sgs
+from .solve import solve
+from .local_search import ActivityList, activity_list, tabu_search, improve, repair
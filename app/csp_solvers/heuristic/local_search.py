@@ -0,0 +1,438 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from data_parsing import ProjectData
+
+from .schedule_generation import _earliest_fit
+from .solve import _instance_arrays, solve
+
+
+class ActivityList:
+    """
+    A precedence feasible activity list and the serial SGS schedule it decodes to.
+
+    Moves shift one job to another position of the list. Decoding is incremental: the jobs
+    before the first changed position keep their starts and their share of the resource
+    profile, only the rest of the list is decoded again. Decoding stops as soon as every job
+    from the changed positions on has been placed at its old start, since the resource profile
+    is then identical and the remaining jobs would land where they were. The profile is only
+    updated on the intervals of the jobs involved, and a move is undone by moving back the jobs
+    it decoded, so no move copies or rebuilds the (time, resources) profile.
+
+    Attributes:
+        order (np.ndarray): Job indices in list order.
+        position (np.ndarray): Position of each job in the list.
+        starts (np.ndarray): Start time of each job.
+        free (np.ndarray): Free capacity of shape (time, resources) left by the schedule.
+    """
+
+    def __init__(self, durations, demands, capacities, successors, order):
+        self.durations = durations
+        self.demands = demands
+        self.capacities = capacities
+        self.successors = [np.array(s, dtype=np.int64) for s in successors]
+
+        predecessors = [[] for _ in successors]
+        for j, job_successors in enumerate(successors):
+            for successor in job_successors:
+                predecessors[successor].append(j)
+        self.predecessors = [np.array(p, dtype=np.int64) for p in predecessors]
+
+        self.horizon = int(durations.sum()) + 1
+        self.reset(order)
+
+    def reset(self, order):
+        """
+        Replaces the list and decodes it from scratch.
+        """
+        self.order = np.array(order, dtype=np.int64)
+        self.position = np.empty_like(self.order)
+        self.position[self.order] = np.arange(len(self.order))
+        self.starts = np.zeros(len(self.durations), dtype=np.int64)
+        self.finish = [0] * len(self.durations)
+        self.free = np.tile(self.capacities, (self.horizon + 1, 1))
+
+        self._decode(0, len(self.order))
+
+    def objective(self) -> tuple[int, int]:
+        """
+        Returns the makespan, with the sum of the start times as tie breaker.
+        """
+        return int((self.starts + self.durations).max()), int(self.starts.sum())
+
+    def _book(self, jobs: np.ndarray, sign: int = 1):
+        """
+        Takes (sign 1) or gives back (sign -1) the demand of the jobs at their current starts.
+
+        Only the rows between the earliest start and the latest finish of the jobs are updated,
+        never the whole (time, resources) profile.
+        """
+        # A few jobs are cheaper to book one interval at a time than through a delta profile
+        if len(jobs) < 8:
+            for j in jobs.tolist():
+                self.free[int(self.starts[j]) : self.finish[j]] -= sign * self.demands[j]
+            return
+
+        starts = self.starts[jobs]
+        finish = starts + self.durations[jobs]
+        low, high = int(starts.min()), int(finish.max())
+
+        delta = np.zeros((high - low + 1, self.demands.shape[1]), dtype=np.int64)
+        np.add.at(delta, starts - low, self.demands[jobs])
+        np.add.at(delta, finish - low, -self.demands[jobs])
+        self.free[low:high] -= sign * delta[:-1].cumsum(axis=0)
+
+    def _decode(self, first: int, sync: int, bound: int | None = None) -> tuple[list, bool]:
+        """
+        Decodes the list from position `first`, assuming the profile holds only earlier jobs.
+
+        Once position `sync` is passed with no start changed, the remaining jobs are booked
+        back at their old starts.
+
+        Returns:
+            tuple: The (job, old start) of each decoded job, and False if decoding was abandoned
+                because a job finished after `bound`. The jobs after the last decoded one are
+                then missing from the profile.
+        """
+        decoded = []
+        changed = False
+        for k in range(first, len(self.order)):
+            j = int(self.order[k])
+            duration = int(self.durations[j])
+
+            earliest = max((self.finish[p] for p in self.predecessors[j].tolist()), default=0)
+            start = _earliest_fit(self.free, self.demands[j], earliest, duration)
+            self.free[start : start + duration] -= self.demands[j]
+
+            decoded.append((j, int(self.starts[j])))
+            changed = changed or start != self.starts[j]
+            self.starts[j] = start
+            self.finish[j] = start + duration
+
+            if bound is not None and start + duration > bound:
+                return decoded, False
+
+            if k >= sync and not changed:
+                self._book(self.order[k + 1 :])
+                return decoded, True
+
+        return decoded, True
+
+    def feasible_range(self, i: int) -> tuple[int, int]:
+        """
+        Positions the job at position `i` can be shifted to without breaking precedence.
+        """
+        j = self.order[i]
+        low = int(self.position[self.predecessors[j]].max()) + 1 if self.predecessors[j].size else 0
+        high = (
+            int(self.position[self.successors[j]].min()) - 1
+            if self.successors[j].size
+            else len(self.order) - 1
+        )
+        return low, high
+
+    def shift(self, i: int, k: int, bound: int | None = None):
+        """
+        Moves the job at position `i` to position `k` and decodes the affected part of the list.
+
+        Args:
+            i (int): Current position of the job.
+            k (int): New position of the job.
+            bound (int, optional): Stop decoding once a job finishes after this time.
+
+        Returns:
+            tuple: The state needed by undo(), and whether decoding completed. An incomplete
+                decode must be undone.
+        """
+        first, last = min(i, k), max(i, k)
+        segment = self.order[first : last + 1].copy()
+
+        self._book(self.order[first:], -1)
+
+        self.order[first : last + 1] = np.roll(segment, -1 if i < k else 1)
+        self.position[self.order[first : last + 1]] = np.arange(first, last + 1)
+
+        decoded, complete = self._decode(first, last, bound)
+        return (first, segment, decoded, complete), complete
+
+    def undo(self, saved: tuple):
+        """
+        Reverts a shift, moving only the jobs it decoded back to their old starts.
+        """
+        first, segment, decoded, complete = saved
+        jobs = np.array([j for j, _ in decoded], dtype=np.int64)
+
+        self._book(jobs, -1)
+        for j, start in decoded:
+            self.starts[j] = start
+            self.finish[j] = start + int(self.durations[j])
+        self._book(jobs)
+
+        # An abandoned decode never booked the later jobs back
+        if not complete:
+            self._book(self.order[first + len(decoded) :])
+
+        self.order[first : first + len(segment)] = segment
+        self.position[segment] = np.arange(first, first + len(segment))
+
+
+def activity_list(starts: np.ndarray, successors: list[list[int]]) -> np.ndarray:
+    """
+    Builds a precedence feasible activity list from a schedule.
+
+    Jobs are ordered by start time, ties broken by a topological rank so that zero duration
+    jobs still come before their successors.
+    """
+    n = len(starts)
+    predecessors_left = [0] * n
+    for job_successors in successors:
+        for successor in job_successors:
+            predecessors_left[successor] += 1
+
+    rank = np.zeros(n, dtype=np.int64)
+    ready = [j for j in range(n) if predecessors_left[j] == 0]
+    for index in range(n):
+        j = ready.pop()
+        rank[j] = index
+        for successor in successors[j]:
+            predecessors_left[successor] -= 1
+            if predecessors_left[successor] == 0:
+                ready.append(successor)
+
+    return np.lexsort((rank, starts))
+
+
+def repair(data: ProjectData, solution: dict) -> dict:
+    """
+    Turns a possibly infeasible schedule (e.g., after capacities changed) into a feasible one.
+
+    The jobs are listed by their start in the given schedule and decoded with the serial SGS,
+    so the result keeps the job order of the schedule as far as the resources allow. A feasible
+    schedule is never made longer.
+
+    Args:
+        data (ProjectData): The project data (single mode).
+        solution (dict): The schedule, with "job_N" keys and start time values.
+
+    Returns:
+        dict: A feasible schedule with "job_N" keys and start time values.
+
+    Raises:
+        ValueError: If a job demands more of a resource than is available.
+    """
+    arrays = _instance_arrays(data)
+    job_numbers = data.arrays.job_numbers
+    starts = np.array([solution[f"job_{number}"] for number in job_numbers], dtype=np.int64)
+
+    schedule = ActivityList(*arrays, activity_list(starts, arrays[3]))
+    return {f"job_{number}": int(start) for number, start in zip(job_numbers, schedule.starts)}
+
+
+def _random_shift(schedule: ActivityList, rng: np.random.Generator):
+    """
+    Draws a random precedence feasible shift, as a (from, to) pair of positions, or None.
+    """
+    i = int(rng.integers(len(schedule.order)))
+    low, high = schedule.feasible_range(i)
+    if low == high:
+        return None
+
+    k = int(rng.integers(low, high))
+    return i, k if k < i else k + 1
+
+
+def tabu_search(
+    schedule: ActivityList,
+    deadline: float,
+    rng: np.random.Generator,
+    candidates: int = 8,
+    tenure: int = 10,
+    stall_limit: int = 200,
+) -> tuple[tuple[int, int], np.ndarray]:
+    """
+    Improves an activity list with a sampled tabu search until the deadline.
+
+    Each iteration evaluates `candidates` random shifts and applies the best one whose job is
+    not tabu (a tabu move is still allowed if it beats the best schedule found). Decoding of a
+    candidate is abandoned as soon as its makespan exceeds the best candidate's. After
+    `stall_limit` iterations without improvement, the search restarts from the best list
+    with a few random shifts applied.
+
+    Args:
+        schedule (ActivityList): The starting list, modified in place.
+        deadline (float): Wall clock time (time.time()) at which to stop.
+        rng (np.random.Generator): Random generator.
+        candidates (int): Number of moves sampled per iteration.
+        tenure (int): Number of iterations a moved job stays tabu.
+        stall_limit (int): Iterations without improvement before a restart.
+
+    Returns:
+        tuple: The best objective and the best activity list.
+    """
+    best = schedule.objective()
+    best_order = schedule.order.copy()
+    tabu_until = np.zeros(len(schedule.order), dtype=np.int64)
+    iteration = stall = 0
+
+    while time.time() < deadline:
+        iteration += 1
+
+        chosen, chosen_value = None, None
+        for _ in range(candidates):
+            move = _random_shift(schedule, rng)
+            if move is None:
+                continue
+
+            # A move whose makespan exceeds the best candidate's cannot be chosen
+            bound = chosen_value[0] if chosen_value else None
+            saved, complete = schedule.shift(*move, bound)
+            value = schedule.objective() if complete else None
+            schedule.undo(saved)
+            if value is None:
+                continue
+
+            job = schedule.order[move[0]]
+            if tabu_until[job] > iteration and value >= best:
+                continue
+            if chosen_value is None or value < chosen_value:
+                chosen, chosen_value = move, value
+
+        if chosen is None:
+            continue
+
+        tabu_until[schedule.order[chosen[0]]] = iteration + tenure
+        schedule.shift(*chosen)
+
+        if chosen_value < best:
+            best, best_order = chosen_value, schedule.order.copy()
+            stall = 0
+        else:
+            stall += 1
+
+        if stall >= stall_limit:
+            restart(schedule, best_order, rng)
+            stall = 0
+
+    return best, best_order
+
+
+def restart(schedule: ActivityList, order: np.ndarray, rng: np.random.Generator, shifts: int = 5):
+    """
+    Resets a schedule to the given list, then perturbs it with a few random shifts.
+    """
+    schedule.reset(order)
+
+    for _ in range(shifts):
+        move = _random_shift(schedule, rng)
+        if move is not None:
+            schedule.shift(*move)
+
+
+# Instance arrays of the island worker processes, set once by the pool initializer
+_island_arrays = None
+
+
+def _init_island(arrays):
+    global _island_arrays
+    _island_arrays = arrays
+
+
+def _run_island(order: np.ndarray, seed: int, deadline: float, perturb: bool):
+    """
+    Runs one island of the search for one migration interval.
+    """
+    rng = np.random.default_rng(seed)
+    schedule = ActivityList(*_island_arrays, order)
+    if perturb:
+        restart(schedule, order, rng)
+    return tabu_search(schedule, deadline, rng)
+
+
+def improve(
+    data: ProjectData,
+    solution: dict | None = None,
+    time_limit: float = 10.0,
+    islands: int | None = None,
+    migration_interval: float = 1.0,
+    seed: int | None = None,
+) -> dict:
+    """
+    Improves a schedule with a tabu search over activity lists, run on parallel islands.
+
+    The islands search independently in worker processes. Every `migration_interval` seconds
+    the best list of each island is offered to the next one (ring migration), which continues
+    from it if it is better than its own.
+
+    Args:
+        data (ProjectData): The project data (single mode).
+        solution (dict, optional): Starting schedule with "job_N" keys, e.g., from
+            process_solution. Defaults to a serial SGS schedule with the LFT rule.
+        time_limit (float): Wall clock budget in seconds.
+        islands (int, optional): Number of islands. Defaults to the number of CPU cores.
+            With one island the search runs in the calling process.
+        migration_interval (float): Seconds between migrations.
+        seed (int, optional): Seed for the random generators.
+
+    Returns:
+        dict: The best schedule found, with "job_N" keys and start time values. It is never
+            worse than the starting schedule.
+
+    Raises:
+        ValueError: If a job demands more of a resource than is available.
+    """
+    deadline = time.time() + time_limit
+    arrays = _instance_arrays(data)
+    durations, _, _, successors = arrays
+    job_numbers = data.arrays.job_numbers
+
+    if solution is None:
+        solution = solve(data)
+    starts = np.array([solution[f"job_{number}"] for number in job_numbers], dtype=np.int64)
+    order = activity_list(starts, successors)
+
+    islands = islands or os.cpu_count()
+    seeds = np.random.SeedSequence(seed).generate_state(islands)
+
+    if islands == 1:
+        _init_island(arrays)
+        _, order = _run_island(order, int(seeds[0]), deadline, False)
+    else:
+        results = [(None, order)] * islands
+        with ProcessPoolExecutor(
+            max_workers=islands, initializer=_init_island, initargs=(arrays,)
+        ) as executor:
+            epoch = 0
+            while time.time() < deadline:
+                # Ring migration: take the neighbour's list when it beats the island's own
+                orders = []
+                for index in range(islands):
+                    own, neighbour = results[index], results[index - 1]
+                    if neighbour[0] is not None and (own[0] is None or neighbour[0] < own[0]):
+                        own = neighbour
+                    orders.append(own[1])
+
+                epoch_end = min(deadline, time.time() + migration_interval)
+                results = list(
+                    executor.map(
+                        _run_island,
+                        orders,
+                        [int(s) + epoch for s in seeds],
+                        [epoch_end] * islands,
+                        [epoch == 0 and index > 0 for index in range(islands)],
+                    )
+                )
+                epoch += 1
+
+        # No island reports when the deadline passed before the first epoch, keep the start list
+        reported = [result for result in results if result[0] is not None]
+        if reported:
+            order = min(reported, key=lambda result: result[0])[1]
+
+    best = ActivityList(*arrays, order)
+    if best.objective()[0] > int((starts + durations).max()):
+        return {f"job_{number}": int(start) for number, start in zip(job_numbers, starts)}
+
+    return {f"job_{number}": int(start) for number, start in zip(job_numbers, best.starts)}
@@ -0,0 +1,76 @@
+from enum import Enum
+
+import numpy as np
+
+from data_parsing import ProjectData
+
+from ..time_windows import compute_time_windows, topological_order
+
+
+class PriorityRule(Enum):
+    """
+    Enum representing the priority rules used to pick the next job in a schedule generation scheme.
+
+    Attributes:
+        LFT (int): Latest finish time first, from the critical path windows.
+        MTS (int): Most total (direct and indirect) successors first.
+        GRPW (int): Greatest rank positional weight first, i.e., the job duration plus
+                    the durations of its immediate successors.
+        RANDOM (int): Uniformly random priorities, drawn again on every pass.
+    """
+
+    LFT = 1
+    MTS = 2
+    GRPW = 3
+    RANDOM = 4
+
+
+def compute_priorities(data: ProjectData, rule: PriorityRule, rng=None) -> np.ndarray:
+    """
+    Computes the priority value of every job for the given rule.
+
+    Lower values mean higher priority, whatever the rule, so the schedule generation schemes
+    can always pick the job with the smallest value.
+
+    Args:
+        data (ProjectData): The project data containing job precedence relations and durations.
+        rule (PriorityRule): The priority rule to apply.
+        rng (np.random.Generator, optional): Random generator used by PriorityRule.RANDOM.
+
+    Returns:
+        np.ndarray: Priority value of each job, indexed by job_number - 1.
+    """
+    durations = {dr.job_number: dr.duration for dr in data.durations_resources}
+    priorities = np.zeros(len(data.precedence_relations), dtype=np.float64)
+
+    match rule:
+        case PriorityRule.LFT:
+            # The deadline only shifts every latest finish by the same amount, so the total
+            # duration is used to keep the windows valid even for a too short horizon
+            windows = compute_time_windows(data, deadline=sum(durations.values()))
+            for number, (_, latest) in windows.items():
+                priorities[number - 1] = latest + durations[number]
+
+        case PriorityRule.MTS:
+            # Successor sets are stored as integer bitsets and merged in reverse topological order
+            reachable = {}
+            successors = {job.job_number: job.successors for job in data.precedence_relations}
+            for number in reversed(topological_order(data)):
+                bits = 0
+                for successor in successors[number]:
+                    bits |= reachable[successor] | (1 << successor)
+                reachable[number] = bits
+                priorities[number - 1] = -bits.bit_count()
+
+        case PriorityRule.GRPW:
+            for job in data.precedence_relations:
+                priorities[job.job_number - 1] = -(
+                    durations[job.job_number]
+                    + sum(durations[successor] for successor in job.successors)
+                )
+
+        case PriorityRule.RANDOM:
+            rng = rng or np.random.default_rng()
+            priorities = rng.random(len(priorities))
+
+    return priorities
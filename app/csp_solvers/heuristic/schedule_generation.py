@@ -0,0 +1,204 @@
+import heapq
+from enum import Enum
+
+import numpy as np
+
+
+class ScheduleScheme(Enum):
+    """
+    Enum representing the available schedule generation schemes (SGS).
+
+    Attributes:
+        SERIAL (int): Jobs are taken one at a time in priority order and started at their
+                      earliest precedence and resource feasible time.
+        PARALLEL (int): Time is advanced from one completion to the next, starting as many
+                        eligible jobs as the free resources allow at each decision point.
+    """
+
+    SERIAL = 1
+    PARALLEL = 2
+
+
+def _selection_order(eligible: list[int], priorities, rng=None) -> list[int]:
+    """
+    Orders the eligible jobs from the highest to the lowest priority.
+
+    Without a random generator the order is deterministic (ties broken by job index). With one,
+    jobs are sampled without replacement with regret based weights, so high priority jobs are
+    likely but not certain to come first.
+
+    Args:
+        eligible (list[int]): Indices of the jobs that can be scheduled.
+        priorities (np.ndarray): Priority value of every job, lower is better.
+        rng (np.random.Generator, optional): Random generator for biased sampling.
+
+    Returns:
+        list[int]: The eligible job indices in selection order.
+    """
+    if rng is None or len(eligible) == 1:
+        return sorted(eligible, key=lambda j: (priorities[j], j))
+
+    values = priorities[eligible]
+    weights = values.max() - values + 1.0
+    return rng.choice(eligible, size=len(eligible), replace=False, p=weights / weights.sum()).tolist()
+
+
+def _earliest_fit(free: np.ndarray, demand: np.ndarray, start: int, duration: int) -> int:
+    """
+    Finds the first time from `start` at which a job fits in the free capacity for its whole duration.
+
+    The profile is scanned in growing chunks, so a job that fits early only looks at a few
+    slots. Within a chunk, window_bad[k] counts the overloaded slots before offset k, and a
+    window of `duration` slots fits when no overloaded slot lies inside it.
+
+    Args:
+        free (np.ndarray): Free capacity array of shape (time, resources).
+        demand (np.ndarray): Demand of the job for each resource.
+        start (int): Earliest precedence feasible start time.
+        duration (int): Duration of the job.
+
+    Returns:
+        int: The earliest resource feasible start time.
+    """
+    if duration == 0 or not demand.any():
+        return start
+
+    # Most jobs fit at their precedence feasible start, check that before scanning
+    window = free[start : start + duration]
+    if len(window) == duration and (window >= demand).all():
+        return start
+
+    chunk = max(4 * duration, 64)
+    while True:
+        overloaded = (free[start : start + chunk] < demand).any(axis=1)
+        window_bad = np.concatenate(([0], np.cumsum(overloaded)))
+        fits = window_bad[duration:] == window_bad[:-duration]
+        if fits.any():
+            return start + int(np.argmax(fits))
+
+        # Resume the scan from the last window that was not fully checked
+        start += len(fits)
+        chunk *= 2
+
+
+def serial_sgs(durations, demands, capacities, successors, priorities, rng=None) -> np.ndarray:
+    """
+    Builds a schedule with the serial schedule generation scheme.
+
+    The free capacity of each resource is kept in a (time, resources) array. The earliest
+    resource feasible start of a job is found with vectorized scans over that array, instead
+    of checking every slot in Python.
+
+    Args:
+        durations (np.ndarray): Duration of each job.
+        demands (np.ndarray): Demand matrix of shape (jobs, resources).
+        capacities (np.ndarray): Available quantity of each resource.
+        successors (list[list[int]]): Successor indices of each job.
+        priorities (np.ndarray): Priority value of every job, lower is better.
+        rng (np.random.Generator, optional): Random generator for biased sampling.
+
+    Returns:
+        np.ndarray: Start time of each job.
+    """
+    n = len(durations)
+    predecessors_left = [0] * n
+    for job_successors in successors:
+        for successor in job_successors:
+            predecessors_left[successor] += 1
+
+    # No job ever needs to start after every other job has finished
+    free = np.tile(capacities, (int(durations.sum()) + 1, 1))
+    earliest = [0] * n
+    starts = np.zeros(n, dtype=np.int64)
+    eligible = [j for j in range(n) if predecessors_left[j] == 0]
+
+    # The deterministic pass keeps the eligible jobs in a heap of (priority, job), so picking
+    # the next job costs O(log n) instead of a scan of every eligible job
+    ranks = priorities.tolist()
+    if rng is None:
+        eligible = [(ranks[j], j) for j in eligible]
+        heapq.heapify(eligible)
+
+    while eligible:
+        if rng is None:
+            _, j = heapq.heappop(eligible)
+        else:
+            j = _selection_order(eligible, priorities, rng)[0]
+            eligible.remove(j)
+
+        duration = int(durations[j])
+        start = _earliest_fit(free, demands[j], earliest[j], duration)
+        free[start : start + duration] -= demands[j]
+
+        starts[j] = start
+        for successor in successors[j]:
+            earliest[successor] = max(earliest[successor], start + duration)
+            predecessors_left[successor] -= 1
+            if predecessors_left[successor] == 0:
+                if rng is None:
+                    heapq.heappush(eligible, (ranks[successor], successor))
+                else:
+                    eligible.append(successor)
+
+    return starts
+
+
+def parallel_sgs(durations, demands, capacities, successors, priorities, rng=None) -> np.ndarray:
+    """
+    Builds a schedule with the parallel schedule generation scheme.
+
+    At every decision time the jobs already running started no later than now, so resource
+    usage can only decrease afterwards. Checking the free capacity at the decision time is
+    therefore enough to start a job for its whole duration.
+
+    Args:
+        durations (np.ndarray): Duration of each job.
+        demands (np.ndarray): Demand matrix of shape (jobs, resources).
+        capacities (np.ndarray): Available quantity of each resource.
+        successors (list[list[int]]): Successor indices of each job.
+        priorities (np.ndarray): Priority value of every job, lower is better.
+        rng (np.random.Generator, optional): Random generator for biased sampling.
+
+    Returns:
+        np.ndarray: Start time of each job.
+    """
+    n = len(durations)
+    predecessors_left = [0] * n
+    for job_successors in successors:
+        for successor in job_successors:
+            predecessors_left[successor] += 1
+
+    free = capacities.copy()
+    starts = np.zeros(n, dtype=np.int64)
+    eligible = [j for j in range(n) if predecessors_left[j] == 0]
+    running = []  # heap of (finish time, job index)
+    time = 0
+
+    while eligible or running:
+        # Release the resources of the jobs finished by now and unlock their successors
+        while running and running[0][0] <= time:
+            _, j = heapq.heappop(running)
+            free += demands[j]
+            for successor in successors[j]:
+                predecessors_left[successor] -= 1
+                if predecessors_left[successor] == 0:
+                    eligible.append(successor)
+
+        if eligible:
+            # Free capacity only shrinks while jobs are started at this time, so a job that
+            # does not fit now is skipped without checking it again
+            order = np.array(_selection_order(eligible, priorities, rng), dtype=np.int64)
+            candidates = order[(demands[order] <= free).all(axis=1)]
+
+            for j in candidates.tolist():
+                if (demands[j] <= free).all():
+                    starts[j] = time
+                    free -= demands[j]
+                    eligible.remove(j)
+                    heapq.heappush(running, (time + int(durations[j]), j))
+
+        # Zero duration jobs finish immediately, otherwise jump to the next completion
+        if running and running[0][0] > time:
+            time = running[0][0]
+
+    return starts
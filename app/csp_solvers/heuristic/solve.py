@@ -0,0 +1,91 @@
+import time
+
+import numpy as np
+
+from data_parsing import ProjectData
+
+from .priority_rules import PriorityRule, compute_priorities
+from .schedule_generation import ScheduleScheme, serial_sgs, parallel_sgs
+
+
+def _instance_arrays(data: ProjectData):
+    """
+    Extracts the arrays used by the schedule generation schemes from the columnar view.
+
+    Args:
+        data (ProjectData): The project data.
+
+    Returns:
+        tuple: Durations, (jobs, resources) demand matrix, capacities and successor rows,
+            all indexed by job_number - 1.
+
+    Raises:
+        ValueError: If a job demands more of a resource than is available.
+    """
+    arrays = data.arrays
+
+    over_capacity = (arrays.demands > arrays.capacities).any(axis=1)
+    if over_capacity.any():
+        job_number = int(arrays.job_numbers[np.argmax(over_capacity)])
+        raise ValueError(f"Job {job_number} demands more than the available resources!")
+
+    return arrays.durations, arrays.demands, arrays.capacities, arrays.successor_lists()
+
+
+def solve(
+    data: ProjectData,
+    scheme: ScheduleScheme = ScheduleScheme.SERIAL,
+    rule: PriorityRule = PriorityRule.LFT,
+    passes: int = 1,
+    seed: int | None = None,
+    time_limit: float | None = None,
+) -> dict:
+    """
+    Builds a schedule with a priority rule based schedule generation scheme.
+
+    The first pass follows the priority rule deterministically. Any further pass samples the job
+    order at random, biased towards the rule (or with fresh random priorities for
+    PriorityRule.RANDOM), and the schedule with the smallest makespan is kept.
+
+    Args:
+        data (ProjectData): The project data.
+        scheme (ScheduleScheme): The schedule generation scheme to use.
+        rule (PriorityRule): The priority rule used to pick the next job.
+        passes (int): Number of schedules to generate.
+        seed (int, optional): Seed for the random generator.
+        time_limit (float, optional): Stop generating schedules after this many seconds (at
+                                      least one schedule is always generated).
+
+    Returns:
+        dict: A dictionary where keys are job names (e.g., "job_1") and values are the
+            corresponding start times.
+    """
+
+    durations, demands, capacities, successors = _instance_arrays(data)
+    generate = serial_sgs if scheme == ScheduleScheme.SERIAL else parallel_sgs
+    rng = np.random.default_rng(seed)
+
+    if rule != PriorityRule.RANDOM:
+        priorities = compute_priorities(data, rule)
+
+    best_starts = None
+    best_makespan = None
+    deadline = None if time_limit is None else time.perf_counter() + time_limit
+
+    for index in range(passes):
+        if index > 0 and deadline is not None and time.perf_counter() > deadline:
+            break
+
+        if rule == PriorityRule.RANDOM:
+            starts = generate(
+                durations, demands, capacities, successors, compute_priorities(data, rule, rng)
+            )
+        else:
+            sampling = rng if index > 0 else None
+            starts = generate(durations, demands, capacities, successors, priorities, sampling)
+
+        makespan = int((starts + durations).max())
+        if best_makespan is None or makespan < best_makespan:
+            best_starts, best_makespan = starts, makespan
+
+    return {f"job_{j + 1}": int(start) for j, start in enumerate(best_starts)}
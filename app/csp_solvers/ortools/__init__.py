@@ -1,2 +1,4 @@
 from .define_problem import define_problem
 from .define_problem import extract_solution
+from .define_multimode_problem import define_multimode_problem, extract_modes
+from .solve import create_solver, solve, find_makespan, ProgressCallback
@@ -0,0 +1,130 @@
+from ortools.sat.python import cp_model
+
+from data_parsing import ProjectData
+
+from ..time_windows import compute_time_windows
+from ..utils import DueDateMode
+from .define_problem import add_objective
+
+
+def define_multimode_problem(
+    data: ProjectData, due_date_mode: DueDateMode = DueDateMode.IGNORE
+):
+    """
+    Defines a multi-mode constraint optimization problem using Google OR-Tools.
+
+    Every job gets one start and one end variable, plus one optional interval per mode. Exactly
+    one mode is chosen per job and only the interval of that mode is present, so its duration
+    links the start and end of the job. Renewable (and doubly constrained) resources are limited
+    at every time unit with cumulative constraints over the optional intervals, nonrenewable (and
+    doubly constrained) resources are limited in total over the chosen modes.
+
+    Args:
+        data (ProjectData): The project data, with every mode of each job in data.modes.
+        due_date_mode (DueDateMode): How the project due date is handled.
+
+    Returns:
+        tuple: A tuple containing:
+            - model (cp_model.CpModel): The constraint programming model.
+            - start_times (dict): A dictionary of start time variables for each job.
+            - mode_choices (dict): A dictionary mapping each job number to a list of
+              (mode number, presence variable) pairs.
+
+    Raises:
+        ValueError: If the due date is enforced but shorter than the critical path.
+    """
+
+    model: cp_model.CpModel = cp_model.CpModel()
+    horizon = data.general_info.horizon
+
+    if due_date_mode == DueDateMode.ENFORCE:
+        horizon = min(horizon, data.projects_summary[0].due_date)
+
+    # The critical path windows stay valid for any mode choice with the shortest durations
+    modes = {job_modes[0].job_number: job_modes for job_modes in data.modes}
+    shortest = {
+        number: min(dr.duration for dr in job_modes) for number, job_modes in modes.items()
+    }
+    windows = compute_time_windows(data, deadline=horizon, durations=shortest)
+
+    start_times = {}
+    end_times = {}
+    mode_choices = {}
+    intervals = []  # (duration resource, optional interval, presence) of every mode
+
+    for job in data.precedence_relations:
+        number = job.job_number
+        earliest, latest = windows[number]
+        start_times[number] = model.NewIntVar(earliest, latest, f"start_job_{number}")
+        end_times[number] = model.NewIntVar(
+            earliest + shortest[number], horizon, f"end_job_{number}"
+        )
+
+        mode_choices[number] = []
+        for dr in modes[number]:
+            presence = model.NewBoolVar(f"mode_{dr.mode}_job_{number}")
+            interval = model.NewOptionalIntervalVar(
+                start_times[number],
+                dr.duration,
+                end_times[number],
+                presence,
+                f"interval_mode_{dr.mode}_job_{number}",
+            )
+            mode_choices[number].append((dr.mode, presence))
+            intervals.append((dr, interval, presence))
+
+        # Each job runs in exactly one mode
+        model.AddExactlyOne(presence for _, presence in mode_choices[number])
+
+    # Add precedence constraints: Ensure each job finishes before its successor starts
+    for job in data.precedence_relations:
+        for successor in job.successors:
+            model.Add(end_times[job.job_number] <= start_times[successor])
+
+    for resource_name, resource_availability in data.resource_availability.items():
+        used = [
+            (interval, presence, dr.resources.get(resource_name, 0))
+            for dr, interval, presence in intervals
+            if dr.resources.get(resource_name, 0) > 0
+        ]
+        if not used:
+            continue
+
+        # Per time unit limit over the intervals of the chosen modes
+        if resource_availability.kind != "nonrenewable":
+            model.AddCumulative(
+                intervals=[interval for interval, _, _ in used],
+                demands=[demand for _, _, demand in used],
+                capacity=resource_availability.quantity,
+            )
+
+        # Budget over the whole project for the chosen modes
+        if resource_availability.kind != "renewable":
+            model.Add(
+                sum(demand * presence for _, presence, demand in used)
+                <= resource_availability.quantity
+            )
+
+    add_objective(model, data, end_times, horizon, due_date_mode)
+
+    return model, start_times, mode_choices
+
+
+def extract_modes(solver, mode_choices) -> dict:
+    """
+    Extracts the mode chosen for each job from the solver.
+
+    Args:
+        solver (cp_model.CpSolver): The solver used to solve the constraint programming model.
+        mode_choices (dict): A dictionary mapping each job number to a list of
+                             (mode number, presence variable) pairs.
+
+    Returns:
+        dict: A dictionary where keys are job names (e.g., "job_1") and values are the
+            chosen mode numbers.
+    """
+
+    return {
+        f"job_{number}": next(mode for mode, presence in choices if solver.Value(presence))
+        for number, choices in mode_choices.items()
+    }
@@ -2,8 +2,17 @@ from ortools.sat.python import cp_model
 
 from data_parsing import ProjectData
 
+from ..time_windows import compute_time_windows
+from ..utils import DueDateMode, compute_makespan
+from .redundant_constraints import add_redundant_constraints
 
-def define_problem(data: ProjectData):
+
+def define_problem(
+    data: ProjectData,
+    due_date_mode: DueDateMode = DueDateMode.IGNORE,
+    hint: dict | None = None,
+    strengthen: bool = False,
+):
     """
     Defines a constraint optimization problem using Google OR-Tools.
 
@@ -12,18 +21,60 @@ def define_problem(data: ProjectData):
     starts) and resource constraints (i.e., resource availability is respected) are added to the model.
     The objective is to minimize the makespan, which is the time required to complete all jobs.
 
+    The project due date can be enforced as a hard deadline, or penalized: the objective then
+    becomes the weighted tardiness (tardiness_cost per time unit past the due date), with the
+    makespan as a tie-breaker.
+
+    A feasible schedule (e.g., from the heuristic solver or a previous run) can be given as a hint
+    to warm-start the search. Its makespan also becomes the deadline of every job, since the
+    solver never needs to look for anything worse.
+
     Args:
         data (ProjectData): The project data containing job precedence relations, durations,
                             resource availability, and other information.
+        due_date_mode (DueDateMode): How the project due date is handled.
+        hint (dict, optional): A feasible schedule where keys are job names (e.g., "job_1") and
+                               values are start times.
+        strengthen (bool): Add redundant constraints that do not change the optimum but help
+                           the solver prove it (see add_redundant_constraints).
 
     Returns:
         tuple: A tuple containing:
             - model (cp_model.CpModel): The constraint programming model.
             - start_times (dict): A dictionary of start time variables for each job.
+
+    Raises:
+        ValueError: If the due date is enforced but shorter than the critical path, or the jobs
+                    consume more of a nonrenewable resource than its budget.
     """
 
     model: cp_model.CpModel = cp_model.CpModel()
     horizon = data.general_info.horizon
+    summary = data.projects_summary[0]
+
+    # Enforcing the due date turns it into the deadline of every job, so instances whose
+    # critical path is already late are rejected before the solver starts
+    if due_date_mode == DueDateMode.ENFORCE:
+        horizon = min(horizon, summary.due_date)
+
+    # A feasible schedule bounds the makespan of every better schedule
+    if hint:
+        horizon = min(horizon, compute_makespan(hint, data))
+
+    # Critical path windows give tighter bounds than [0, horizon] for every job
+    windows = compute_time_windows(data, deadline=horizon)
+
+    # With a single mode per job the consumption of a nonrenewable (or doubly constrained)
+    # resource does not depend on the schedule, so its budget is checked before the search
+    for resource_name, resource_availability in data.resource_availability.items():
+        if resource_availability.kind == "renewable":
+            continue
+        consumption = sum(dr.resources.get(resource_name, 0) for dr in data.durations_resources)
+        if consumption > resource_availability.quantity:
+            raise ValueError(
+                f"The jobs consume {consumption} of the nonrenewable resource {resource_name}, "
+                f"more than its budget of {resource_availability.quantity}!"
+            )
 
     # Define variables for start times
     start_times = {}
@@ -32,12 +83,13 @@ def define_problem(data: ProjectData):
 
     # Create variables and intervals for each job
     for job in data.precedence_relations:
+        earliest, latest = windows[job.job_number]
         start_times[job.job_number] = model.NewIntVar(
-            0, horizon, f"start_job_{job.job_number}"
+            earliest, latest, f"start_job_{job.job_number}"
         )
         duration = data.durations_resources[job.job_number - 1].duration
         end_times[job.job_number] = model.NewIntVar(
-            0, horizon, f"end_job_{job.job_number}"
+            earliest + duration, latest + duration, f"end_job_{job.job_number}"
         )
         intervals[job.job_number] = model.NewIntervalVar(
             start_times[job.job_number],
@@ -47,6 +99,11 @@ def define_problem(data: ProjectData):
         )
         model.Add(end_times[job.job_number] == start_times[job.job_number] + duration)
 
+        if hint:
+            hint_start = hint[f"job_{job.job_number}"]
+            model.AddHint(start_times[job.job_number], hint_start)
+            model.AddHint(end_times[job.job_number], hint_start + duration)
+
     # Add precedence constraints: Ensure each job finishes before its successor starts
     for job in data.precedence_relations:
         for successor in job.successors:
@@ -54,6 +111,10 @@ def define_problem(data: ProjectData):
 
     # Add resource constraints: Ensure resource usage does not exceed availability
     for resource_name, resource_availability in data.resource_availability.items():
+        # Nonrenewable resources are a budget for the whole project, checked above
+        if resource_availability.kind == "nonrenewable":
+            continue
+
         tasks = []
         demands = []
 
@@ -71,17 +132,57 @@ def define_problem(data: ProjectData):
                 capacity=resource_availability.quantity,
             )
 
-    # Define makespan variable and constrain it to be the maximum end time of all jobs
-    makespan = model.NewIntVar(0, horizon, "makespan")
-    for job in data.precedence_relations:
-        model.Add(makespan >= end_times[job.job_number])
+    makespan = add_objective(model, data, end_times, horizon, due_date_mode)
 
-    # Set the objective to minimize makespan
-    model.Minimize(makespan)
+    if strengthen:
+        add_redundant_constraints(model, data, start_times, intervals, makespan)
 
     return model, start_times
 
 
+def add_objective(
+    model: cp_model.CpModel,
+    data: ProjectData,
+    end_times: dict,
+    horizon: int,
+    due_date_mode: DueDateMode,
+):
+    """
+    Adds the makespan variable and the objective (makespan or weighted tardiness) to a model.
+
+    Args:
+        model (cp_model.CpModel): The constraint programming model.
+        data (ProjectData): The project data (used here for sink jobs and the project summary).
+        end_times (dict): A dictionary of end time variables for each job.
+        horizon (int): Upper bound of every end time.
+        due_date_mode (DueDateMode): How the project due date is handled.
+
+    Returns:
+        cp_model.IntVar: The makespan variable.
+    """
+    summary = data.projects_summary[0]
+
+    # Define makespan variable and constrain it to be the maximum end time of the sink jobs,
+    # every other job finishes before one of them
+    sink_jobs = [job.job_number for job in data.precedence_relations if not job.successors]
+    makespan = model.NewIntVar(0, horizon, "makespan")
+    for job_number in sink_jobs:
+        model.Add(makespan >= end_times[job_number])
+
+    if due_date_mode == DueDateMode.PENALIZE:
+        # Tardiness is the time the project finishes past its due date
+        tardiness = model.NewIntVar(0, horizon, "tardiness")
+        model.Add(tardiness >= makespan - summary.due_date)
+
+        # Minimize the weighted tardiness first, then the makespan
+        model.Minimize(summary.tardiness_cost * (horizon + 1) * tardiness + makespan)
+    else:
+        # Set the objective to minimize makespan
+        model.Minimize(makespan)
+
+    return makespan
+
+
 def extract_solution(solver, start_times, data: ProjectData):
     """
     Extracts the solution for job start times from the solver.
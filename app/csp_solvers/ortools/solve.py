@@ -0,0 +1,141 @@
+import logging
+import os
+
+from ortools.sat.python import cp_model
+
+from data_parsing import ProjectData
+
+from .define_problem import extract_solution
+
+
+class ProgressCallback(cp_model.CpSolverSolutionCallback):
+    """
+    Solution callback that records every improving makespan found during the search.
+
+    CP-SAT only reports solutions that improve the objective, so each call is logged with
+    the wall time elapsed since the solve started. An optional function can be given to
+    stream the values elsewhere (e.g., a progress bar or a monitoring system).
+
+    Attributes:
+        progress (list[tuple[float, int]]): (wall time in seconds, makespan) of each solution.
+        schedule (dict): Start times ("job_N" keys) of the last solution, only kept when the
+                         start time variables are given.
+    """
+
+    def __init__(self, makespan: cp_model.IntVar, on_improvement=None, start_times=None):
+        """
+        Args:
+            makespan (cp_model.IntVar): The makespan variable of the model.
+            on_improvement (callable, optional): Called as on_improvement(wall_time, makespan)
+                                                 for every improving solution.
+            start_times (dict, optional): Start time variables of each job, to keep the
+                                          schedule of every solution in `schedule`.
+        """
+        super().__init__()
+        self._makespan = makespan
+        self._on_improvement = on_improvement
+        self._start_times = start_times
+        self.progress: list[tuple[float, int]] = []
+        self.schedule: dict = {}
+
+    def on_solution_callback(self):
+        makespan = self.Value(self._makespan)
+        wall_time = self.WallTime()
+
+        if self._start_times is not None:
+            self.schedule = {
+                f"job_{job_number}": self.Value(var)
+                for job_number, var in self._start_times.items()
+            }
+
+        self.progress.append((wall_time, makespan))
+        logging.info(f" [{wall_time:.4f}s] Improved makespan: {makespan}")
+
+        if self._on_improvement:
+            self._on_improvement(wall_time, makespan)
+
+
+def find_makespan(model: cp_model.CpModel) -> cp_model.IntVar:
+    """
+    Finds the variable named "makespan" that define_problem adds to every model.
+
+    Args:
+        model (cp_model.CpModel): The constraint programming model.
+
+    Returns:
+        cp_model.IntVar: The makespan variable.
+    """
+    for index, variable in enumerate(model.Proto().variables):
+        if variable.name == "makespan":
+            return model.GetIntVarFromProtoIndex(index)
+
+    raise ValueError("The model has no makespan variable!")
+
+
+def create_solver(
+    num_search_workers: int = 0,
+    max_time: float | None = None,
+    relative_gap: float | None = None,
+) -> cp_model.CpSolver:
+    """
+    Creates a CP-SAT solver with the given search parameters.
+
+    Args:
+        num_search_workers (int): Number of parallel search workers. 0 uses every available core.
+        max_time (float, optional): Maximum wall time in seconds. The best solution found so far
+                                    is returned when it is reached.
+        relative_gap (float, optional): Stop as soon as the gap between the best solution and the
+                                        best bound is below this fraction (e.g., 0.05 for 5%).
+
+    Returns:
+        cp_model.CpSolver: The configured solver.
+    """
+
+    solver = cp_model.CpSolver()
+    solver.parameters.num_workers = num_search_workers or os.cpu_count() or 1
+
+    if max_time is not None:
+        solver.parameters.max_time_in_seconds = max_time
+
+    if relative_gap is not None:
+        solver.parameters.relative_gap_limit = relative_gap
+
+    return solver
+
+
+def solve(
+    model: cp_model.CpModel,
+    start_times,
+    data: ProjectData,
+    solver: cp_model.CpSolver = None,
+    on_improvement=None,
+):
+    """
+    Solves a model built by define_problem and extracts the best schedule found.
+
+    Args:
+        model (cp_model.CpModel): The constraint programming model.
+        start_times (dict): A dictionary of start time variables for each job.
+        data (ProjectData): The project data.
+        solver (cp_model.CpSolver, optional): A solver from create_solver. Defaults to a solver
+                                              using every core and no limits.
+        on_improvement (callable, optional): Called as on_improvement(wall_time, makespan)
+                                             for every improving solution.
+
+    Returns:
+        tuple: A tuple containing:
+            - status (int): The CP-SAT status (e.g., cp_model.OPTIMAL or cp_model.FEASIBLE).
+            - solution (dict): The best schedule found, empty if none was found.
+            - progress (list[tuple[float, int]]): (wall time, makespan) of each improving solution.
+    """
+
+    solver = solver or create_solver()
+    callback = ProgressCallback(find_makespan(model), on_improvement)
+
+    status = solver.Solve(model, callback)
+
+    solution = {}
+    if status in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+        solution = extract_solution(solver, start_times, data)
+
+    return status, solution, callback.progress
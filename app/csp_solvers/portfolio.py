@@ -0,0 +1,242 @@
+import logging
+import multiprocessing
+import os
+import queue
+import time
+
+from data_parsing import ProjectData
+
+from .time_windows import compute_time_windows
+from .utils import DueDateMode, compute_makespan
+
+# Backends raced by default, the heuristic ones only run on single mode projects
+BACKENDS = ("PYTHON_CONSTRAINT", "OR_TOOLS", "HEURISTIC", "LOCAL_SEARCH")
+
+# Seconds between checks for backend processes that died without a final message
+POLL_INTERVAL = 0.5
+
+
+def _run_backend(
+    name: str,
+    data: ProjectData,
+    due_date_mode: DueDateMode,
+    deadline: float,
+    workers: int,
+    results: multiprocessing.Queue,
+):
+    """
+    Runs one backend in a worker process, posting (name, status, solution, makespan, final)
+    messages.
+
+    Anytime backends post every improving schedule as it is found, so the best one so far is
+    known even if the process is cancelled. The last message of a backend has final=True.
+    The deadline is a wall clock time (time.time()), shared by every process.
+    """
+    try:
+        match name:
+            case "PYTHON_CONSTRAINT":
+                from csp_solvers import python_constraint
+
+                problem = python_constraint.define_problem(data, due_date_mode)
+                solution = problem.getSolution() or {}
+                results.put(
+                    (
+                        name,
+                        "FEASIBLE" if solution else "INFEASIBLE",
+                        solution,
+                        compute_makespan(solution, data) if solution else None,
+                        True,
+                    )
+                )
+
+            case "OR_TOOLS":
+                from csp_solvers import ortools
+
+                if data.is_multimode:
+                    model, start_times, _ = ortools.define_multimode_problem(data, due_date_mode)
+                else:
+                    model, start_times = ortools.define_problem(data, due_date_mode)
+                solver = ortools.create_solver(workers, max(deadline - time.time(), 0.01))
+
+                callback = ortools.ProgressCallback(
+                    ortools.find_makespan(model),
+                    lambda wall_time, makespan: results.put(
+                        (name, "FEASIBLE", callback.schedule, makespan, False)
+                    ),
+                    start_times,
+                )
+                status = solver.Solve(model, callback)
+                makespan = callback.progress[-1][1] if callback.progress else None
+                results.put((name, solver.StatusName(status), callback.schedule, makespan, True))
+
+            case "HEURISTIC":
+                from csp_solvers import heuristic
+
+                solution = heuristic.solve(
+                    data, passes=100, time_limit=max(deadline - time.time(), 0)
+                )
+                results.put((name, "FEASIBLE", solution, compute_makespan(solution, data), True))
+
+            case "LOCAL_SEARCH":
+                from csp_solvers import heuristic
+
+                solution = heuristic.solve(data)
+                results.put((name, "FEASIBLE", solution, compute_makespan(solution, data), False))
+                solution = heuristic.improve(
+                    data, solution, max(deadline - time.time(), 0), islands=1
+                )
+                results.put((name, "FEASIBLE", solution, compute_makespan(solution, data), True))
+
+    except ValueError as error:
+        results.put((name, f"ERROR: {error}", {}, None, True))
+    except Exception as error:
+        # Any other failure (e.g., MemoryError on a large instance) still ends the backend with
+        # a final message, so the race does not wait for it until the deadline
+        results.put((name, f"ERROR: {type(error).__name__}: {error}", {}, None, True))
+
+
+def lower_bound(data: ProjectData) -> int:
+    """
+    Critical path length of the project, a makespan no schedule can beat.
+
+    Returns 0 (no bound) when the windows cannot be computed, e.g., for a cyclic network. The
+    backends then report the error themselves.
+    """
+    try:
+        windows = compute_time_windows(data)
+    except ValueError:
+        return 0
+    return max(
+        windows[dr.job_number][0] + dr.duration for dr in data.durations_resources
+    )
+
+
+def solve(
+    data: ProjectData,
+    time_limit: float = 60.0,
+    due_date_mode: DueDateMode = DueDateMode.IGNORE,
+    backends: tuple[str, ...] = BACKENDS,
+) -> tuple[str, dict, str | None, dict]:
+    """
+    Races several backends in separate processes and keeps the best schedule.
+
+    Every backend starts at once with the same deadline. As soon as one proves optimality (an
+    OPTIMAL status from OR-Tools, or a makespan equal to the critical path lower bound), the
+    others are cancelled. Otherwise the schedule with the smallest makespan found by the
+    deadline is returned. An exact backend that exhausts its search only proves that no
+    schedule fits its horizon, so the others keep running, and the result is INFEASIBLE only
+    if no backend found a schedule. Multi-mode projects are only solved by OR-Tools.
+
+    Args:
+        data (ProjectData): The project data.
+        time_limit (float): Seconds until every backend is cancelled.
+        due_date_mode (DueDateMode): How the project due date is handled. Under ENFORCE,
+                                     schedules from backends that ignore the due date are
+                                     only kept if they meet it.
+        backends (tuple[str, ...]): Names of the backends to race (see BACKENDS).
+
+    Returns:
+        tuple: A tuple containing:
+            - status (str): OPTIMAL, FEASIBLE, INFEASIBLE if no schedule was found and an exact
+                            backend exhausted its search, or UNKNOWN.
+            - solution (dict): The best schedule found, empty if none was found.
+            - winner (str): Backend that found the returned schedule (or proved infeasibility),
+                            None if no backend produced a result.
+            - results (dict): Per backend {"status", "makespan", "time"}, with the time in
+                              seconds of its best schedule. Cancelled backends have the
+                              status CANCELLED.
+    """
+    start_time = time.perf_counter()
+    deadline = start_time + time_limit
+
+    if data.is_multimode:
+        backends = tuple(name for name in backends if name == "OR_TOOLS")
+
+    bound = None if data.is_multimode else lower_bound(data)
+    due_date = data.projects_summary[0].due_date if data.projects_summary else None
+
+    # Leave the anytime backends time to post their final schedule before the deadline
+    backend_deadline = time.time() + time_limit - min(1.0, max(0.1, 0.05 * time_limit))
+    workers = max(1, (os.cpu_count() or 1) - len(backends) + 1)
+
+    messages = multiprocessing.Queue()
+    processes = {
+        name: multiprocessing.Process(
+            target=_run_backend,
+            args=(name, data, due_date_mode, backend_deadline, workers, messages),
+            daemon=True,
+        )
+        for name in backends
+    }
+    for process in processes.values():
+        process.start()
+
+    results = {name: {"status": "UNKNOWN", "makespan": None, "time": None} for name in backends}
+    status, best, best_makespan, winner = "UNKNOWN", {}, None, None
+    finished = set()
+
+    try:
+        while len(finished) < len(backends):
+            # The queue is polled, so a backend process that died without its final message
+            # (e.g., killed by the system) is noticed before the deadline
+            try:
+                name, backend_status, solution, makespan, final = messages.get(
+                    timeout=min(max(deadline - time.perf_counter(), 0), POLL_INTERVAL)
+                )
+            except queue.Empty:
+                if time.perf_counter() >= deadline:
+                    break
+                for name, process in processes.items():
+                    if name not in finished and not process.is_alive():
+                        results[name]["status"] = f"ERROR: exit code {process.exitcode}"
+                        finished.add(name)
+                continue
+
+            elapsed = round(time.perf_counter() - start_time, 6)
+            results[name]["status"] = backend_status
+            if final:
+                finished.add(name)
+
+            # An exhausted exact search only rules out the schedules within its horizon, the
+            # other backends keep searching
+            if backend_status == "INFEASIBLE" and name in ("OR_TOOLS", "PYTHON_CONSTRAINT"):
+                if best_makespan is None:
+                    status, winner = "INFEASIBLE", name
+                continue
+
+            if not solution:
+                continue
+
+            if (
+                due_date_mode == DueDateMode.ENFORCE
+                and name in ("HEURISTIC", "LOCAL_SEARCH")
+                and due_date is not None
+                and makespan > due_date
+            ):
+                continue
+
+            if results[name]["makespan"] is None or makespan < results[name]["makespan"]:
+                results[name].update(makespan=makespan, time=elapsed)
+
+            if best_makespan is None or makespan < best_makespan:
+                status, best, best_makespan, winner = "FEASIBLE", solution, makespan, name
+                logging.info(f" [{elapsed:.4f}s] {name} improved makespan: {makespan}")
+
+            if (name == "OR_TOOLS" and backend_status == "OPTIMAL") or makespan == bound:
+                status, best, best_makespan, winner = "OPTIMAL", solution, makespan, name
+                break
+
+    finally:
+        # Cancel the backends still running
+        for process in processes.values():
+            if process.is_alive():
+                process.terminate()
+        for process in processes.values():
+            process.join(1.0)
+        messages.close()
+
+    # Backends stopped before their final message keep the best schedule they posted
+    for name in set(backends) - finished:
+        results[name]["status"] = "CANCELLED"
+
+    return status, best, winner, results
@@ -1 +1,4 @@
 from .define_problem import define_problem
+from .ordered_solver import OrderedBacktrackingSolver
+from .precedence_constraint import PrecedenceConstraint
+from .resource_constraint import ResourceConstraint
@@ -1,11 +1,17 @@
 from constraint import Problem
 from data_parsing import ProjectData
 
-from .successor_constraint import successor_constraint
-from .resource_constraint import resource_constraint
+from ..time_windows import compute_time_windows, topological_order
+from ..utils import DueDateMode
+from .ordered_solver import OrderedBacktrackingSolver
+from .precedence_constraint import PrecedenceConstraint
+from .resource_constraint import ResourceConstraint
+from .due_data_constraint import DueDateConstraint
 
 
-def define_problem(data: ProjectData) -> Problem:
+def define_problem(
+    data: ProjectData, due_date_mode: DueDateMode = DueDateMode.IGNORE
+) -> Problem:
     """
     Defines the constraint satisfaction problem (CSP) for scheduling jobs with precedence
     and resource constraints.
@@ -13,46 +19,68 @@ def define_problem(data: ProjectData) -> Problem:
     Args:
         data (ProjectData): The project data containing job precedence relations,
                             durations, and resource information.
+        due_date_mode (DueDateMode): How the project due date is handled. Only IGNORE and
+                                     ENFORCE are supported, since a CSP has no objective.
 
     Returns:
-        Problem: The defined CSP with variables, constraints, and domains.
+        Problem: The defined CSP with variables, constraints, and domains. It is solved by an
+                 OrderedBacktrackingSolver that assigns the jobs in topological order with
+                 forward checking.
+
+    Raises:
+        ValueError: If the due date is penalized, or enforced but shorter than the
+                    critical path.
     """
 
-    # Define the domain for the job start times, ranging from 0 to horizon (e.g., 20 days)
-    domain = range(data.general_info.horizon)
+    if due_date_mode == DueDateMode.PENALIZE:
+        raise ValueError("python-constraint cannot penalize the due date, use ENFORCE!")
+
+    # Enforcing the due date makes it the deadline of the critical path windows, which
+    # rejects instances whose critical path is already late before any search
+    deadline = None
+    if due_date_mode == DueDateMode.ENFORCE:
+        deadline = data.projects_summary[0].due_date
+
+    # Restrict each job to its critical path window inside the horizon instead of
+    # the full range(horizon), so the search never tries start times that break precedence
+    windows = compute_time_windows(data, deadline=deadline)
 
     # Create a list of job start time variables (e.g., "job_1", "job_2", ...)
     start_times = [f"job_{job.job_number}" for job in data.precedence_relations]
 
-    problem = Problem()
+    # Assign the jobs by latest start (the LST priority rule), which is a topological order
+    # since a job starts at least its duration before any successor; ties follow the precedences
+    rank = {number: index for index, number in enumerate(topological_order(data))}
+    order = sorted(rank, key=lambda number: (windows[number][1], windows[number][0], rank[number]))
+
+    problem = Problem(OrderedBacktrackingSolver([f"job_{number}" for number in order]))
 
-    # Define variables for each job, and the domain are the available time on the horizon
+    # Define variables for each job, and the domain is the critical path window of the job
     for job in data.precedence_relations:
         number = job.job_number
         var_name = f"job_{number}"
 
         # Add the job variable with its possible start times (domain)
-        problem.addVariable(var_name, domain)
+        earliest, latest = windows[number]
+        problem.addVariable(var_name, range(earliest, latest + 1))
 
-        # Add precedence constraints between jobs and their successors
-        for successor in job.successors:
-            # Get the duration for the current job from the durations/resources data
-            duration = data.durations_resources[number - 1].duration
+        # Get the duration for the current job from the durations/resources data
+        duration = data.durations_resources[number - 1].duration
 
-            # Add a constraint to ensure that a job starts before its successor with a gap
+        # Add precedence constraints between jobs and their successors, each one hides the
+        # start times of one job that the start time of the other makes infeasible
+        for successor in job.successors:
             problem.addConstraint(
-                lambda start_j, start_s, duration=duration: successor_constraint(
-                    start_j, start_s, duration
-                ),
-                (f"job_{number}", f"job_{successor}"),
+                PrecedenceConstraint(duration), (f"job_{number}", f"job_{successor}")
             )
 
-    # Add a resource constraint to ensure that resources are not overbooked
-    problem.addConstraint(
-        lambda *start_times: resource_constraint(
-            *start_times, time_slots=domain, project_data=data
-        ),
-        start_times,
-    )
+    # Add a resource constraint to ensure that resources are not overbooked,
+    # checked on every partial assignment and pruning the start times that would overbook them
+    problem.addConstraint(ResourceConstraint(data), start_times)
+
+    # Add a due date constraint on the sink jobs when the due date is enforced
+    if due_date_mode == DueDateMode.ENFORCE:
+        due_date = DueDateConstraint(data)
+        problem.addConstraint(due_date, list(due_date.sink_durations))
 
     return problem
@@ -1,47 +1,53 @@
+from constraint import Constraint
+
 from data_parsing import ProjectData
 
 
-def due_date_constraint(*start_times, project_data: ProjectData):
+class DueDateConstraint(Constraint):
     """
     Ensures that the latest completion time of sink jobs (jobs with no successors)
     does not exceed the project's due date.
 
-    Args:
-        *start_times (int): The start times of all jobs.
-        project_data (ProjectData): The project data containing job durations, precedence relations,
-                                    and project due date.
-
-    Returns:
-        bool: True if the latest completion time of sink jobs is less than or equal to the due date,
-            otherwise False.
+    The sink jobs, their durations and the due date are extracted once when the
+    constraint is created. Each call only checks the sink jobs assigned so far, so a
+    late sink job is rejected as soon as it gets a start time.
 
-    Raises:
-        ValueError: If no sink jobs are found in the project data.
+    Attributes:
+        due_date (int): The project's due date.
+        sink_durations (dict[str, int]): A dictionary mapping the variable name of each
+                                         sink job (e.g., "job_8") to its duration.
     """
-    # Extract durations of all jobs
-    durations = [dr.duration for dr in project_data.durations_resources]
-
-    # Get the project's due date
-    due_date = project_data.projects_summary[0].due_date
-
-    # Identify all sink jobs (jobs with no successors)
-    sink_jobs = []
-    for i, job in enumerate(project_data.precedence_relations):
-        if not job.successors:
-            sink_jobs.append(i)
-
-    # If no sink jobs are found, raise an error
-    if not sink_jobs:
-        raise ValueError("No sink jobs found in precedence relations!")
-
-    # Compute the completion times of all sink jobs and track the latest completion time
-    latest_completion_time = 0
-    for sink_job_index in sink_jobs:
-        sink_job_start_time = start_times[sink_job_index]
-        sink_job_duration = durations[sink_job_index]
-        sink_job_completion_time = sink_job_start_time + sink_job_duration
-
-        latest_completion_time = max(latest_completion_time, sink_job_completion_time)
 
-    # Ensure the latest completion time respects the due date
-    return latest_completion_time <= due_date
+    def __init__(self, project_data: ProjectData):
+        """
+        Args:
+            project_data (ProjectData): The project data containing job durations, precedence
+                                        relations, and project due date.
+
+        Raises:
+            ValueError: If no sink jobs are found in the project data.
+        """
+        # Get the project's due date
+        self.due_date = project_data.projects_summary[0].due_date
+
+        # Identify all sink jobs (jobs with no successors) together with their durations
+        self.sink_durations = {
+            f"job_{job.job_number}": project_data.durations_resources[
+                job.job_number - 1
+            ].duration
+            for job in project_data.precedence_relations
+            if not job.successors
+        }
+
+        # If no sink jobs are found, raise an error
+        if not self.sink_durations:
+            raise ValueError("No sink jobs found in precedence relations!")
+
+    def __call__(self, variables, domains, assignments, forwardcheck=False):
+        # Ensure every assigned sink job completes by the due date
+        for variable, duration in self.sink_durations.items():
+            start_time = assignments.get(variable)
+            if start_time is not None and start_time + duration > self.due_date:
+                return False
+
+        return True
@@ -0,0 +1,80 @@
+from constraint import BacktrackingSolver
+
+
+class OrderedBacktrackingSolver(BacktrackingSolver):
+    """
+    Backtracking solver that assigns the variables in a fixed order, smallest value first.
+
+    The default python-constraint solver picks the next variable by degree and domain size,
+    which jumps around the precedence graph. Assigning the jobs in a topological order instead
+    means every predecessor of a job already has a start time, so the precedence and resource
+    constraints have pruned its domain to the start times that fit the partial schedule, and
+    the search behaves like a serial schedule generation scheme with backtracking.
+
+    Attributes:
+        order (list): The variables in assignment order. Variables of the problem missing from it
+                      are assigned last.
+    """
+
+    def __init__(self, order, forwardcheck=True):
+        super().__init__(forwardcheck)
+        self.order = list(order)
+
+    def getSolutionIter(self, domains, constraints, vconstraints):
+        listed = set(self.order)
+        order = [variable for variable in self.order if variable in domains]
+        order += [variable for variable in domains if variable not in listed]
+
+        if not order:
+            yield {}
+            return
+
+        assignments = {}
+
+        # One level per assigned variable: the variable, its untried values (largest first, so
+        # pop() returns the smallest) and the domains of the later variables it may prune
+        def level(depth):
+            variable = order[depth]
+            pushdomains = (
+                [domains[later] for later in order[depth + 1 :]] if self._forwardcheck else None
+            )
+            return variable, sorted(domains[variable], reverse=True), pushdomains
+
+        stack = [level(0)]
+
+        while stack:
+            variable, values, pushdomains = stack[-1]
+
+            # Returning to this level, undo its previous value
+            if variable in assignments:
+                del assignments[variable]
+                if pushdomains:
+                    for domain in pushdomains:
+                        domain.popState()
+
+            while values:
+                assignments[variable] = values.pop()
+
+                if pushdomains:
+                    for domain in pushdomains:
+                        domain.pushState()
+
+                for constraint, variables in vconstraints[variable]:
+                    if not constraint(variables, domains, assignments, pushdomains):
+                        break
+                else:
+                    break
+
+                if pushdomains:
+                    for domain in pushdomains:
+                        domain.popState()
+                del assignments[variable]
+            else:
+                # No value left, go back to the previous variable
+                stack.pop()
+                continue
+
+            if len(stack) == len(order):
+                yield assignments.copy()
+            else:
+                stack.append(level(len(stack)))
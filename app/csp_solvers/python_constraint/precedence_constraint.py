@@ -0,0 +1,52 @@
+from constraint import Constraint
+
+from .successor_constraint import successor_constraint
+
+
+class PrecedenceConstraint(Constraint):
+    """
+    Ensures that a job finishes before its successor starts.
+
+    Replaces a lambda over `successor_constraint` with bounds propagation: as soon as one of the
+    two jobs has a start time, the values of the other one that cannot satisfy the precedence are
+    hidden from its domain, so the search never branches on them.
+
+    Attributes:
+        duration (int): Duration of the predecessor job.
+    """
+
+    def __init__(self, duration: int):
+        self.duration = duration
+
+    def __call__(self, variables, domains, assignments, forwardcheck=False):
+        job, successor = variables
+        start_job = assignments.get(job)
+        start_successor = assignments.get(successor)
+
+        if start_job is not None and start_successor is not None:
+            return successor_constraint(start_job, start_successor, self.duration)
+
+        if forwardcheck:
+            # The successor cannot start before the job finishes
+            if start_job is not None:
+                domain = domains[successor]
+                bound = start_job + self.duration
+                for value in domain[:]:
+                    if value < bound:
+                        domain.hideValue(value)
+
+            # The job must finish by the time the successor starts
+            elif start_successor is not None:
+                domain = domains[job]
+                bound = start_successor - self.duration
+                for value in domain[:]:
+                    if value > bound:
+                        domain.hideValue(value)
+
+            else:
+                return True
+
+            if not domain:
+                return False
+
+        return True
@@ -1,3 +1,6 @@
+import numpy as np
+from constraint import Constraint
+
 from data_parsing import ProjectData
 
 
@@ -42,3 +45,125 @@ def resource_constraint(*start_times, time_slots, project_data: ProjectData):
 
     # If all checks pass, return True indicating no resource constraints are violated
     return True
+
+
+class ResourceConstraint(Constraint):
+    """
+    Resource constraint that checks partial assignments against precomputed arrays.
+
+    The job x resource demand matrix, the duration vector and the capacity vector come
+    from the columnar view of the project data. Every call only looks at the jobs assigned so far,
+    so an overloaded partial schedule is rejected as soon as it appears instead of
+    after every job has a start time. With forward checking, the start times of the unassigned
+    jobs that would overload a resource next to the assigned ones are hidden from their domains.
+
+    Attributes:
+        durations (np.ndarray): Duration of each job, indexed by job_number - 1.
+        demands (np.ndarray): Demand matrix of shape (jobs, resources).
+        capacities (np.ndarray): Available quantity of each resource.
+    """
+
+    def __init__(self, project_data: ProjectData):
+        arrays = project_data.arrays
+        self.durations = arrays.durations
+        self.demands = arrays.demands
+        self.capacities = arrays.capacities
+
+        # Map each CSP variable name to its row in the arrays
+        self._rows = {
+            f"job_{number}": row for row, number in enumerate(arrays.job_numbers.tolist())
+        }
+
+    def __call__(self, variables, domains, assignments, forwardcheck=False):
+        rows = []
+        starts = []
+        pending = []
+        for variable in variables:
+            if variable in assignments:
+                rows.append(self._rows[variable])
+                starts.append(assignments[variable])
+            elif forwardcheck:
+                pending.append((self._rows[variable], domains[variable]))
+
+        if not pending:
+            return self.fits(rows, starts)
+
+        return self.prune(rows, starts, pending)
+
+    def fits(self, rows, starts):
+        """
+        Checks whether the given jobs can run at the given start times without overload.
+
+        The resource profile only rises when a job starts, so the peak usage is reached at
+        one of the assigned start times. Usage is evaluated at those points only, which keeps
+        the check independent of the horizon length.
+
+        Args:
+            rows (list[int]): Array rows of the assigned jobs.
+            starts (list[int]): Start times of the assigned jobs, in the same order.
+
+        Returns:
+            bool: True if no resource exceeds its capacity, False otherwise.
+        """
+        starts = np.asarray(starts, dtype=np.int64)
+        ends = starts + self.durations[rows]
+
+        # active[i, j] is True when job j is running at the start time of job i
+        active = (starts[None, :] <= starts[:, None]) & (starts[:, None] < ends[None, :])
+        usage = active.astype(np.int64) @ self.demands[rows]
+
+        return not (usage > self.capacities).any()
+
+    def prune(self, rows, starts, pending):
+        """
+        Checks the assigned jobs and hides the start times of the pending jobs that no longer fit.
+
+        The usage profile of the assigned jobs is built once from a difference array. A pending
+        job is blocked at a time where its demand exceeds the capacity left on any resource, and
+        a start time is hidden when the job would be running at a blocked time. Start times after
+        the last assigned job finishes always fit.
+
+        Args:
+            rows (list[int]): Array rows of the assigned jobs.
+            starts (list[int]): Start times of the assigned jobs, in the same order.
+            pending (list[tuple[int, Domain]]): Array row and domain of each unassigned job.
+
+        Returns:
+            bool: False if a resource is overloaded or a pending job has no start time left,
+                True otherwise.
+        """
+        if not rows:
+            return True
+
+        starts = np.asarray(starts, dtype=np.int64)
+        ends = starts + self.durations[rows]
+        horizon = int(ends.max())
+
+        # Capacity left at each time before the horizon
+        delta = np.zeros((horizon + 1, len(self.capacities)), dtype=np.int64)
+        np.add.at(delta, starts, self.demands[rows])
+        np.add.at(delta, ends, -self.demands[rows])
+        free = self.capacities - delta.cumsum(axis=0)[:-1]
+        if (free < 0).any():
+            return False
+
+        # blocked_before[k, t] counts the times before t where pending job k does not fit
+        pending_rows = [row for row, _ in pending]
+        blocked = (self.demands[pending_rows][:, None, :] > free[None, :, :]).any(axis=2)
+        blocked_before = np.zeros((len(pending), horizon + 1), dtype=np.int64)
+        np.cumsum(blocked, axis=1, out=blocked_before[:, 1:])
+
+        for k, (row, domain) in enumerate(pending):
+            if not blocked_before[k, -1]:
+                continue
+
+            values = np.asarray(domain, dtype=np.int64)
+            first = np.minimum(values, horizon)
+            last = np.minimum(values + self.durations[row], horizon)
+            for value in values[blocked_before[k, last] > blocked_before[k, first]].tolist():
+                domain.hideValue(value)
+
+            if not domain:
+                return False
+
+        return True
@@ -0,0 +1,215 @@
+import copy
+from enum import Enum
+
+from data_parsing import ProjectData, Job, DurationResource
+
+from .utils import DueDateMode
+
+
+class ChangeType(Enum):
+    """
+    Enum representing the disruptions a schedule can be repaired for.
+
+    Attributes:
+        DELAY (int): A job has not started and cannot start before a given time.
+        DURATION (int): A job takes a different time than planned (also for a running job).
+        CAPACITY (int): A resource has a different capacity from now on.
+    """
+
+    DELAY = 1
+    DURATION = 2
+    CAPACITY = 3
+
+
+class Change:
+    """
+    A disruption of the project.
+
+    Attributes:
+        kind (ChangeType): The type of change.
+        target (int | str): The job number (DELAY, DURATION) or resource name (CAPACITY).
+        value (int): The earliest start (DELAY), the new duration (DURATION) or the new
+                     capacity (CAPACITY).
+    """
+
+    __slots__ = ("kind", "target", "value")
+
+    def __init__(self, kind, target, value):
+        self.kind = kind
+        self.target = target
+        self.value = value
+
+
+def apply_changes(data: ProjectData, changes) -> ProjectData:
+    """
+    Returns a copy of the project with the duration and capacity changes applied.
+
+    A project has a single capacity per resource, so a CAPACITY change holds for the whole
+    copy. Activities run before the change are not checked against it: the copy is meant to
+    build the residual project (see residual_project), where time starts when the change
+    takes effect.
+
+    Args:
+        data (ProjectData): The project data (single mode).
+        changes (Iterable[Change]): The changes. DELAY changes do not modify the project.
+
+    Returns:
+        ProjectData: The updated copy.
+
+    Raises:
+        ValueError: If a change targets an unknown job or resource.
+    """
+    updated = copy.deepcopy(data)
+    rows = {dr.job_number: dr for dr in updated.durations_resources}
+
+    for change in changes:
+        if change.kind == ChangeType.CAPACITY:
+            if change.target not in updated.resource_availability:
+                raise ValueError(f"Unknown resource {change.target}!")
+            updated.resource_availability[change.target].quantity = change.value
+        elif change.target not in rows:
+            raise ValueError(f"Unknown job {change.target}!")
+        elif change.kind == ChangeType.DURATION:
+            rows[change.target].duration = change.value
+
+    updated.modes = [[dr] for dr in updated.durations_resources]
+    updated.reset_arrays()
+    return updated
+
+
+def residual_project(
+    data: ProjectData, solution: dict, current_time: int, releases: dict[int, int]
+) -> tuple[ProjectData, set[int]]:
+    """
+    Builds the project left to schedule at `current_time`, with time shifted to start at 0.
+
+    Jobs started before `current_time` (and not released later) are frozen at time 0: finished
+    jobs get no duration nor demand, running jobs keep their remaining duration and demand.
+    Each release time becomes a zero demand dummy job of that duration preceding the delayed
+    job, numbered after the real jobs.
+
+    Args:
+        data (ProjectData): The project data, with the changes applied.
+        solution (dict): The current schedule, with "job_N" keys.
+        current_time (int): The time the project is rescheduled at.
+        releases (dict[int, int]): Earliest start of delayed jobs, by job number.
+
+    Returns:
+        tuple: The residual project and the numbers of its frozen jobs.
+    """
+    residual = copy.deepcopy(data)
+    frozen = set()
+
+    for dr in residual.durations_resources:
+        start = solution[f"job_{dr.job_number}"]
+        if start < current_time and dr.job_number not in releases:
+            frozen.add(dr.job_number)
+            dr.duration = max(start + dr.duration - current_time, 0)
+            if dr.duration == 0:
+                dr.resources = dict.fromkeys(dr.resources, 0)
+
+    zero = dict.fromkeys(residual.resource_availability, 0)
+    number = len(residual.durations_resources)
+    for job_number, release in releases.items():
+        if release > current_time:
+            number += 1
+            residual.precedence_relations.append(Job(number, [job_number]))
+            residual.durations_resources.append(
+                DurationResource(number, 1, release - current_time, dict(zero))
+            )
+
+    residual.modes = [[dr] for dr in residual.durations_resources]
+    residual.general_info.jobs = number
+    residual.general_info.horizon = sum(dr.duration for dr in residual.durations_resources)
+    for summary in residual.projects_summary:
+        summary.due_date -= current_time
+    residual.reset_arrays()
+
+    return residual, frozen
+
+
+def reschedule(
+    data: ProjectData,
+    solution: dict,
+    current_time: int,
+    changes=(),
+    due_date_mode: DueDateMode = DueDateMode.IGNORE,
+    time_limit: float = 1.0,
+    num_search_workers: int = 0,
+) -> tuple[str, dict, ProjectData, dict]:
+    """
+    Repairs a schedule after disruptions, re-optimizing only the jobs that have not started.
+
+    Jobs started before `current_time` keep their start times. The rest of the project is
+    solved with OR-Tools from `current_time` on, warm-started from the old plan: the old order
+    of the jobs is decoded with the serial SGS into a feasible schedule of the changed project,
+    which bounds the search and gives the solver a solution to improve from the start.
+
+    Capacity changes hold from `current_time` on, jobs that ran before it used the old
+    capacities. The new schedule is therefore checked against the residual project, e.g.,
+    `validate(residual_solution, residual)`, where the running jobs share the new capacities
+    with the rescheduled ones.
+
+    Args:
+        data (ProjectData): The project data (single mode), as the schedule was planned.
+        solution (dict): The current schedule, with "job_N" keys and start time values.
+        current_time (int): The time the project is rescheduled at.
+        changes (Iterable[Change]): The disruptions to account for.
+        due_date_mode (DueDateMode): How the project due date is handled.
+        time_limit (float): Seconds the solver may spend improving the repaired schedule.
+        num_search_workers (int): Number of parallel search workers. 0 uses every core.
+
+    Returns:
+        tuple: A tuple containing:
+            - status (str): The CP-SAT status name (e.g., OPTIMAL, FEASIBLE or INFEASIBLE).
+            - solution (dict): The new schedule of every job in absolute time, empty if none
+                               was found.
+            - residual (ProjectData): The project left at `current_time`, with the changes
+                                      applied and time starting at 0 (see residual_project).
+            - residual_solution (dict): The new schedule of the residual project, empty if none
+                                        was found.
+
+    Raises:
+        ValueError: If the project is multi-mode or a change targets an unknown job or resource.
+    """
+    from csp_solvers import heuristic, ortools
+
+    if data.is_multimode:
+        raise ValueError("Rescheduling supports single mode projects only!")
+
+    changes = list(changes)
+    updated = apply_changes(data, changes)
+    releases = {
+        change.target: change.value for change in changes if change.kind == ChangeType.DELAY
+    }
+
+    residual, frozen = residual_project(updated, solution, current_time, releases)
+
+    # The old plan, shifted to the residual time and decoded into a feasible schedule. Frozen
+    # jobs are listed first, so they are decoded at time 0 before any other job takes resources
+    shifted = {
+        f"job_{dr.job_number}": (
+            -1
+            if dr.job_number in frozen
+            else max(solution.get(f"job_{dr.job_number}", 0) - current_time, 0)
+        )
+        for dr in residual.durations_resources
+    }
+    hint = heuristic.repair(residual, shifted)
+
+    model, start_times = ortools.define_problem(residual, due_date_mode, hint)
+    for job_number in frozen:
+        model.Add(start_times[job_number] == 0)
+
+    solver = ortools.create_solver(num_search_workers, time_limit)
+    status, residual_solution, _ = ortools.solve(model, start_times, residual, solver)
+
+    new_solution = {}
+    if residual_solution:
+        for dr in updated.durations_resources:
+            key = f"job_{dr.job_number}"
+            new_solution[key] = (
+                solution[key] if dr.job_number in frozen else residual_solution[key] + current_time
+            )
+
+    return solver.StatusName(status), new_solution, residual, residual_solution
@@ -0,0 +1,176 @@
+import json
+import os
+import sqlite3
+import time
+from collections import OrderedDict
+
+from data_parsing import ProjectData, project_fingerprint
+
+from .validation import is_feasible
+
+
+class SolutionCache:
+    """
+    Persistent store of solved schedules, keyed by project content and solver settings.
+
+    Entries live in a SQLite database, with the most recently used ones also kept in memory so
+    repeated lookups skip the database. The store keeps at most `max_entries` entries, evicting
+    the least recently used ones. Schedules are checked with is_feasible when stored and again
+    when read back from the database, before they are returned as exact hits.
+
+    Projects that share the structure of a cached one (same jobs, precedences, modes and
+    demands, but other capacities, horizon or due date) get its schedule as a hint through
+    hint(), to warm-start a solver.
+
+    Multi-mode projects are not cached.
+    """
+
+    def __init__(
+        self,
+        path: str = ".cache/solutions.sqlite",
+        max_entries: int = 10000,
+        memory_entries: int = 256,
+    ):
+        """
+        Args:
+            path (str): Path of the SQLite database, created if missing.
+            max_entries (int): Maximum number of entries kept on disk.
+            memory_entries (int): Maximum number of entries kept in memory.
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.max_entries = max_entries
+        self.memory_entries = memory_entries
+        self._memory: OrderedDict[tuple[str, str], tuple[dict, str]] = OrderedDict()
+
+        self._db = sqlite3.connect(path)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS solutions ("
+            " project TEXT, settings TEXT, structure TEXT, solution TEXT, status TEXT,"
+            " last_used REAL, PRIMARY KEY (project, settings))"
+        )
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS solutions_structure ON solutions (structure, last_used)"
+        )
+        self._db.commit()
+
+    @staticmethod
+    def _settings_key(settings: dict | None) -> str:
+        """
+        Canonical text of the solver settings (e.g., solver type and due date mode).
+        """
+        return json.dumps(settings or {}, sort_keys=True, default=str)
+
+    def _remember(self, key: tuple[str, str], entry: tuple[dict, str]):
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def get(self, data: ProjectData, settings: dict | None = None) -> tuple[dict, str] | None:
+        """
+        Looks up the schedule of a project solved with the same settings.
+
+        Args:
+            data (ProjectData): The project data.
+            settings (dict, optional): The solver settings the schedule must have been found with.
+
+        Returns:
+            tuple: The schedule ("job_N" keys) and the solver status it was stored with, or None
+                if there is no entry or the stored schedule is not feasible for the project.
+        """
+        if data.is_multimode:
+            return None
+
+        key = (project_fingerprint(data), self._settings_key(settings))
+
+        # Memory entries were verified when loaded, and the key covers the project content
+        entry = self._memory.get(key)
+        if entry is not None:
+            self._memory.move_to_end(key)
+            return dict(entry[0]), entry[1]
+
+        row = self._db.execute(
+            "SELECT solution, status FROM solutions WHERE project = ? AND settings = ?", key
+        ).fetchone()
+        if row is None:
+            return None
+
+        entry = (json.loads(row[0]), row[1])
+        if not is_feasible(entry[0], data):
+            return None
+
+        self._db.execute(
+            "UPDATE solutions SET last_used = ? WHERE project = ? AND settings = ?",
+            (time.time(), *key),
+        )
+        self._db.commit()
+
+        self._remember(key, entry)
+        return dict(entry[0]), entry[1]
+
+    def hint(self, data: ProjectData) -> dict | None:
+        """
+        Finds the most recently used schedule of a project with the same structure.
+
+        The schedule may not be feasible for the given project (e.g., if capacities dropped),
+        it is meant as a solver hint, not as a solution. heuristic.repair makes it feasible.
+
+        Args:
+            data (ProjectData): The project data.
+
+        Returns:
+            dict: A schedule with "job_N" keys, or None if no project with the same structure
+                was cached.
+        """
+        if data.is_multimode:
+            return None
+
+        row = self._db.execute(
+            "SELECT solution FROM solutions WHERE structure = ? ORDER BY last_used DESC LIMIT 1",
+            (project_fingerprint(data, structure_only=True),),
+        ).fetchone()
+
+        return json.loads(row[0]) if row else None
+
+    def put(self, data: ProjectData, solution: dict, status: str, settings: dict | None = None):
+        """
+        Stores the schedule of a project, evicting the least recently used entries if full.
+
+        Schedules that are not feasible for the project are not stored.
+
+        Args:
+            data (ProjectData): The project data.
+            solution (dict): The schedule, with "job_N" keys.
+            status (str): The solver status of the schedule (e.g., "OPTIMAL" or "FEASIBLE").
+            settings (dict, optional): The solver settings the schedule was found with.
+        """
+        if data.is_multimode or not solution or not is_feasible(solution, data):
+            return
+
+        key = (project_fingerprint(data), self._settings_key(settings))
+        solution = {name: int(start) for name, start in solution.items()}
+
+        self._db.execute(
+            "INSERT OR REPLACE INTO solutions VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                *key,
+                project_fingerprint(data, structure_only=True),
+                json.dumps(solution),
+                status,
+                time.time(),
+            ),
+        )
+        self._db.execute(
+            "DELETE FROM solutions WHERE rowid NOT IN"
+            " (SELECT rowid FROM solutions ORDER BY last_used DESC LIMIT ?)",
+            (self.max_entries,),
+        )
+        self._db.commit()
+
+        self._remember(key, (solution, status))
+
+    def close(self):
+        self._db.close()
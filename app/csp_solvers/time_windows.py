@@ -0,0 +1,99 @@
+from data_parsing import ProjectData
+
+
+def topological_order(data: ProjectData) -> list[int]:
+    """
+    Orders the jobs so that every job comes before all of its successors.
+
+    Args:
+        data (ProjectData): The project data containing job precedence relations.
+
+    Returns:
+        list[int]: Job numbers in topological order.
+
+    Raises:
+        ValueError: If the precedence relations contain a cycle.
+    """
+    predecessors_left = {job.job_number: 0 for job in data.precedence_relations}
+    for job in data.precedence_relations:
+        for successor in job.successors:
+            predecessors_left[successor] += 1
+
+    successors = {job.job_number: job.successors for job in data.precedence_relations}
+    ready = [number for number, count in predecessors_left.items() if count == 0]
+    order = []
+
+    while ready:
+        number = ready.pop()
+        order.append(number)
+        for successor in successors[number]:
+            predecessors_left[successor] -= 1
+            if predecessors_left[successor] == 0:
+                ready.append(successor)
+
+    if len(order) != len(predecessors_left):
+        raise ValueError("Precedence relations contain a cycle!")
+
+    return order
+
+
+def compute_time_windows(
+    data: ProjectData,
+    deadline: int | None = None,
+    durations: dict[int, int] | None = None,
+) -> dict[int, tuple[int, int]]:
+    """
+    Computes the critical path (CPM) start time window of every job.
+
+    The earliest start is the longest path from any source job, the latest start is the
+    deadline minus the longest path (durations included) from the job to any sink job.
+    Resources are ignored, so the windows are valid bounds for every feasible schedule
+    finishing by the deadline.
+
+    Args:
+        data (ProjectData): The project data containing job precedence relations and durations.
+        deadline (int, optional): Time by which every job must be finished. Defaults to the
+                                  planning horizon.
+        durations (dict[int, int], optional): Duration of each job number. Defaults to the
+                                              durations in durations_resources. Multi-mode
+                                              models pass the shortest mode of each job.
+
+    Returns:
+        dict[int, tuple[int, int]]: A dictionary mapping each job number to its
+            (earliest start, latest start) window, both inclusive.
+
+    Raises:
+        ValueError: If the critical path does not fit before the deadline.
+    """
+    if deadline is None:
+        deadline = data.general_info.horizon
+
+    order = topological_order(data)
+    successors = {job.job_number: job.successors for job in data.precedence_relations}
+    if durations is None:
+        durations = {dr.job_number: dr.duration for dr in data.durations_resources}
+
+    # Forward pass: earliest start times
+    earliest = dict.fromkeys(order, 0)
+    for number in order:
+        finish = earliest[number] + durations[number]
+        for successor in successors[number]:
+            earliest[successor] = max(earliest[successor], finish)
+
+    # Backward pass: remaining path length (tail) from each job to the end of the project
+    tail = {}
+    for number in reversed(order):
+        tail[number] = durations[number] + max(
+            (tail[successor] for successor in successors[number]), default=0
+        )
+
+    critical_path = max(earliest[number] + durations[number] for number in order)
+    if critical_path > deadline:
+        raise ValueError(
+            f"Critical path length {critical_path} exceeds the deadline {deadline}!"
+        )
+
+    return {
+        job.job_number: (earliest[job.job_number], deadline - tail[job.job_number])
+        for job in data.precedence_relations
+    }
@@ -1,4 +1,7 @@
 from enum import Enum
+
+import numpy as np
+
 from data_parsing import ProjectData
 
 
@@ -9,10 +12,30 @@ class SolverType(Enum):
     Attributes:
         PYTHON_CONSTRAINT (int): Solver type using Python's constraint library.
         OR_TOOLS (int): Solver type using Google's OR-Tools.
+        HEURISTIC (int): Solver type using priority rule based schedule generation schemes.
+        PORTFOLIO (int): Races the other solvers in parallel processes and keeps the best result.
     """
 
     PYTHON_CONSTRAINT = 1
     OR_TOOLS = 2
+    HEURISTIC = 3
+    PORTFOLIO = 4
+
+
+class DueDateMode(Enum):
+    """
+    Enum representing how the project due date is handled by a solver.
+
+    Attributes:
+        IGNORE (int): The due date is not modelled, only the horizon bounds the schedule.
+        ENFORCE (int): Every job must finish by the due date.
+        PENALIZE (int): Finishing after the due date is allowed but costs tardiness_cost
+                        per time unit of tardiness.
+    """
+
+    IGNORE = 1
+    ENFORCE = 2
+    PENALIZE = 3
 
 
 def process_solution(solution, pData: ProjectData):
@@ -29,18 +52,44 @@ def process_solution(solution, pData: ProjectData):
         pData (ProjectData): The project data containing job precedence relations.
 
     Returns:
-        dict: A sorted and adjusted solution with normalized start times.
+        dict: A new solution with normalized start times, ordered by job number.
     """
-    has_preced = set()
+    arrays = pData.arrays
+    keys = arrays.job_keys
 
-    for job in pData.precedence_relations:
-        for pId in job.successors:
-            has_preced.add(f"job_{pId}")
+    # Jobs without predecessors are the first jobs of the schedule
+    first_rows = np.flatnonzero(np.diff(arrays.predecessor_offsets) == 0).tolist()
+    min_offset = min(solution[keys[row]] for row in first_rows)
 
-    min_offset = min(solution[key] for key in solution if key not in has_preced)
+    return {
+        keys[row]: solution[keys[row]] - min_offset
+        for row in np.argsort(arrays.job_numbers, kind="stable").tolist()
+        if keys[row] in solution
+    }
 
-    for key in solution:
-        solution[key] -= min_offset
 
-    solution = dict(sorted(solution.items(), key=lambda x: int(x[0].split("_")[1])))
-    return solution
+def compute_makespan(solution, pData: ProjectData, modes: dict | None = None) -> int:
+    """
+    Computes the makespan of a solution, i.e., the latest completion time of all jobs.
+
+    Args:
+        solution (dict): A dictionary where keys are job identifiers (e.g., "job_1") and values
+                        are the start times of the jobs.
+        pData (ProjectData): The project data containing job durations.
+        modes (dict, optional): The mode chosen for each job identifier, for multi-mode
+                                solutions. Defaults to the first mode of every job.
+
+    Returns:
+        int: The makespan of the solution.
+    """
+    if modes:
+        durations = {
+            f"job_{dr.job_number}": dr.duration
+            for job_modes in pData.modes
+            for dr in job_modes
+            if dr.mode == modes[f"job_{dr.job_number}"]
+        }
+    else:
+        durations = {f"job_{dr.job_number}": dr.duration for dr in pData.durations_resources}
+
+    return max(solution[key] + duration for key, duration in durations.items())
@@ -3,5 +3,15 @@ from .project_summary import ProjectSummary
 from .job import Job
 from .duration_resource import DurationResource
 from .resource_availability import ResourceAvailability
+from .project_arrays import ProjectArrays
 from .project_data import ProjectData
+from .parse_stream import (
+    ParseError,
+    open_project_file,
+    iter_projects,
+    iter_project_file,
+)
 from .parse_file import parse_file
+from .cache import load_project, project_fingerprint
+from .write_project import format_project, write_project
+from .generate_project import generate_project
@@ -0,0 +1,248 @@
+import hashlib
+import os
+import tempfile
+
+import numpy as np
+
+from . import (
+    ProjectData,
+    GeneralInformation,
+    ProjectSummary,
+    Job,
+    DurationResource,
+    ResourceAvailability,
+)
+from .parse_file import parse_file
+from .parse_stream import open_project_file
+
+# Bump when the stored layout changes so old cache files are ignored
+CACHE_VERSION = 2
+
+
+def _cache_path(file_path: str, cache_dir: str) -> str:
+    """
+    Builds the cache file path of a project file from its content hash and modification time.
+
+    Args:
+        file_path (str): Path to the project data file.
+        cache_dir (str): Directory holding the cache files.
+
+    Returns:
+        str: Path of the .npz cache file for the current version of the project file.
+    """
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as file:
+        for block in iter(lambda: file.read(1 << 20), b""):
+            digest.update(block)
+
+    mtime = os.stat(file_path).st_mtime_ns
+    return os.path.join(
+        cache_dir, f"{digest.hexdigest()[:32]}_{mtime}_v{CACHE_VERSION}.npz"
+    )
+
+
+def _to_arrays(data: ProjectData) -> dict[str, np.ndarray]:
+    """
+    Converts a ProjectData into flat arrays, with successors stored in CSR form.
+
+    Args:
+        data (ProjectData): The project data.
+
+    Returns:
+        dict[str, np.ndarray]: The arrays to store in the .npz file.
+    """
+    info = data.general_info
+
+    # Every mode row of every job, the first row of each job is its durations_resources entry
+    modes = data.modes or [[dr] for dr in data.durations_resources]
+    mode_rows = [dr for job_modes in modes for dr in job_modes]
+    demand_names = list(dict.fromkeys(name for dr in mode_rows for name in dr.resources))
+
+    successors = [job.successors for job in data.precedence_relations]
+    successor_offsets = np.zeros(len(successors) + 1, dtype=np.int64)
+    successor_offsets[1:] = np.cumsum([len(job_successors) for job_successors in successors])
+
+    return {
+        "general_info": np.array(
+            [
+                info.projects,
+                info.jobs,
+                info.horizon,
+                info.resources["renewable"],
+                info.resources["nonrenewable"],
+                info.resources["doubly_constrained"],
+            ],
+            dtype=np.int64,
+        ),
+        "projects_summary": np.array(
+            [
+                [
+                    summary.project_number,
+                    summary.jobs,
+                    summary.release_date,
+                    summary.due_date,
+                    summary.tardiness_cost,
+                    summary.mpm_time,
+                ]
+                for summary in data.projects_summary
+            ],
+            dtype=np.int64,
+        ).reshape(-1, 6),
+        "job_numbers": np.array(
+            [job.job_number for job in data.precedence_relations], dtype=np.int64
+        ),
+        "job_modes": np.array([job.modes for job in data.precedence_relations], dtype=np.int64),
+        "successor_offsets": successor_offsets,
+        "successors": np.array(
+            [successor for job_successors in successors for successor in job_successors],
+            dtype=np.int64,
+        ),
+        "duration_job_numbers": np.array([dr.job_number for dr in mode_rows], dtype=np.int64),
+        "modes": np.array([dr.mode for dr in mode_rows], dtype=np.int64),
+        "durations": np.array([dr.duration for dr in mode_rows], dtype=np.int64),
+        "demand_names": np.array(demand_names, dtype=str),
+        "demands": np.array(
+            [[dr.resources.get(name, 0) for name in demand_names] for dr in mode_rows],
+            dtype=np.int64,
+        ).reshape(len(mode_rows), len(demand_names)),
+        "resource_names": np.array(list(data.resource_availability.keys()), dtype=str),
+        "resource_kinds": np.array(
+            [availability.kind for availability in data.resource_availability.values()],
+            dtype=str,
+        ),
+        "capacities": np.array(
+            [availability.quantity for availability in data.resource_availability.values()],
+            dtype=np.int64,
+        ),
+    }
+
+
+def _from_arrays(arrays) -> ProjectData:
+    """
+    Rebuilds a ProjectData from the arrays stored by _to_arrays.
+
+    Args:
+        arrays: The loaded .npz file.
+
+    Returns:
+        ProjectData: The project data.
+    """
+    data = ProjectData()
+
+    data.general_info = GeneralInformation(*arrays["general_info"].tolist())
+
+    for row in arrays["projects_summary"].tolist():
+        data.projects_summary.append(ProjectSummary(*row))
+
+    offsets = arrays["successor_offsets"].tolist()
+    successors = arrays["successors"].tolist()
+    for index, (job_number, job_modes) in enumerate(
+        zip(arrays["job_numbers"].tolist(), arrays["job_modes"].tolist())
+    ):
+        data.precedence_relations.append(
+            Job(
+                job_number=job_number,
+                successors=successors[offsets[index] : offsets[index + 1]],
+                modes=job_modes,
+            )
+        )
+
+    demand_names = arrays["demand_names"].tolist()
+    for job_number, mode, duration, demands in zip(
+        arrays["duration_job_numbers"].tolist(),
+        arrays["modes"].tolist(),
+        arrays["durations"].tolist(),
+        arrays["demands"].tolist(),
+    ):
+        duration_resource = DurationResource(
+            job_number=job_number,
+            mode=mode,
+            duration=duration,
+            resources=dict(zip(demand_names, demands)),
+        )
+
+        if data.modes and data.modes[-1][0].job_number == job_number:
+            data.modes[-1].append(duration_resource)
+        else:
+            data.modes.append([duration_resource])
+            data.durations_resources.append(duration_resource)
+
+    for name, quantity, kind in zip(
+        arrays["resource_names"].tolist(),
+        arrays["capacities"].tolist(),
+        arrays["resource_kinds"].tolist(),
+    ):
+        data.resource_availability[name] = ResourceAvailability(
+            resource_name=name, quantity=quantity, kind=kind
+        )
+
+    return data
+
+
+# Arrays left out of the structure fingerprint, so projects differing only in capacities,
+# horizon or due dates share it
+_SETTING_ARRAYS = ("capacities", "general_info", "projects_summary")
+
+
+def project_fingerprint(data: ProjectData, structure_only: bool = False) -> str:
+    """
+    Computes a canonical hash of the content of a project.
+
+    Two projects with the same jobs, precedences, modes and resources get the same fingerprint,
+    however they were loaded. The fingerprint is memoized on the ProjectData, so call
+    data.reset_arrays() after modifying the data.
+
+    Args:
+        data (ProjectData): The project data.
+        structure_only (bool): Leave out the capacities, horizon and due dates, so that
+                               variants of a project differing only in those share the hash.
+
+    Returns:
+        str: The hexadecimal SHA-256 digest.
+    """
+    fingerprint = data._fingerprints.get(structure_only)
+    if fingerprint is not None:
+        return fingerprint
+
+    digest = hashlib.sha256()
+    for name, array in sorted(_to_arrays(data).items()):
+        if structure_only and name in _SETTING_ARRAYS:
+            continue
+        digest.update(f"{name}:{array.dtype.str}:{array.shape}".encode())
+        digest.update(np.ascontiguousarray(array).tobytes())
+
+    fingerprint = data._fingerprints[structure_only] = digest.hexdigest()
+    return fingerprint
+
+
+def load_project(file_path: str, cache_dir: str = ".cache/projects") -> ProjectData:
+    """
+    Loads a project data file, using a binary cache to skip parsing on repeated loads.
+
+    The cache file name is built from the content hash and the modification time of the source,
+    so any change to the source file makes the old entry unreachable and the file is parsed
+    again. Cache files are written atomically, so concurrent loads never read a partial file.
+
+    Args:
+        file_path (str): Path to the project data file, plain or compressed.
+        cache_dir (str): Directory holding the cache files.
+
+    Returns:
+        ProjectData: Parsed data with project details, jobs, resources, and constraints.
+    """
+    cache_path = _cache_path(file_path, cache_dir)
+
+    if os.path.exists(cache_path):
+        with np.load(cache_path, allow_pickle=False) as arrays:
+            return _from_arrays(arrays)
+
+    with open_project_file(file_path) as file:
+        data = parse_file(file)
+
+    os.makedirs(cache_dir, exist_ok=True)
+    descriptor, temp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    with os.fdopen(descriptor, "wb") as temp_file:
+        np.savez(temp_file, **_to_arrays(data))
+    os.replace(temp_path, cache_path)
+
+    return data
@@ -9,6 +9,8 @@ class DurationResource:
         resources (dict[str, int]): A dictionary mapping resource names to the quantities required.
     """
 
+    __slots__ = ("job_number", "mode", "duration", "resources")
+
     def __init__(self, job_number, mode, duration, resources):
         self.job_number = job_number
         self.mode = mode
@@ -12,6 +12,8 @@ class GeneralInformation:
             - "doubly_constrained": Number of doubly constrained resources.
     """
 
+    __slots__ = ("projects", "jobs", "horizon", "resources")
+
     def __init__(
         self,
         projects,
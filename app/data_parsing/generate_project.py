@@ -0,0 +1,184 @@
+import numpy as np
+
+from . import (
+    ProjectData,
+    GeneralInformation,
+    ProjectSummary,
+    Job,
+    DurationResource,
+    ResourceAvailability,
+)
+
+
+def _precedence_arcs(jobs: int, network_complexity: float, rng: np.random.Generator) -> set:
+    """
+    Draws precedence arcs between the non-dummy jobs 0..jobs-1, always from a lower to a
+    higher index, so the network is acyclic and the index order is topological.
+
+    Every job after the first few gets one predecessor among the `window` jobs before it, then
+    random arcs within the window are added until there are `network_complexity` arcs per job,
+    or every arc the window allows is used. The window keeps the network deep instead of
+    collapsing into a wide fan.
+    """
+    window = max(2, int(np.sqrt(jobs)))
+    arcs = set()
+
+    first = min(jobs, max(1, window // 2))
+    targets = np.arange(first, jobs)
+    offsets = rng.integers(1, window + 1, size=targets.size)
+    sources = np.maximum(targets - offsets, 0)
+    arcs.update(zip(sources.tolist(), targets.tolist()))
+
+    # Arcs from a job reach at most `window` jobs ahead and never past the last one
+    capacity = sum(min(window, jobs - 1 - source) for source in range(jobs - 1))
+    wanted = min(int(round(network_complexity * jobs)), capacity)
+
+    # Random arcs are drawn while most of the free arcs are still missing, so few are rejected
+    while len(arcs) < wanted and 2 * (wanted - len(arcs)) <= capacity - len(arcs):
+        batch = wanted - len(arcs)
+        sources = rng.integers(0, jobs - 1, size=batch)
+        targets = np.minimum(sources + rng.integers(1, window + 1, size=batch), jobs - 1)
+        arcs.update(zip(sources.tolist(), targets.tolist()))
+
+    # Near the capacity, pick the remaining arcs among the free ones, without replacement
+    if len(arcs) < wanted:
+        free = [
+            (source, target)
+            for source in range(jobs - 1)
+            for target in range(source + 1, min(source + window, jobs - 1) + 1)
+            if (source, target) not in arcs
+        ]
+        picked = rng.choice(len(free), size=wanted - len(arcs), replace=False)
+        arcs.update(free[index] for index in picked.tolist())
+
+    return arcs
+
+
+def generate_project(
+    jobs: int,
+    network_complexity: float = 1.5,
+    resource_factor: float = 0.5,
+    resource_strength: float = 0.5,
+    resources: int = 4,
+    max_duration: int = 10,
+    max_demand: int = 10,
+    seed: int = None,
+) -> ProjectData:
+    """
+    Generates a random single-mode project, in the spirit of the ProGen parameters.
+
+    The project has `jobs` activities plus a zero-duration supersource and supersink, numbered
+    1 and jobs + 2. Durations and demands are drawn uniformly from 1..max_duration and
+    1..max_demand.
+
+    Args:
+        jobs (int): Number of non-dummy jobs.
+        network_complexity (float): Average number of precedence arcs per non-dummy job
+                                    (transitive arcs are not removed, so it is approximate).
+        resource_factor (float): Fraction of the renewable resources used by each job (0 to 1).
+        resource_strength (float): Scarcity of the capacities (0 to 1). 0 sets each capacity to
+                                   the largest single demand, 1 to the peak usage of the earliest
+                                   start schedule, so resources never bind.
+        resources (int): Number of renewable resources.
+        max_duration (int): Largest job duration.
+        max_demand (int): Largest demand of a job on a resource.
+        seed (int, optional): Seed of the random generator, for reproducible instances.
+
+    Returns:
+        ProjectData: The generated project, with every mode list and summary field filled in.
+
+    Raises:
+        ValueError: If a parameter is out of range.
+    """
+    if jobs < 1 or resources < 1 or max_duration < 1 or max_demand < 1:
+        raise ValueError("jobs, resources, max_duration and max_demand must be positive")
+    if not 0 <= resource_factor <= 1 or not 0 <= resource_strength <= 1:
+        raise ValueError("resource_factor and resource_strength must be between 0 and 1")
+    if network_complexity < 0:
+        raise ValueError("network_complexity must not be negative")
+
+    rng = np.random.default_rng(seed)
+
+    durations = rng.integers(1, max_duration + 1, size=jobs)
+
+    # Each job uses every resource with probability resource_factor, and at least one
+    uses = rng.random((jobs, resources)) < resource_factor
+    if resource_factor > 0:
+        uses[np.arange(jobs), rng.integers(0, resources, size=jobs)] = True
+    demands = np.where(uses, rng.integers(1, max_demand + 1, size=(jobs, resources)), 0)
+
+    arcs = _precedence_arcs(jobs, network_complexity, rng)
+    successors = [[] for _ in range(jobs)]
+    has_predecessor = np.zeros(jobs, dtype=bool)
+    for source, target in sorted(arcs):
+        successors[source].append(target)
+        has_predecessor[target] = True
+
+    # Earliest starts, the index order is topological
+    starts = np.zeros(jobs, dtype=np.int64)
+    for job in range(jobs):
+        finish = starts[job] + durations[job]
+        for successor in successors[job]:
+            if starts[successor] < finish:
+                starts[successor] = finish
+    critical_path = int((starts + durations).max())
+
+    # Capacities between the largest single demand and the peak of the earliest start profile
+    usage = np.zeros((critical_path + 1, resources), dtype=np.int64)
+    np.add.at(usage, starts, demands)
+    np.add.at(usage, starts + durations, -demands)
+    peak = usage.cumsum(axis=0).max(axis=0)
+    minimum = demands.max(axis=0)
+    capacities = minimum + np.round(resource_strength * (peak - minimum)).astype(np.int64)
+    capacities = np.maximum(capacities, 1)
+
+    total = jobs + 2
+    sink = total
+    names = [f"R{i + 1}" for i in range(resources)]
+
+    data = ProjectData()
+    data.general_info = GeneralInformation(
+        projects=1,
+        jobs=total,
+        horizon=int(durations.sum()),
+        renewable_resources=resources,
+        nonrenewable_resources=0,
+        doubly_constrained_resources=0,
+    )
+    data.projects_summary.append(
+        ProjectSummary(
+            project_number=1,
+            jobs=total,
+            release_date=0,
+            due_date=critical_path,
+            tardiness_cost=0,
+            mpm_time=critical_path,
+        )
+    )
+
+    # Jobs are numbered from 2, after the supersource
+    data.precedence_relations.append(
+        Job(1, [job + 2 for job in np.flatnonzero(~has_predecessor).tolist()])
+    )
+    for job in range(jobs):
+        data.precedence_relations.append(
+            Job(job + 2, [successor + 2 for successor in successors[job]] or [sink])
+        )
+    data.precedence_relations.append(Job(sink, []))
+
+    zero = dict.fromkeys(names, 0)
+    rows = [DurationResource(1, 1, 0, dict(zero))]
+    rows.extend(
+        DurationResource(job + 2, 1, duration, dict(zip(names, demand)))
+        for job, (duration, demand) in enumerate(zip(durations.tolist(), demands.tolist()))
+    )
+    rows.append(DurationResource(sink, 1, 0, dict(zero)))
+    data.durations_resources = rows
+    data.modes = [[row] for row in rows]
+
+    data.resource_availability = {
+        name: ResourceAvailability(name, quantity)
+        for name, quantity in zip(names, capacities.tolist())
+    }
+
+    return data
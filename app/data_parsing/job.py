@@ -5,8 +5,13 @@ class Job:
     Attributes:
         job_number (int): The unique identifier for the job.
         successors (list[int]): A list of job numbers that must follow this job.
+        modes (int): The number of execution modes declared for the job (the listed mode rows
+                     are kept in ProjectData.modes).
     """
 
-    def __init__(self, job_number, successors):
+    __slots__ = ("job_number", "successors", "modes")
+
+    def __init__(self, job_number, successors, modes=1):
         self.job_number = job_number
         self.successors = successors
+        self.modes = modes
@@ -0,0 +1,338 @@
+import bz2
+import gzip
+import io
+import lzma
+import sys
+from collections.abc import Iterator
+from functools import lru_cache
+
+from . import (
+    ProjectData,
+    GeneralInformation,
+    ProjectSummary,
+    Job,
+    DurationResource,
+    ResourceAvailability,
+)
+
+# Section headers of the project data format and the ProjectData attribute they fill
+SECTIONS = {
+    "#General Information": "general_info",
+    "#Projects summary": "projects_summary",
+    "#Precedence relations": "precedence_relations",
+    "#Duration and resources": "durations_resources",
+    "#Resource availability": "resource_availability",
+}
+
+# Magic bytes of the supported compressed formats
+COMPRESSIONS = (
+    (b"\x1f\x8b", gzip.open),
+    (b"\xfd7zXZ\x00", lzma.open),
+    (b"BZh", bz2.open),
+)
+
+
+class ParseError(ValueError):
+    """
+    Raised when a project data stream contains a malformed line or section.
+
+    Attributes:
+        line_number (int): The 1-based number of the offending line in the stream.
+        line (str): The offending line, stripped.
+    """
+
+    def __init__(self, message, line_number, line=""):
+        super().__init__(f"line {line_number}: {message}" + (f" ({line!r})" if line else ""))
+        self.message = message
+        self.line_number = line_number
+        self.line = line
+
+    def __reduce__(self):
+        # Keep the error picklable, so it can cross process pool boundaries
+        return ParseError, (self.message, self.line_number, self.line)
+
+
+def open_project_file(file_path: str):
+    """
+    Opens a project data file for reading as text, decompressing it transparently.
+
+    Compression (gzip, xz or bzip2) is detected from the first bytes of the file, not from the
+    extension. The content is decompressed on the fly while reading, never all at once.
+
+    Args:
+        file_path (str): Path to a plain or compressed project data file.
+
+    Returns:
+        A text file object, to be closed by the caller (e.g., with a `with` statement).
+    """
+    with open(file_path, "rb") as file:
+        magic = file.read(6)
+
+    for prefix, opener in COMPRESSIONS:
+        if magic.startswith(prefix):
+            return io.TextIOWrapper(opener(file_path, "rb"), encoding="utf-8")
+
+    return open(file_path, "r")
+
+
+# Column prefix of each resource category, in the order the columns appear
+RESOURCE_KINDS = (
+    ("renewable", "R"),
+    ("nonrenewable", "N"),
+    ("doubly_constrained", "D"),
+)
+
+
+@lru_cache(maxsize=None)
+def _resource_names(renewable: int, nonrenewable: int, doubly: int, columns: int) -> tuple:
+    """
+    Names the resource columns of the durations section (e.g., R1, R2, N1).
+
+    Columns follow the resource counts of the general information. If the counts do not add up
+    to the number of columns, every column is treated as a renewable resource. Names are
+    interned, so every job shares a single copy of each key.
+    """
+    counts = (renewable, nonrenewable, doubly)
+    if sum(counts) != columns:
+        counts = (columns, 0, 0)
+
+    return tuple(
+        sys.intern(f"{prefix}{i + 1}")
+        for (_, prefix), count in zip(RESOURCE_KINDS, counts)
+        for i in range(count)
+    )
+
+
+def _resource_kind(name: str) -> str:
+    """
+    Returns the category of a resource from the prefix of its name (e.g., "N1" is nonrenewable).
+    """
+    for kind, prefix in RESOURCE_KINDS:
+        if name.startswith(prefix):
+            return kind
+    return "renewable"
+
+
+def _parse_line(data: ProjectData, section: str, line: str):
+    """
+    Parses one data line of a section into the project data.
+
+    Raises:
+        ValueError: If the line does not match the layout of its section.
+    """
+    match section:
+        case "general_info":
+            if "projects" in line:
+                data.general_info = GeneralInformation(
+                    int(line.split(":")[1].strip()),
+                    jobs=0,
+                    horizon=0,
+                    renewable_resources=0,
+                    nonrenewable_resources=0,
+                    doubly_constrained_resources=0,
+                )
+            elif data.general_info is None:
+                raise ValueError("general information must start with the projects count")
+            elif "jobs" in line:
+                data.general_info.jobs = int(line.split(":")[1].strip())
+            elif "horizon" in line:
+                data.general_info.horizon = int(line.split(":")[1].strip())
+            elif line.startswith("- renewable"):
+                data.general_info.resources["renewable"] = int(
+                    line.split(":")[1].split()[0].strip()
+                )
+            elif line.startswith("- nonrenewable"):
+                data.general_info.resources["nonrenewable"] = int(
+                    line.split(":")[1].split()[0].strip()
+                )
+            elif line.startswith("- doubly constrained"):
+                data.general_info.resources["doubly_constrained"] = int(
+                    line.split(":")[1].split()[0].strip()
+                )
+
+        case "projects_summary":
+            # Skip header line
+            if line.startswith("pronr."):
+                return
+
+            splits = line.split()
+            if len(splits) != 6:
+                raise ValueError(f"expected 6 columns, found {len(splits)}")
+
+            data.projects_summary.append(
+                ProjectSummary(
+                    project_number=int(splits[0]),
+                    jobs=int(splits[1]),
+                    release_date=int(splits[2]),
+                    due_date=int(splits[3]),
+                    tardiness_cost=int(splits[4]),
+                    mpm_time=int(splits[5]),
+                )
+            )
+
+        case "precedence_relations":
+            # Skip header line
+            if line.startswith("#jobnr."):
+                return
+
+            splits = line.split()
+            successors = list(map(int, splits[3:]))
+            if len(splits) < 3 or int(splits[2]) != len(successors):
+                raise ValueError("successor count does not match the successors listed")
+
+            data.precedence_relations.append(
+                Job(job_number=int(splits[0]), successors=successors, modes=int(splits[1]))
+            )
+
+        case "durations_resources":
+            # Skip header line
+            if line.startswith("#jobnr."):
+                return
+
+            splits = line.split()
+
+            # Further modes of a job may omit the job number (multi-mode PSPLIB layout)
+            if data.modes and len(splits) == len(data.modes[0][0].resources) + 2:
+                splits = [str(data.modes[-1][0].job_number)] + splits
+            elif len(splits) < 3 or (
+                data.modes and len(splits) != len(data.modes[0][0].resources) + 3
+            ):
+                raise ValueError("expected job number, mode, duration and one column per resource")
+
+            if data.general_info is None:
+                raise ValueError("durations must come after the general information")
+
+            info = data.general_info.resources
+            names = _resource_names(
+                info["renewable"],
+                info["nonrenewable"],
+                info["doubly_constrained"],
+                len(splits) - 3,
+            )
+
+            duration_resource = DurationResource(
+                job_number=int(splits[0]),
+                mode=int(splits[1]),
+                duration=int(splits[2]),
+                resources=dict(zip(names, map(int, splits[3:]))),
+            )
+
+            # The first mode of every job is also kept in durations_resources
+            if data.modes and data.modes[-1][0].job_number == duration_resource.job_number:
+                data.modes[-1].append(duration_resource)
+            else:
+                data.modes.append([duration_resource])
+                data.durations_resources.append(duration_resource)
+
+        case "resource_availability":
+            # Skip header line
+            if line.startswith("#resource"):
+                return
+
+            splits = line.split()
+            if len(splits) != 2:
+                raise ValueError(f"expected 2 columns, found {len(splits)}")
+
+            name = splits[0]
+            data.resource_availability[name] = ResourceAvailability(
+                resource_name=name, quantity=int(splits[1]), kind=_resource_kind(name)
+            )
+
+
+def _check_project(data: ProjectData, line_number: int):
+    """
+    Checks that the sections of a complete project are consistent with each other.
+
+    Raises:
+        ParseError: If a section is missing or refers to unknown jobs or resources.
+    """
+    if data.general_info is None:
+        raise ParseError("project has no general information section", line_number)
+
+    jobs = {job.job_number for job in data.precedence_relations}
+    if jobs != {dr.job_number for dr in data.durations_resources}:
+        raise ParseError(
+            "precedence relations and durations do not list the same jobs", line_number
+        )
+
+    for job in data.precedence_relations:
+        unknown = set(job.successors) - jobs
+        if unknown:
+            raise ParseError(
+                f"job {job.job_number} has unknown successors {sorted(unknown)}", line_number
+            )
+
+    for dr in (dr for job_modes in data.modes for dr in job_modes):
+        unknown = set(dr.resources) - set(data.resource_availability)
+        if unknown:
+            raise ParseError(
+                f"job {dr.job_number} uses unknown resources {sorted(unknown)}", line_number
+            )
+
+
+def iter_projects(file) -> Iterator[ProjectData]:
+    """
+    Parses a stream holding one or more concatenated projects, yielding them one at a time.
+
+    A new project starts at every "#General Information" section, so only the project being
+    read is kept in memory. Every line must belong to a known section and match its layout,
+    otherwise a ParseError pointing at the line is raised.
+
+    Args:
+        file: An open text file object (see open_project_file for compressed files).
+
+    Yields:
+        ProjectData: Parsed data of each project, in stream order.
+
+    Raises:
+        ParseError: If a line or a section is malformed.
+    """
+    data = ProjectData()
+    # Track the file section
+    section = None
+    started = False
+    line_number = 0
+
+    for line_number, line in enumerate(file, start=1):
+        line = line.strip()
+
+        # Skip ornament and invalid
+        if line.startswith("**") or not line:
+            continue
+
+        if line in SECTIONS:
+            # A new general information section closes the previous project
+            if line == "#General Information" and started:
+                _check_project(data, line_number - 1)
+                yield data
+                data = ProjectData()
+
+            section = SECTIONS[line]
+            started = True
+            continue
+
+        if section is None:
+            raise ParseError("data outside of any section", line_number, line)
+
+        try:
+            _parse_line(data, section, line)
+        except (ValueError, IndexError) as error:
+            raise ParseError(f"malformed {section} line: {error}", line_number, line) from error
+
+    if started:
+        _check_project(data, line_number)
+        yield data
+
+
+def iter_project_file(file_path: str) -> Iterator[ProjectData]:
+    """
+    Yields every project of a plain or compressed project data file, one at a time.
+
+    Args:
+        file_path (str): Path to the project data file.
+
+    Yields:
+        ProjectData: Parsed data of each project, in file order.
+    """
+    with open_project_file(file_path) as file:
+        yield from iter_projects(file)
@@ -0,0 +1,119 @@
+import numpy as np
+
+
+class ProjectArrays:
+    """
+    Columnar view of a project, with one row per job in `durations_resources` order.
+
+    The record classes are convenient to read but every lookup goes through Python objects and
+    string keys. This view stores the same information as NumPy arrays, and the precedence graph
+    in compressed sparse row (CSR) form: the successors of row i are
+    successor_rows[successor_offsets[i]:successor_offsets[i + 1]].
+
+    The view describes the first mode of every job and only the resources that are limited per
+    time unit (renewable and doubly constrained), which is what the single-mode solvers schedule.
+
+    Attributes:
+        resource_names (list[str]): Names of the per time unit resources, in
+                                    `resource_availability` order.
+        job_numbers (np.ndarray): Job number of each row.
+        job_keys (list[str]): Solution key ("job_N") of each row.
+        durations (np.ndarray): Duration of each job.
+        demands (np.ndarray): Demand matrix of shape (jobs, resources).
+        capacities (np.ndarray): Available quantity of each resource.
+        successor_offsets (np.ndarray): CSR offsets of the successors, of length jobs + 1.
+        successor_rows (np.ndarray): Rows of the successors of every job, concatenated.
+        predecessor_offsets (np.ndarray): CSR offsets of the predecessors, of length jobs + 1.
+        predecessor_rows (np.ndarray): Rows of the predecessors of every job, concatenated.
+    """
+
+    __slots__ = (
+        "resource_names",
+        "job_numbers",
+        "job_keys",
+        "durations",
+        "demands",
+        "capacities",
+        "successor_offsets",
+        "successor_rows",
+        "predecessor_offsets",
+        "predecessor_rows",
+    )
+
+    def __init__(self, data):
+        """
+        Args:
+            data (ProjectData): The project data to convert.
+        """
+        self.resource_names = [
+            name
+            for name, availability in data.resource_availability.items()
+            if availability.kind != "nonrenewable"
+        ]
+        jobs = len(data.durations_resources)
+
+        self.job_numbers = np.array(
+            [dr.job_number for dr in data.durations_resources], dtype=np.int64
+        )
+        self.job_keys = [f"job_{number}" for number in self.job_numbers.tolist()]
+        self.durations = np.array(
+            [dr.duration for dr in data.durations_resources], dtype=np.int64
+        )
+        self.demands = np.array(
+            [
+                [dr.resources.get(name, 0) for name in self.resource_names]
+                for dr in data.durations_resources
+            ],
+            dtype=np.int64,
+        ).reshape(jobs, len(self.resource_names))
+        self.capacities = np.array(
+            [data.resource_availability[name].quantity for name in self.resource_names],
+            dtype=np.int64,
+        )
+
+        # Precedence edges as (job row, successor row) pairs
+        rows = {number: row for row, number in enumerate(self.job_numbers.tolist())}
+        sources = []
+        targets = []
+        for job in data.precedence_relations:
+            for successor in job.successors:
+                sources.append(rows[job.job_number])
+                targets.append(rows[successor])
+
+        sources = np.array(sources, dtype=np.int64)
+        targets = np.array(targets, dtype=np.int64)
+
+        self.successor_offsets, self.successor_rows = self._csr(sources, targets, jobs)
+        self.predecessor_offsets, self.predecessor_rows = self._csr(targets, sources, jobs)
+
+    @staticmethod
+    def _csr(sources: np.ndarray, targets: np.ndarray, jobs: int):
+        """
+        Builds the CSR offsets and neighbour rows of a list of edges.
+        """
+        order = np.argsort(sources, kind="stable")
+        offsets = np.zeros(jobs + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum(np.bincount(sources, minlength=jobs))
+        return offsets, targets[order]
+
+    def successors(self, row: int) -> np.ndarray:
+        """
+        Returns the rows of the direct successors of a job.
+        """
+        return self.successor_rows[self.successor_offsets[row] : self.successor_offsets[row + 1]]
+
+    def predecessors(self, row: int) -> np.ndarray:
+        """
+        Returns the rows of the direct predecessors of a job.
+        """
+        return self.predecessor_rows[
+            self.predecessor_offsets[row] : self.predecessor_offsets[row + 1]
+        ]
+
+    def successor_lists(self) -> list[list[int]]:
+        """
+        Returns the successor rows of every job as plain Python lists, for tight Python loops.
+        """
+        rows = self.successor_rows.tolist()
+        offsets = self.successor_offsets.tolist()
+        return [rows[offsets[row] : offsets[row + 1]] for row in range(len(offsets) - 1)]
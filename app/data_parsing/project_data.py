@@ -5,6 +5,7 @@ from . import (
     DurationResource,
     ResourceAvailability,
 )
+from .project_arrays import ProjectArrays
 
 
 # Definition for data loaded
@@ -16,8 +17,12 @@ class ProjectData:
         general_info (GeneralInformation): Metadata about the project, such as the number of jobs and resources.
         projects_summary (list[ProjectSummary]): A list summarizing project details like release dates and deadlines.
         precedence_relations (list[Job]): A list of jobs and their precedence relationships.
-        durations_resources (list[DurationResource]): A list of job durations and their resource requirements.
+        durations_resources (list[DurationResource]): A list of job durations and their resource requirements,
+                                                      in the first listed mode of each job.
+        modes (list[list[DurationResource]]): Every mode of each job, in the same order as durations_resources.
         resource_availability (dict[str, ResourceAvailability]): A dictionary mapping resource names to their availability.
+        arrays (ProjectArrays): Columnar view of the jobs, built on first access. Call reset_arrays()
+                                after modifying the data so the view is rebuilt.
     """
 
     def __init__(self):
@@ -25,4 +30,28 @@ class ProjectData:
         self.projects_summary: list[ProjectSummary] = []
         self.precedence_relations: list[Job] = []
         self.durations_resources: list[DurationResource] = []
+        self.modes: list[list[DurationResource]] = []
         self.resource_availability: dict[str, ResourceAvailability] = {}
+        self._arrays: ProjectArrays = None
+        self._fingerprints: dict[bool, str] = {}
+
+    @property
+    def is_multimode(self) -> bool:
+        """
+        True if at least one job can be executed in more than one mode.
+        """
+        return any(len(job_modes) > 1 for job_modes in self.modes)
+
+    @property
+    def arrays(self) -> ProjectArrays:
+        if self._arrays is None:
+            self._arrays = ProjectArrays(self)
+        return self._arrays
+
+    def reset_arrays(self):
+        """
+        Drops the cached columnar view and content fingerprints, so they are rebuilt from the
+        current data on next access.
+        """
+        self._arrays = None
+        self._fingerprints = {}
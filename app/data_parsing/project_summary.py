@@ -11,6 +11,15 @@ class ProjectSummary:
         mpm_time (int): The minimum project makespan time.
     """
 
+    __slots__ = (
+        "project_number",
+        "jobs",
+        "release_date",
+        "due_date",
+        "tardiness_cost",
+        "mpm_time",
+    )
+
     def __init__(
         self, project_number, jobs, release_date, due_date, tardiness_cost, mpm_time
     ):
@@ -4,9 +4,16 @@ class ResourceAvailability:
 
     Attributes:
         resource_name (str): The name or identifier of the resource.
-        quantity (int): The total available quantity of the resource.
+        quantity (int): The total available quantity of the resource. For renewable resources it
+                        is available at every time unit, for nonrenewable resources it is the
+                        budget for the whole project.
+        kind (str): The resource category, one of "renewable", "nonrenewable" or
+                    "doubly_constrained" (the keys of GeneralInformation.resources).
     """
 
-    def __init__(self, resource_name, quantity):
+    __slots__ = ("resource_name", "quantity", "kind")
+
+    def __init__(self, resource_name, quantity, kind="renewable"):
         self.resource_name = resource_name
         self.quantity = quantity
+        self.kind = kind
@@ -0,0 +1,77 @@
+from . import ProjectData
+
+SEPARATOR = "*" * 72
+
+
+def format_project(data: ProjectData) -> str:
+    """
+    Formats a project in the text layout read by parse_file.
+
+    Every mode of each job is written (from ProjectData.modes when available), so multi-mode
+    projects round-trip as well.
+
+    Args:
+        data (ProjectData): The project data.
+
+    Returns:
+        str: The project in the project data text format.
+    """
+    info = data.general_info
+    resources = info.resources
+    names = list(data.resource_availability)
+    modes = data.modes or [[dr] for dr in data.durations_resources]
+
+    lines = [
+        SEPARATOR,
+        "#General Information",
+        f"projects:  {info.projects}",
+        f"jobs (incl. supersource/sink ):  {info.jobs}",
+        f"horizon:  {info.horizon}",
+        "RESOURCES",
+        f"  - renewable  :  {resources['renewable']}   R",
+        f"  - nonrenewable  :  {resources['nonrenewable']}   N",
+        f"  - doubly constrained  :  {resources['doubly_constrained']}   D",
+        SEPARATOR,
+        "#Projects summary",
+        "pronr. \t#jobs \trel.date \tduedate \ttardcost \tMPM-Time",
+    ]
+    lines.extend(
+        f" {s.project_number}  {s.jobs}  {s.release_date}  {s.due_date}  "
+        f"{s.tardiness_cost}  {s.mpm_time}"
+        for s in data.projects_summary
+    )
+
+    lines += [SEPARATOR, "#Precedence relations", "#jobnr.    #modes  #successors   successors"]
+    lines.extend(
+        f"   {job.job_number}  {job.modes}  {len(job.successors)}  "
+        + "  ".join(map(str, job.successors))
+        for job in data.precedence_relations
+    )
+
+    lines += [SEPARATOR, "#Duration and resources", "#jobnr. mode duration   " + "  ".join(names)]
+    lines.extend(
+        f"  {dr.job_number}  {dr.mode}  {dr.duration}  "
+        + "  ".join(str(dr.resources.get(name, 0)) for name in names)
+        for job_modes in modes
+        for dr in job_modes
+    )
+
+    lines += [SEPARATOR, "#Resource availability", "#resource   qty"]
+    lines.extend(
+        f"{name}  {availability.quantity}"
+        for name, availability in data.resource_availability.items()
+    )
+    lines.append(SEPARATOR)
+
+    return "\n".join(lines) + "\n"
+
+
+def write_project(data: ProjectData, file):
+    """
+    Writes a project to an open text file in the layout read by parse_file.
+
+    Args:
+        data (ProjectData): The project data.
+        file: An open text file object.
+    """
+    file.write(format_project(data))
@@ -1,2 +1,4 @@
 from .data_inspection import load_data_and_inspect
+from .data_loading import load_data, infer_schema, downcast, DatasetStatistics
+from .model_serving import save_model, load_model, predict_in_batches, MicroBatcher, serve_jsonl, serve_http
 from .sleep_data_visualization import sleep_data_visualization
\ No newline at end of file
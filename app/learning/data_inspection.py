@@ -3,25 +3,29 @@ import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
 
+from .data_loading import load_data, DatasetStatistics
 
-def load_data_and_inspect(csv_path: str)-> pd.DataFrame:
+
+def load_data_and_inspect(csv_path: str, **load_options)-> pd.DataFrame:
 	print(f"Loading data from ({csv_path})\n")
 
-	df = pd.read_csv(csv_path)
+	# The statistics are accumulated while the file is streamed, in a compact typed frame
+	statistics = DatasetStatistics()
+	df = load_data(csv_path, statistics=statistics, **load_options)
 	
 	# Check the shape of the dataset (number of rows and columns)
 	print(f"-- Dataset Shape: {df.shape[0]} rows, {df.shape[1]} columns\n")
 	
 	# Get general info about the dataset, including data types and non-null counts
-	print(f"\nDataset Info\n {df.info()}\n")
+	print(f"\nDataset Info\n{statistics.info()}\nMemory usage: {statistics.memory / 2 ** 20:.1f} MB\n")
 	
 	# Check for missing values
-	print(f"Missing values in dataset\n {df.isnull().sum()}\n")
+	print(f"Missing values in dataset\n {statistics.missing()}\n")
 
 	# Display the first 5 rows of the dataset
 	print(f"Head data:\n{df.head()}\n")
 
 	# Describe the numeric columns for basic statistics
-	print(f"Descriptive Statistics\n{df.describe()}\n")
+	print(f"Descriptive Statistics\n{statistics.describe()}\n")
 
-	return df
\ No newline at end of file
+	return df
@@ -0,0 +1,201 @@
+import hashlib
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_float_dtype, is_integer_dtype, is_string_dtype, is_object_dtype
+
+
+# Bump when the conversions change, so older cached frames are not reused
+SCHEMA_VERSION = 1
+
+
+def infer_schema(sample: pd.DataFrame, max_category_ratio: float = 0.5) -> dict:
+	# Text columns of the sample are either dates (almost every value parses as an ISO 8601
+	# date) or categories (few distinct values), the others stay text
+	schema = {'dates': [], 'categories': []}
+
+	for column in sample.columns:
+		values = sample[column]
+		if not (is_string_dtype(values) or is_object_dtype(values)):
+			continue
+		values = values.dropna()
+		if values.empty:
+			continue
+
+		parsed = pd.to_datetime(values, errors='coerce', format='ISO8601')
+		if parsed.notna().mean() >= 0.95:
+			schema['dates'].append(column)
+		elif values.nunique() <= len(values) * max_category_ratio:
+			schema['categories'].append(column)
+
+	return schema
+
+
+def downcast(values: pd.Series) -> pd.Series:
+	# Integers take the smallest type holding their range, floats become float32 only when no
+	# value changes
+	if is_integer_dtype(values):
+		return pd.to_numeric(values, downcast='integer')
+
+	if is_float_dtype(values) and values.dtype != np.float32:
+		single = values.astype(np.float32)
+		if np.array_equal(single.to_numpy(np.float64), values.to_numpy(), equal_nan=True):
+			return single
+
+	return values
+
+
+def convert_types(df: pd.DataFrame, schema: dict) -> pd.DataFrame:
+	for column in schema['dates']:
+		df[column] = pd.to_datetime(df[column], errors='coerce', format='ISO8601')
+	for column in schema['categories']:
+		df[column] = df[column].astype('category')
+	for column in df.select_dtypes(include='number').columns:
+		df[column] = downcast(df[column])
+	return df
+
+
+class DatasetStatistics:
+	# Column statistics accumulated chunk by chunk: non-null counts, and the count, mean,
+	# sum of squared deviations (merged with Chan's formula), minimum and maximum of the
+	# numeric columns
+
+	def __init__(self):
+		self.rows = 0
+		self.non_null = None
+		self.dtypes = None
+		self.memory = 0
+		self.moments = None
+
+	def update(self, chunk: pd.DataFrame):
+		self.rows += len(chunk)
+		self.dtypes = chunk.dtypes
+		self.memory += int(chunk.memory_usage(deep=True).sum())
+
+		counts = chunk.notna().sum()
+		self.non_null = counts if self.non_null is None else self.non_null + counts
+
+		numeric = chunk.select_dtypes(include='number').astype(np.float64)
+		mean = numeric.mean()
+		moments = pd.DataFrame({
+			'count': numeric.count().astype(np.float64),
+			'mean': mean,
+			'm2': ((numeric - mean) ** 2).sum(),
+			'min': numeric.min(),
+			'max': numeric.max()
+		})
+
+		if self.moments is None:
+			self.moments = moments
+			return
+
+		index = self.moments.index.union(moments.index, sort=False)
+		previous = self.moments.reindex(index)
+		moments = moments.reindex(index)
+		count_a, count_b = previous['count'].fillna(0), moments['count'].fillna(0)
+		mean_a, mean_b = previous['mean'].fillna(0), moments['mean'].fillna(0)
+		count = count_a + count_b
+
+		self.moments = pd.DataFrame({
+			'count': count,
+			'mean': (mean_a * count_a + mean_b * count_b) / count,
+			'm2': previous['m2'].fillna(0) + moments['m2'].fillna(0) + ((mean_b - mean_a) ** 2 * count_a * count_b / count).fillna(0),
+			'min': np.fmin(previous['min'], moments['min']),
+			'max': np.fmax(previous['max'], moments['max'])
+		})
+
+	def info(self) -> pd.DataFrame:
+		return pd.DataFrame({'non-null': self.non_null, 'dtype': self.dtypes.astype(str)})
+
+	def missing(self) -> pd.Series:
+		return self.rows - self.non_null
+
+	def describe(self) -> pd.DataFrame:
+		moments = self.moments
+		std = np.sqrt(moments['m2'] / (moments['count'] - 1)).where(moments['count'] > 1)
+		return pd.DataFrame({
+			'count': moments['count'],
+			'mean': moments['mean'],
+			'std': std,
+			'min': moments['min'],
+			'max': moments['max']
+		}).T
+
+
+def cache_path(csv_path: str, cache_dir: str, options: dict) -> str:
+	# The key changes with the file contents (size and modification time) and the load options
+	stat = os.stat(csv_path)
+	key = repr((os.path.abspath(csv_path), stat.st_size, stat.st_mtime_ns, sorted(options.items()), SCHEMA_VERSION))
+	name = os.path.splitext(os.path.basename(csv_path))[0]
+	return os.path.join(cache_dir, f"{name}-{hashlib.sha1(key.encode()).hexdigest()[:16]}.feather")
+
+
+def load_data(
+	csv_path: str,
+	chunksize: int = 100_000,
+	sample_rows: int = 10_000,
+	cache_dir: str | None = '.cache/datasets',
+	statistics: DatasetStatistics | None = None,
+	**read_csv_options
+) -> pd.DataFrame:
+	# Reads a CSV into a compact frame: the schema is inferred from the first rows, the file is
+	# streamed in chunks converted one at a time, so the untyped frame never exists as a whole.
+	# The typed frame is cached as Feather (when pyarrow is installed), later loads read it back
+	# directly. The statistics, if given, are accumulated from the chunks
+	path = None
+	if cache_dir is not None:
+		path = cache_path(csv_path, cache_dir, dict(read_csv_options, sample_rows=sample_rows))
+		if os.path.exists(path):
+			try:
+				df = pd.read_feather(path)
+			except ImportError:
+				path = None
+			else:
+				if statistics is not None:
+					statistics.update(df)
+				return df
+
+	schema = infer_schema(pd.read_csv(csv_path, nrows=sample_rows, **read_csv_options))
+
+	chunks = []
+	with pd.read_csv(csv_path, chunksize=chunksize, **read_csv_options) as reader:
+		for chunk in reader:
+			chunk = convert_types(chunk, schema)
+			if statistics is not None:
+				statistics.update(chunk)
+			chunks.append(chunk)
+
+	# Chunks only share a categorical dtype if they have the same categories
+	for column in schema['categories']:
+		categories = pd.Index(sorted(set().union(*(chunk[column].cat.categories for chunk in chunks))))
+		for chunk in chunks:
+			chunk[column] = chunk[column].cat.set_categories(categories)
+
+	df = pd.concat(chunks, ignore_index=True)
+	del chunks
+
+	# A chunk with missing values turns a column to float, downcast again on the whole column
+	for column in df.select_dtypes(include='number').columns:
+		df[column] = downcast(df[column])
+	if statistics is not None:
+		statistics.dtypes = df.dtypes
+		statistics.memory = int(df.memory_usage(deep=True).sum())
+
+	# Written to a temporary file renamed into place, so an interrupted write never leaves a
+	# truncated cache behind
+	if path is not None:
+		os.makedirs(cache_dir, exist_ok=True)
+		descriptor, temp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+		try:
+			with os.fdopen(descriptor, 'wb') as temp_file:
+				df.to_feather(temp_file)
+			os.replace(temp_path, path)
+		except ImportError:
+			pass
+		finally:
+			if os.path.exists(temp_path):
+				os.remove(temp_path)
+
+	return df
@@ -0,0 +1,201 @@
+import json
+import os
+import queue
+import sys
+import threading
+import time
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import joblib
+import numpy as np
+import pandas as pd
+
+
+def save_model(artifact: dict, path: str) -> str:
+	# Saved uncompressed, so the arrays of the fitted pipeline can be memory-mapped on load
+	directory = os.path.dirname(path)
+	if directory:
+		os.makedirs(directory, exist_ok=True)
+	joblib.dump(artifact, path, compress=0)
+	return path
+
+
+def load_model(path: str, mmap_mode: str | None = 'r') -> dict:
+	# With mmap_mode='r' the arrays are read-only views of the file, every process loading the
+	# same artifact shares their pages instead of holding its own copy
+	return joblib.load(path, mmap_mode=mmap_mode)
+
+
+def predict_in_batches(pipeline, X, batch_size: int = 100_000) -> np.ndarray:
+	# Each batch goes through the pipeline in one vectorised call, while the intermediate
+	# (one-hot encoded, scaled) arrays only ever hold batch_size rows
+	if len(X) <= batch_size:
+		return np.asarray(pipeline.predict(X))
+
+	return np.concatenate([
+		np.asarray(pipeline.predict(X[start:start + batch_size]))
+		for start in range(0, len(X), batch_size)
+	])
+
+
+def records_frame(records: list[dict], columns: list[str], numeric_columns: list[str] | None = None) -> pd.DataFrame:
+	# Missing features are NaN, the imputers of the pipeline fill them like in training. A column
+	# that is null in every record would be an object column of None, which the imputers do not
+	# see as missing, so numeric columns are cast (a non-numeric value raises) and nulls are NaN
+	df = pd.DataFrame.from_records(records, columns=columns)
+	for column in numeric_columns or []:
+		df[column] = df[column].astype(np.float64)
+	return df.where(df.notna(), np.nan)
+
+
+class MicroBatcher:
+	# Collects the records submitted by concurrent requests and predicts them together: a batch
+	# is sent as soon as it has max_batch_size records or its first record waited max_delay
+	# seconds, so a single request is only delayed by max_delay
+
+	def __init__(
+		self,
+		pipeline,
+		columns: list[str],
+		max_batch_size: int = 256,
+		max_delay: float = 0.002,
+		numeric_columns: list[str] | None = None
+	):
+		self.pipeline = pipeline
+		self.columns = columns
+		self.numeric_columns = numeric_columns
+		self.max_batch_size = max_batch_size
+		self.max_delay = max_delay
+		self.requests = queue.Queue()
+		self.thread = threading.Thread(target=self.run, daemon=True)
+		self.thread.start()
+
+	def submit(self, record: dict) -> Future:
+		future = Future()
+		self.requests.put((record, future))
+		return future
+
+	def predict(self, records: list[dict]) -> list[float]:
+		return predict_in_batches(self.pipeline, records_frame(records, self.columns, self.numeric_columns)).tolist()
+
+	def run(self):
+		while True:
+			batch = [self.requests.get()]
+			deadline = time.monotonic() + self.max_delay
+			while len(batch) < self.max_batch_size:
+				remaining = deadline - time.monotonic()
+				if remaining <= 0:
+					break
+				try:
+					batch.append(self.requests.get(timeout=remaining))
+				except queue.Empty:
+					break
+
+			records = [record for record, _ in batch]
+			try:
+				predictions = self.predict(records)
+			except Exception:
+				# One invalid record must not fail the others, retry them one by one
+				for record, future in batch:
+					try:
+						future.set_result(self.predict([record])[0])
+					except Exception as error:
+						future.set_exception(error)
+			else:
+				for (_, future), prediction in zip(batch, predictions):
+					future.set_result(prediction)
+
+
+def serve_jsonl(batcher: MicroBatcher, input_stream=sys.stdin, output_stream=sys.stdout):
+	# One JSON record per input line, one {"prediction": ...} (or {"error": ...}) per output
+	# line in the same order. Lines are submitted as they are read, so records arriving together
+	# are predicted in one batch
+	futures = queue.Queue()
+
+	def write_results():
+		while True:
+			future = futures.get()
+			if future is None:
+				return
+			try:
+				response = {'prediction': future.result()}
+			except Exception as error:
+				response = {'error': str(error)}
+			output_stream.write(json.dumps(response) + '\n')
+			if futures.empty():
+				output_stream.flush()
+
+	writer = threading.Thread(target=write_results)
+	writer.start()
+
+	for line in input_stream:
+		if not line.strip():
+			continue
+		try:
+			futures.put(batcher.submit(json.loads(line)))
+		except json.JSONDecodeError as error:
+			failed = Future()
+			failed.set_exception(error)
+			futures.put(failed)
+
+	futures.put(None)
+	writer.join()
+	output_stream.flush()
+
+
+def make_handler(batcher: MicroBatcher, info: dict):
+	class PredictionHandler(BaseHTTPRequestHandler):
+		# POST /predict with a JSON record answers with its prediction, single records of
+		# concurrent requests are micro-batched. A list of records is already a batch and is
+		# predicted at once. GET /health describes the served model
+
+		def send_json(self, status: int, body: dict):
+			payload = json.dumps(body).encode()
+			self.send_response(status)
+			self.send_header('Content-Type', 'application/json')
+			self.send_header('Content-Length', str(len(payload)))
+			self.end_headers()
+			self.wfile.write(payload)
+
+		def do_GET(self):
+			if self.path == '/health':
+				self.send_json(200, info)
+			else:
+				self.send_json(404, {'error': f"Unknown path {self.path}"})
+
+		def do_POST(self):
+			if self.path != '/predict':
+				self.send_json(404, {'error': f"Unknown path {self.path}"})
+				return
+
+			try:
+				body = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))))
+				if isinstance(body, list):
+					self.send_json(200, {'predictions': batcher.predict(body)})
+				else:
+					self.send_json(200, {'prediction': batcher.submit(body).result()})
+			except Exception as error:
+				self.send_json(400, {'error': str(error)})
+
+		def log_message(self, format, *args):
+			pass
+
+	return PredictionHandler
+
+
+def serve_http(batcher: MicroBatcher, info: dict, host: str = '127.0.0.1', port: int = 8000, server=None):
+	# Serves until interrupted. A server created beforehand (e.g., a socket shared by forked
+	# workers) can be passed in, its handler is replaced by this worker's
+	if server is None:
+		server = ThreadingHTTPServer((host, port), make_handler(batcher, info))
+	else:
+		server.RequestHandlerClass = make_handler(batcher, info)
+	server.daemon_threads = True
+
+	try:
+		server.serve_forever()
+	except KeyboardInterrupt:
+		pass
+	finally:
+		server.server_close()
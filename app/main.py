@@ -2,13 +2,12 @@
 Script for solving constraint satisfaction problems (CSPs) using different solver types.
 
 This script reads project data from a file, parses it, and solves the CSP using either 
-Python's constraint library or OR-Tools, depending on the specified solver type. It logs 
-the solution and execution time.
+Python's constraint library, OR-Tools or a schedule generation heuristic, depending on the 
+specified solver type. It logs the solution and execution time.
 
 Modules:
     - time: Used for tracking execution time.
     - logging: Logs execution details and solutions.
-    - ortools.sat.python.cp_model: Used for solving CSPs with Google's OR-Tools.
     - data_parsing: Custom module for parsing project data from files.
     - csp_solvers: Custom module for defining and solving CSPs using different approaches.
 
@@ -18,6 +17,8 @@ Functions:
 Solver Types:
     - PYTHON_CONSTRAINT: Solves the problem using Python's constraint library.
     - OR_TOOLS: Solves the problem using Google's OR-Tools library.
+    - HEURISTIC: Builds a schedule with serial or parallel schedule generation schemes.
+    - PORTFOLIO: Races the solvers above in parallel processes and keeps the best schedule.
 
 Usage:
     - Ensure the `data_parsing` and `csp_solvers` modules are correctly implemented and available.
@@ -28,10 +29,8 @@ Usage:
 import time
 import logging
 
-from ortools.sat.python import cp_model
-
 from data_parsing import parse_file, ProjectData
-from csp_solvers import SolverType, process_solution
+from csp_solvers import SolverType, DueDateMode, SolutionCache, process_solution, validate
 
 logger = logging.getLogger()
 logger.setLevel(logging.DEBUG)
@@ -42,12 +41,13 @@ def main():
     Main function to solve the scheduling problem using the specified solver.
 
     It loads project data from a file, defines the scheduling problem, and solves it using either the
-    Python-Constraint solver or the OR-Tools solver based on the specified solver type. The solution
-    is then logged, along with the time taken to find the solution and the total execution time.
+    Python-Constraint solver, the OR-Tools solver or the heuristic solver based on the specified
+    solver type. The solution is then logged, along with the time taken to find the solution and
+    the total execution time.
 
     The function performs the following steps:
     1. Loads project data from a specified file.
-    2. Chooses the solver type (either PYTHON_CONSTRAINT or OR_TOOLS).
+    2. Chooses the solver type (PYTHON_CONSTRAINT, OR_TOOLS or HEURISTIC) and the due date mode.
     3. Defines the problem using the chosen solver.
     4. Solves the problem and extracts the solution.
     5. Logs the time taken to find the solution and the execution time.
@@ -56,28 +56,116 @@ def main():
     start_time = time.time()
 
     solver_type: SolverType = SolverType.OR_TOOLS
-    file_path = "data/p01_dataset_8.txt"
+    due_date_mode: DueDateMode = DueDateMode.IGNORE
 
-    with open(file_path, "r") as file:
-        proj_data: ProjectData = parse_file(file)
-        solution = {}
+    # OR-Tools search settings: 0 workers uses every core, None disables the limit
+    num_search_workers = 0
+    max_time = 60.0
+    relative_gap = None
+
+    # Warm-start OR-Tools from a heuristic schedule
+    warm_start = False
 
-        match solver_type:
-            case SolverType.PYTHON_CONSTRAINT:
-                from csp_solvers import python_constraint
+    # Add redundant constraints to the OR-Tools model to speed up optimality proofs
+    strengthen = False
 
-                problem = python_constraint.define_problem(proj_data)
-                solution = problem.getSolution()
+    # Seconds of local search improving the schedule found (0 disables it)
+    improve_time = 0.0
 
-            case SolverType.OR_TOOLS:
-                from csp_solvers import ortools
+    # Reuse schedules of previously solved projects stored in this file (None disables it)
+    solution_cache_path = None
 
-                model, start_times = ortools.define_problem(proj_data)
-                solver = cp_model.CpSolver()
+    file_path = "data/p01_dataset_8.txt"
+
+    with open(file_path, "r") as file:
+        proj_data: ProjectData = parse_file(file)
+        solution = {}
 
-                status = solver.Solve(model)
-                if status in (cp_model.OPTIMAL, cp_model.FEASIBLE):
-                    solution = ortools.extract_solution(solver, start_times, proj_data)
+        cache = None
+        cached = None
+        if solution_cache_path:
+            cache = SolutionCache(solution_cache_path)
+            settings = {
+                "solver_type": solver_type.name,
+                "due_date_mode": due_date_mode.name,
+                "strengthen": strengthen,
+            }
+            cached = cache.get(proj_data, settings)
+
+        if cached:
+            solution, status = cached
+            logging.info(f" Cached solution ({status})")
+        else:
+            match solver_type:
+                case SolverType.PYTHON_CONSTRAINT:
+                    from csp_solvers import python_constraint
+
+                    problem = python_constraint.define_problem(proj_data, due_date_mode)
+                    solution = problem.getSolution()
+                    status = "FEASIBLE" if solution else "INFEASIBLE"
+
+                case SolverType.OR_TOOLS:
+                    from csp_solvers import ortools
+
+                    # A project of the same structure solved before also gives a hint, repaired
+                    # in case it breaks the current capacities
+                    hint = cache.hint(proj_data) if cache else None
+                    if hint and not proj_data.is_multimode:
+                        from csp_solvers import heuristic
+
+                        hint = heuristic.repair(proj_data, hint)
+                    elif warm_start:
+                        from csp_solvers import heuristic
+
+                        hint = heuristic.solve(proj_data, passes=100)
+
+                    # Multi-mode projects also choose the mode of every job
+                    if proj_data.is_multimode:
+                        model, start_times, mode_choices = ortools.define_multimode_problem(
+                            proj_data, due_date_mode
+                        )
+                    else:
+                        model, start_times = ortools.define_problem(
+                            proj_data, due_date_mode, hint, strengthen
+                        )
+                    solver = ortools.create_solver(num_search_workers, max_time, relative_gap)
+
+                    status, solution, _ = ortools.solve(model, start_times, proj_data, solver)
+                    status = solver.StatusName(status)
+                    logging.info(f" Solver status: {status}")
+
+                    if solution and proj_data.is_multimode:
+                        logging.info(f" Modes: {ortools.extract_modes(solver, mode_choices)}")
+
+                case SolverType.HEURISTIC:
+                    from csp_solvers import heuristic
+
+                    solution = heuristic.solve(
+                        proj_data,
+                        heuristic.ScheduleScheme.SERIAL,
+                        heuristic.PriorityRule.LFT,
+                        passes=100,
+                    )
+                    status = "FEASIBLE"
+
+                case SolverType.PORTFOLIO:
+                    from csp_solvers import portfolio
+
+                    status, solution, winner, backends = portfolio.solve(
+                        proj_data, max_time, due_date_mode
+                    )
+                    logging.info(f" Portfolio status: {status}, winner: {winner}")
+                    logging.info(f" Backends: {backends}")
+
+            if cache:
+                cache.put(proj_data, solution, status, settings)
+
+        if solution and improve_time > 0 and not proj_data.is_multimode:
+            from csp_solvers import heuristic
+
+            solution = heuristic.improve(
+                proj_data, process_solution(solution, proj_data), improve_time
+            )
 
         get_solution_time = time.time()
         logging.info(
@@ -87,6 +175,14 @@ def main():
         if solution:
             logging.info(f" {solution}")
 
+        # Check every single mode schedule before using it
+        if solution and not proj_data.is_multimode:
+            report = validate(solution, proj_data)
+            logging.info(
+                f" Feasible: {report.is_feasible}, makespan: {report.makespan}, "
+                f"tardiness: {report.tardiness}, utilisation: {report.utilisation.round(3).tolist()}"
+            )
+
     end_time = time.time()
     logging.info(f" Execution time: {(end_time - start_time):.4f} seconds")
 
@@ -0,0 +1,248 @@
+"""
+Script for solving a batch of project instances in parallel.
+
+Every file matching the given glob pattern is parsed, modelled and solved in its own worker
+process, with a time limit per instance. One result row per instance is written to a JSONL or
+CSV file (chosen from the output extension) as soon as the instance finishes.
+
+Each row contains:
+    - instance: Path of the instance file.
+    - solver: Name of the SolverType used.
+    - status: Solver status (e.g., OPTIMAL, FEASIBLE, INFEASIBLE, UNKNOWN, TIMEOUT or PARSE_ERROR).
+    - makespan: Makespan of the best schedule found, empty if none was found.
+    - parse_time: Seconds spent parsing the instance (or loading it from the cache).
+    - solve_time: Seconds spent defining and solving the problem.
+    - error: Error message if the instance could not be solved, otherwise empty.
+    - winner: Backend that found the schedule, for the PORTFOLIO solver only.
+
+Usage:
+    python app/main_batch.py "data/p01_dataset_*.txt" --solver OR_TOOLS --time-limit 60 \\
+        --output results.jsonl
+"""
+
+import argparse
+import csv
+import glob
+import json
+import logging
+import os
+import signal
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from data_parsing import parse_file, load_project, ParseError
+from csp_solvers import SolverType, DueDateMode, compute_makespan
+
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+FIELDS = [
+    "instance",
+    "solver",
+    "status",
+    "makespan",
+    "parse_time",
+    "solve_time",
+    "error",
+    "winner",
+]
+
+
+class InstanceTimeout(Exception):
+    """
+    Raised inside a worker when an instance exceeds its time limit.
+    """
+
+
+def _raise_timeout(signum, frame):
+    raise InstanceTimeout()
+
+
+def solve_instance(
+    file_path: str,
+    solver_type: SolverType,
+    time_limit: float,
+    due_date_mode: DueDateMode = DueDateMode.IGNORE,
+    cache_dir: str | None = None,
+) -> dict:
+    """
+    Parses, models and solves a single instance file.
+
+    OR-Tools stops by itself at the time limit and returns its best solution. The python-constraint
+    search cannot be interrupted cleanly, so it is aborted with an alarm signal and reported as
+    TIMEOUT.
+
+    Args:
+        file_path (str): Path to the instance file.
+        solver_type (SolverType): The solver to use.
+        time_limit (float): Maximum seconds allowed for defining and solving the problem.
+        due_date_mode (DueDateMode): How the project due date is handled.
+        cache_dir (str, optional): Directory of the parsed data cache. Defaults to parsing the
+                                   file every time.
+
+    Returns:
+        dict: The result row for the instance (see the module documentation).
+    """
+
+    row = dict.fromkeys(FIELDS, "")
+    row.update(instance=file_path, solver=solver_type.name)
+
+    start_time = time.perf_counter()
+    try:
+        if cache_dir:
+            proj_data = load_project(file_path, cache_dir)
+        else:
+            with open(file_path, "r") as file:
+                proj_data = parse_file(file)
+    except ParseError as error:
+        row.update(status="PARSE_ERROR", error=str(error))
+        return row
+    parse_time = time.perf_counter()
+    row["parse_time"] = round(parse_time - start_time, 6)
+
+    solution = {}
+    modes = None
+    signal.signal(signal.SIGALRM, _raise_timeout)
+    signal.setitimer(signal.ITIMER_REAL, time_limit)
+
+    try:
+        match solver_type:
+            case SolverType.PYTHON_CONSTRAINT:
+                from csp_solvers import python_constraint
+
+                problem = python_constraint.define_problem(proj_data, due_date_mode)
+                solution = problem.getSolution() or {}
+                row["status"] = "FEASIBLE" if solution else "INFEASIBLE"
+
+            case SolverType.OR_TOOLS:
+                from csp_solvers import ortools
+
+                # Leave some slack before the alarm so CP-SAT can return its best solution;
+                # each process uses a single worker, parallelism comes from the pool
+                if proj_data.is_multimode:
+                    model, start_times, mode_choices = ortools.define_multimode_problem(
+                        proj_data, due_date_mode
+                    )
+                else:
+                    model, start_times = ortools.define_problem(proj_data, due_date_mode)
+                solver = ortools.create_solver(1, max(time_limit - 0.5, 0.1))
+
+                status, solution, _ = ortools.solve(model, start_times, proj_data, solver)
+                row["status"] = solver.StatusName(status)
+
+                if solution and proj_data.is_multimode:
+                    modes = ortools.extract_modes(solver, mode_choices)
+
+            case SolverType.HEURISTIC:
+                from csp_solvers import heuristic
+
+                solution = heuristic.solve(proj_data, passes=100)
+                row["status"] = "FEASIBLE"
+
+            case SolverType.PORTFOLIO:
+                from csp_solvers import portfolio
+
+                row["status"], solution, row["winner"], backends = portfolio.solve(
+                    proj_data, max(time_limit - 0.5, 0.1), due_date_mode
+                )
+                # The winner's makespan accounts for the modes it chose
+                if solution:
+                    row["makespan"] = backends[row["winner"]]["makespan"]
+
+    except InstanceTimeout:
+        row["status"] = "TIMEOUT"
+    except ValueError as error:
+        row["status"] = "INFEASIBLE"
+        row["error"] = str(error)
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+
+    row["solve_time"] = round(time.perf_counter() - parse_time, 6)
+    if solution and row["makespan"] == "":
+        row["makespan"] = compute_makespan(solution, proj_data, modes)
+
+    return row
+
+
+def write_row(output, row: dict, writer):
+    """
+    Writes one result row and flushes it so partial results survive an interrupted run.
+    """
+    if writer is None:
+        output.write(json.dumps(row) + "\n")
+    else:
+        writer.writerow(row)
+    output.flush()
+
+
+def main():
+    """
+    Main function to solve every instance matching a glob pattern in a process pool.
+    """
+
+    parser = argparse.ArgumentParser(description="Solve a batch of project instances.")
+    parser.add_argument("pattern", help='Glob pattern of instance files, e.g. "data/*.txt".')
+    parser.add_argument(
+        "--solver",
+        choices=[solver.name for solver in SolverType],
+        default=SolverType.OR_TOOLS.name,
+    )
+    parser.add_argument(
+        "--due-date",
+        choices=[mode.name for mode in DueDateMode],
+        default=DueDateMode.IGNORE.name,
+    )
+    parser.add_argument("--time-limit", type=float, default=60.0, help="Seconds per instance.")
+    parser.add_argument(
+        "--processes", type=int, default=os.cpu_count(), help="Number of worker processes."
+    )
+    parser.add_argument("--output", default="results.jsonl", help="A .jsonl or .csv file.")
+    parser.add_argument(
+        "--cache-dir", default=None, help="Directory of the parsed data cache (disabled by default)."
+    )
+    args = parser.parse_args()
+
+    files = sorted(glob.glob(args.pattern, recursive=True))
+    if not files:
+        parser.error(f"No instance files match {args.pattern}")
+
+    solver_type = SolverType[args.solver]
+    due_date_mode = DueDateMode[args.due_date]
+    start_time = time.time()
+
+    with open(args.output, "w", newline="") as output, ProcessPoolExecutor(
+        max_workers=args.processes
+    ) as executor:
+        writer = None
+        if args.output.endswith(".csv"):
+            writer = csv.DictWriter(output, fieldnames=FIELDS)
+            writer.writeheader()
+
+        futures = [
+            executor.submit(
+                solve_instance,
+                file_path,
+                solver_type,
+                args.time_limit,
+                due_date_mode,
+                args.cache_dir,
+            )
+            for file_path in files
+        ]
+
+        for future in as_completed(futures):
+            row = future.result()
+            write_row(output, row, writer)
+            logging.info(
+                f" {row['instance']}: {row['status']} makespan={row['makespan']} "
+                f"({row['solve_time']} seconds)"
+            )
+
+    end_time = time.time()
+    logging.info(
+        f" Solved {len(files)} instances in {(end_time - start_time):.4f} seconds"
+    )
+
+
+if __name__ == "__main__":
+    main()
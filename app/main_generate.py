@@ -0,0 +1,83 @@
+"""
+Script for generating a suite of synthetic project instances.
+
+One instance is written per requested size (and per seed), in the same text format as the files
+in data/, named `gen_j{jobs}_s{seed}.txt`. The files can be solved with main.py or main_batch.py.
+
+Usage:
+    python app/main_generate.py 100 1000 10000 --seeds 0 1 2 --output-dir data/generated \\
+        --network-complexity 1.5 --resource-factor 0.5 --resource-strength 0.3
+"""
+
+import argparse
+import logging
+import os
+import time
+
+from data_parsing import generate_project, write_project
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+
+def generate_suite(
+    sizes: list[int],
+    seeds: list[int],
+    output_dir: str,
+    **parameters,
+) -> list[str]:
+    """
+    Generates and writes one instance per size and seed.
+
+    Args:
+        sizes (list[int]): Numbers of non-dummy jobs.
+        seeds (list[int]): Seeds of the random generator.
+        output_dir (str): Directory the files are written to (created if missing).
+        **parameters: Further keyword arguments of generate_project (e.g., resource_strength).
+
+    Returns:
+        list[str]: Paths of the written files.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+
+    paths = []
+    for jobs in sizes:
+        for seed in seeds:
+            data = generate_project(jobs, seed=seed, **parameters)
+            path = os.path.join(output_dir, f"gen_j{jobs}_s{seed}.txt")
+            with open(path, "w") as file:
+                write_project(data, file)
+            paths.append(path)
+
+    return paths
+
+
+def main():
+    """
+    Main function to generate the instances given on the command line.
+    """
+
+    parser = argparse.ArgumentParser(description="Generate synthetic project instances.")
+    parser.add_argument("sizes", type=int, nargs="+", help="Numbers of non-dummy jobs.")
+    parser.add_argument("--seeds", type=int, nargs="+", default=[0])
+    parser.add_argument("--output-dir", default="data/generated")
+    parser.add_argument("--network-complexity", type=float, default=1.5)
+    parser.add_argument("--resource-factor", type=float, default=0.5)
+    parser.add_argument("--resource-strength", type=float, default=0.5)
+    parser.add_argument("--resources", type=int, default=4)
+    args = parser.parse_args()
+
+    start_time = time.time()
+    paths = generate_suite(
+        args.sizes,
+        args.seeds,
+        args.output_dir,
+        network_complexity=args.network_complexity,
+        resource_factor=args.resource_factor,
+        resource_strength=args.resource_strength,
+        resources=args.resources,
+    )
+    logging.info(f"Wrote {len(paths)} instances to {args.output_dir} in {time.time() - start_time:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
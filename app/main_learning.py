@@ -1,7 +1,16 @@
-import pandas as pd
+import itertools
+import math
+from collections import Counter
+import os
+import queue
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
-from sklearn.model_selection import train_test_split, RandomizedSearchCV, cross_val_score
-from sklearn.metrics import mean_squared_error, mean_absolute_error, mean_absolute_percentage_error, r2_score, make_scorer
+from joblib import Memory
+from sklearn.base import clone
+from sklearn.model_selection import train_test_split, KFold, ParameterGrid, ParameterSampler
+from sklearn.metrics import mean_squared_error, root_mean_squared_error, mean_absolute_error, mean_absolute_percentage_error, r2_score, make_scorer
 from sklearn.pipeline import Pipeline
 from sklearn.preprocessing import StandardScaler, MinMaxScaler, Normalizer, OneHotEncoder
 from sklearn.decomposition import PCA
@@ -9,13 +18,96 @@ from sklearn.compose import ColumnTransformer
 from sklearn.impute import SimpleImputer
 from sklearn.linear_model import LinearRegression, Lasso
 from sklearn.tree import DecisionTreeRegressor
+from sklearn.utils import _safe_indexing
 from scipy.stats import normaltest
+from learning import load_data, predict_in_batches, save_model
 import matplotlib.pyplot as plt
 import seaborn as sns
 import time
 
+# Smallest row subsample the multi-fidelity search trains on
+MIN_SUBSAMPLE_ROWS = 100
+
+# Largest ratio between the rows of a fit and the largest observed fit of the model up to which
+# its fit time is extrapolated, a task only estimated beyond it is never skipped
+MAX_EXTRAPOLATION = 10
+
+# Training data of a search worker, set once per process by _init_worker
+_X_train = None
+_y_train = None
+
+
+def _init_worker(X_train, y_train):
+    global _X_train, _y_train
+    _X_train, _y_train = X_train, y_train
+
+
+def _create_executor(n_jobs, X_train, y_train):
+    return ProcessPoolExecutor(n_jobs, initializer=_init_worker, initargs=(X_train, y_train))
+
+
+def _stop_executor(executor):
+    # Cancels the queued tasks and kills the workers instead of waiting for the running ones. The
+    # executor sees its workers die and fails their futures, so nothing is left waiting on them
+    processes = list((executor._processes or {}).values())
+    executor.shutdown(wait=False, cancel_futures=True)
+    for process in processes:
+        process.kill()
+    for process in processes:
+        process.join()
+
+
+# Every task returns (model_name, (training rows, seconds) of its fits or None, ...) so the
+# parent can estimate the cost of the next fits of the model. Tasks still queued when the budget
+# runs out are skipped.
+
+def _cross_validate(model_name, pipeline, params, cv, scoring, rows, deadline):
+    if deadline is not None and time.time() >= deadline:
+        return model_name, None, params, None, None, 0
+
+    # The training set is already shuffled, so its first rows are a random subsample
+    X, y = (_X_train, _y_train) if rows is None else (_X_train[:rows], _y_train[:rows])
+    pipeline = clone(pipeline).set_params(**params)
+    fit_time = 0.0
+    scores = []
+    fitted = None
+
+    # Folds run one by one, so a candidate is interrupted as soon as its first folds show that
+    # the others will not finish before the deadline
+    for train, test in KFold(cv).split(X):
+        fold_start = time.time()
+        fold_pipeline = clone(pipeline).fit(_safe_indexing(X, train), _safe_indexing(y, train))
+        fit_time += time.time() - fold_start
+        scores.append(scoring(fold_pipeline, _safe_indexing(X, test), _safe_indexing(y, test)))
+
+        # The pipeline of the first fold stands in for the candidate until it is refitted on
+        # every row
+        if fitted is None:
+            fitted, fitted_rows = fold_pipeline.set_params(memory=None), len(train)
+
+        folds_left = cv - len(scores)
+        if deadline is not None and folds_left and time.time() + folds_left * (time.time() - fold_start) > deadline:
+            return model_name, (len(train), fit_time / len(scores)), params, None, None, 0
+
+    return model_name, (fitted_rows, fit_time / cv), params, np.mean(scores), fitted, fitted_rows
+
+
+def _refit(model_name, pipeline, params, deadline):
+    if deadline is not None and time.time() >= deadline:
+        return model_name, None, None
+
+    start_time = time.time()
+    pipeline = clone(pipeline).set_params(**params)
+    pipeline.fit(_X_train, _y_train)
+
+    # The fitted pipeline must not depend on the search cache, which is removed after training
+    pipeline.set_params(memory=None)
+    return model_name, (len(_X_train), time.time() - start_time), pipeline
+
+
 class AutoMLPipeline:
-    def __init__(self, models=None, param_grids=None, metric='rmse'):
+    def __init__(self, models=None, param_grids=None, metric='rmse', n_jobs=None, cache_dir=None,
+                 search='random', n_iter=10, cv=5, factor=3):
         # Default models and parameter grids
         self.models = models or {
             'LinearRegression': LinearRegression(),
@@ -40,22 +132,48 @@ class AutoMLPipeline:
             }
         }
         self.metric = metric
+        # Worker processes of the search (None uses every core) and the directory caching the
+        # fitted preprocessing of each fold (None uses a temporary directory)
+        self.n_jobs = n_jobs
+        self.cache_dir = cache_dir
+        # Search strategy, candidates sampled per model, cross-validation folds and the fraction
+        # (1 / factor) of the candidates kept at each rung of the halving strategies
+        self.search = search
+        self.n_iter = n_iter
+        self.cv = cv
+        self.factor = factor
         self.best_model = None
         self.best_params = None
+        # Fitted pipeline of the best model, and the observed fit times of each model (seconds
+        # by number of training rows) used to budget the next fits
+        self.best_pipeline = None
+        self.feature_names = None
+        self.numeric_features = None
+        self.fit_costs = {}
         self.model_scores = {}
         self.best_preprocessing_details = None
         self.metrics = {
-            'rmse': lambda y, y_pred: np.sqrt(mean_squared_error(y, y_pred)),
+            'rmse': root_mean_squared_error,
             'mse': mean_squared_error,
             'mae': mean_absolute_error,
             'mape': mean_absolute_percentage_error,
             'r2': r2_score
         }
+        # Each strategy cross-validates candidates in the worker processes and returns, for every
+        # model, its best candidate as (parameters, cross-validation score, fitted pipeline, rows
+        # the pipeline was fitted on), the number of candidates it evaluated and skipped per
+        # model, and whether the time budget ran out
+        self.search_strategies = {
+            'random': self.random_search,
+            'halving': self.halving_search,
+            'multi_fidelity': self.multi_fidelity_search
+        }
 
     def preprocess_data(self, X, y):
         # Identify numeric and categorical columns
-        numeric_features = X.select_dtypes(include=['int64', 'float64']).columns
-        categorical_features = X.select_dtypes(include=['object', 'category']).columns
+        # Any integer or float width, so downcast columns are kept (dates are left out)
+        numeric_features = X.select_dtypes(include='number').columns
+        categorical_features = X.select_dtypes(include=['object', 'string', 'category']).columns
 
         # Create preprocessing pipelines for numeric and categorical data
         numeric_transformer = Pipeline([
@@ -92,7 +210,7 @@ class AutoMLPipeline:
             return PCA(n_components=3)
         return 'passthrough'
 
-    def create_pipeline(self, model, X, y):
+    def create_pipeline(self, model, X, y, memory=None):
         correlation_method = self.select_correlation_method(X, y)
         preprocessor, numeric_features, categorical_features = self.preprocess_data(X, y)
         dimensionality_reduction = self.reduce_dimensionality(X)
@@ -109,35 +227,286 @@ class AutoMLPipeline:
             ('preprocessor', preprocessor),
             ('dim_reduction', dimensionality_reduction),
             ('model', model)
-        ])
+        ], memory=memory)
 
         return pipeline, preprocessing_details
 
+    def is_better(self, value, other):
+        # r2 is maximised, every other metric is an error
+        return value > other if self.metric == 'r2' else value < other
+
+    def sample_candidates(self, model_name, n_iter, random_state):
+        param_grid = self.param_grids.get(model_name, {})
+        # Grids of lists are sampled without replacement, at most every combination once
+        if all(isinstance(values, list) for values in param_grid.values()):
+            n_iter = min(n_iter, len(ParameterGrid(param_grid)))
+        return list(ParameterSampler(param_grid, n_iter=n_iter, random_state=random_state))
+
+    def estimate_fit_time(self, model_name, rows):
+        # Interpolates a power law between the two largest observed sizes. Fixed overheads make
+        # the exponent of small linear models below 1, trees grow faster than their rows. A
+        # faster than linear growth is only trusted up to the span it was measured on, as
+        # subsamples of a few hundred rows are mostly overhead and timing noise, and sizes more
+        # than MAX_EXTRAPOLATION times the largest observed one are estimated at that bound. With
+        # one known size the overheads cannot be told apart, a larger size is extrapolated with
+        # the smallest exponent until a second size is seen, a smaller one linearly. Unknown
+        # costs are zero, so every model runs at least once
+        costs = sorted(self.fit_costs.get(model_name, {}).items())
+        if not costs:
+            return 0.0
+        observed_rows, seconds = costs[-1]
+        rows = min(rows, MAX_EXTRAPOLATION * observed_rows)
+        exponent = 0.5 if rows > observed_rows else 1.0
+        if len(costs) > 1:
+            smaller_rows, smaller_seconds = costs[-2]
+            if smaller_seconds > 0 and seconds > 0:
+                exponent = min(max(math.log(seconds / smaller_seconds) / math.log(observed_rows / smaller_rows), 0.5), 2.0)
+                if rows / observed_rows > observed_rows / smaller_rows:
+                    exponent = min(exponent, 1.0)
+        return seconds * (rows / observed_rows) ** exponent
+
+    def search_deadline(self, deadline, n_rows):
+        # The search leaves the time to refit the best candidate of every model on all rows
+        n_jobs = self.n_jobs or os.cpu_count()
+        refit_times = [self.estimate_fit_time(model_name, n_rows) for model_name in self.models]
+        return deadline - max(max(refit_times), sum(refit_times) / n_jobs)
+
+    def run_tasks(self, executor, function, tasks, deadline, n_rows=0):
+        # Runs tasks given as (model_name, fits, rows per fit, arguments), the deadline is appended
+        # to the arguments. At most one task per worker is in flight, so a task whose estimated
+        # cost does not fit the remaining budget is skipped instead of started (unless the
+        # estimate is a far extrapolation, see estimate_fit_time). Results come in
+        # completion order, the ones collected before the deadline (minus the refit time of
+        # n_rows rows) are returned with whether the deadline passed and the model names of the
+        # tasks never started, skipped or still pending when it passed
+        n_jobs = self.n_jobs or os.cpu_count()
+        finished = queue.Queue()
+        pending = list(reversed(tasks))
+        running = 0
+        results = []
+        skipped = []
+
+        while pending or running:
+            limit = None if deadline is None else self.search_deadline(deadline, n_rows) if n_rows else deadline
+
+            while pending and running < n_jobs:
+                model_name, fits, rows, arguments = pending.pop()
+                observed_rows = max(self.fit_costs.get(model_name, {}), default=0)
+                if (limit is not None and rows <= MAX_EXTRAPOLATION * observed_rows
+                        and time.time() + fits * self.estimate_fit_time(model_name, rows) > limit):
+                    skipped.append(model_name)
+                    continue
+                executor.submit(function, *arguments, limit).add_done_callback(finished.put)
+                running += 1
+
+            if not running:
+                break
+
+            try:
+                future = finished.get(timeout=None if limit is None else max(limit - time.time(), 0))
+            except queue.Empty:
+                skipped.extend(model_name for model_name, _, _, _ in pending)
+                return results, True, skipped
+            running -= 1
+
+            result = future.result()
+            model_name, fit_time = result[:2]
+            if fit_time is not None:
+                rows, seconds = fit_time
+                self.fit_costs.setdefault(model_name, {})[rows] = seconds
+            results.append(result)
+
+        return results, False, skipped
+
+    def interleave_candidates(self, n_iter, random_state):
+        # Alternates the models, so every model is evaluated early even if the budget runs out
+        samples = [
+            [(model_name, params) for params in self.sample_candidates(model_name, n_iter, random_state)]
+            for model_name in self.models
+        ]
+        return [candidate for rank in itertools.zip_longest(*samples) for candidate in rank if candidate]
+
+    def random_search(self, executor, pipelines, n_rows, scorer, random_state, deadline):
+        rows = n_rows - n_rows // self.cv
+        tasks = [
+            (model_name, self.cv, rows, (model_name, pipelines[model_name][0], params, self.cv, scorer, None))
+            for model_name, params in self.interleave_candidates(self.n_iter, random_state)
+        ]
+        results, timed_out, skipped = self.run_tasks(executor, _cross_validate, tasks, deadline, n_rows)
+
+        best_candidates = {}
+        evaluated = dict.fromkeys(self.models, 0)
+        for model_name, _, params, score, fitted, fitted_rows in results:
+            if score is None:
+                continue
+            evaluated[model_name] += 1
+            if model_name not in best_candidates or score > best_candidates[model_name][1]:
+                best_candidates[model_name] = (params, score, fitted, fitted_rows)
+
+        # Candidates skipped for the budget mean it ran out, as for a timeout
+        return best_candidates, evaluated, Counter(skipped), timed_out or bool(skipped)
+
+    def halving_search(self, executor, pipelines, n_rows, scorer, random_state, deadline):
+        # Successive halving of every model on its own, like scikit-learn's HalvingRandomSearchCV:
+        # each rung cross-validates a model's survivors on a row subsample `factor` times larger
+        # than the previous one and keeps the best 1 / factor of them, the last rung uses every
+        # training row. Every model starts at the first rung, a model down to one candidate goes
+        # straight to the last. The rungs run through run_tasks and the deadline is checked
+        # between them, so the best candidates of the rungs already scored are kept when the
+        # budget runs out. A rung with candidates skipped for the budget is the last one, its
+        # survivors are not promoted from a partial ranking
+        levels = 1
+        while n_rows // self.factor ** levels >= MIN_SUBSAMPLE_ROWS:
+            levels += 1
+
+        survivors = {
+            model_name: self.sample_candidates(model_name, self.factor ** (levels - 1), random_state)
+            for model_name in self.models
+        }
+        best_candidates = {}
+        evaluated = dict.fromkeys(self.models, 0)
+        skipped = []
+        timed_out = False
+
+        for level in reversed(range(levels)):
+            rows = n_rows // self.factor ** level
+            racing = [
+                model_name for model_name in self.models
+                if len(survivors[model_name]) > 1 or (level == 0 and survivors[model_name])
+            ]
+            samples = [[(model_name, params) for params in survivors[model_name]] for model_name in racing]
+            tasks = [
+                (model_name, self.cv, rows - rows // self.cv,
+                 (model_name, pipelines[model_name][0], params, self.cv, scorer, rows if rows < n_rows else None))
+                for rank in itertools.zip_longest(*samples) for model_name, params in filter(None, rank)
+            ]
+            if not tasks:
+                continue
+            results, timed_out, skipped = self.run_tasks(executor, _cross_validate, tasks, deadline, n_rows)
+
+            scored = {model_name: [] for model_name in racing}
+            for model_name, _, params, score, fitted, fitted_rows in results:
+                if score is not None:
+                    evaluated[model_name] += 1
+                    scored[model_name].append((score, params, fitted, fitted_rows))
+
+            # Scores on more rows replace those of the previous rungs, a model without any score
+            # in this rung (its candidates no longer fit the budget) stops
+            for model_name, model_scored in scored.items():
+                model_scored.sort(key=lambda item: item[0], reverse=True)
+                survivors[model_name] = [params for _, params, _, _ in model_scored[:math.ceil(len(model_scored) / self.factor)]]
+                if model_scored:
+                    score, params, fitted, fitted_rows = model_scored[0]
+                    best_candidates[model_name] = (params, score, fitted, fitted_rows)
+
+            if timed_out or skipped:
+                break
+
+        return best_candidates, evaluated, Counter(skipped), timed_out or bool(skipped)
+
+    def multi_fidelity_search(self, executor, pipelines, n_rows, scorer, random_state, deadline):
+        # Candidates of every model race together: each rung cross-validates the survivors on a
+        # row subsample `factor` times larger than the previous one and keeps the best 1 / factor
+        # of them, the last rung uses every training row. Like halving_search, the search stops
+        # at a rung with candidates skipped for the budget
+        survivors = self.interleave_candidates(self.n_iter * self.factor, random_state)
+        budgets = [n_rows]
+        while len(survivors) // self.factor ** len(budgets) > 1 and budgets[0] // self.factor >= MIN_SUBSAMPLE_ROWS:
+            budgets.insert(0, budgets[0] // self.factor)
+
+        best_candidates = {}
+        evaluated = dict.fromkeys(self.models, 0)
+        skipped = []
+        timed_out = False
+
+        for rows in budgets:
+            tasks = [
+                (model_name, self.cv, rows - rows // self.cv,
+                 (model_name, pipelines[model_name][0], params, self.cv, scorer, rows if rows < n_rows else None))
+                for model_name, params in survivors
+            ]
+            results, timed_out, skipped = self.run_tasks(executor, _cross_validate, tasks, deadline, n_rows)
+            scored = [(score, model_name, params, fitted, fitted_rows) for model_name, _, params, score, fitted, fitted_rows in results if score is not None]
+
+            # Scores on more rows replace those of the previous rungs
+            rung_best = {}
+            for score, model_name, params, fitted, fitted_rows in scored:
+                evaluated[model_name] += 1
+                if model_name not in rung_best or score > rung_best[model_name][1]:
+                    rung_best[model_name] = (params, score, fitted, fitted_rows)
+            best_candidates.update(rung_best)
+
+            if timed_out or skipped or not scored:
+                break
+            scored.sort(key=lambda item: item[0], reverse=True)
+            survivors = [(model_name, params) for _, model_name, params, _, _ in scored[:math.ceil(len(scored) / self.factor)]]
+
+        return best_candidates, evaluated, Counter(skipped), timed_out or bool(skipped)
+
     def train(self, X, y, test_size=0.2, random_state=42, max_time=None):
         X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=test_size, random_state=random_state)
 
         if self.metric not in self.metrics:
             raise ValueError(f"Unsupported metric: {self.metric}. Choose from {list(self.metrics.keys())}.")
+        if self.search not in self.search_strategies:
+            raise ValueError(f"Unsupported search: {self.search}. Choose from {list(self.search_strategies.keys())}.")
 
-        scorer = make_scorer(mean_squared_error, greater_is_better=False)
+        # Candidates are ranked by the selected metric
+        scorer = make_scorer(self.metrics[self.metric], greater_is_better=self.metric == 'r2')
         start_time = time.time()
+        # The search, the refits and the final evaluation all have to fit in max_time
+        deadline = start_time + max_time if max_time else None
+        n_rows = len(X_train)
+        self.fit_costs = {}
+        # Columns the pipeline expects, to build its input from records when serving
+        self.feature_names = list(X.columns) if hasattr(X, 'columns') else None
+        self.numeric_features = list(X.select_dtypes(include='number').columns) if hasattr(X, 'columns') else None
 
-        results = {}
+        # The preprocessing of a fold is fitted once and memoised on disk, every candidate (of
+        # every model) with the same preprocessing parameters reuses it
+        cache_dir = self.cache_dir or tempfile.mkdtemp(prefix='automl_')
+        memory = Memory(cache_dir, verbose=0)
+        pipelines = {
+            model_name: self.create_pipeline(model, X_train, y_train, memory)
+            for model_name, model in self.models.items()
+        }
+
+        # Candidates are cross-validated in parallel tasks, so the models are searched
+        # concurrently and the workers stay busy until the last candidate
+        print(f"Searching {len(self.models)} models ({self.search} search)...")
+        n_jobs = self.n_jobs or os.cpu_count()
+        executor = _create_executor(n_jobs, X_train, y_train)
+
+        try:
+            best_candidates, evaluated, skipped, timed_out = self.search_strategies[self.search](
+                executor, pipelines, n_rows, scorer, random_state, deadline
+            )
 
-        for model_name, model in self.models.items():
-            elapsed_time = time.time() - start_time
-            if max_time and elapsed_time > max_time:
+            if timed_out:
+                # Cancel the candidates still running, so the refits below do not wait for them
                 print("Max training time reached. Stopping further training.")
-                break
+                _stop_executor(executor)
+                executor = _create_executor(min(n_jobs, len(best_candidates) or 1), X_train, y_train)
 
-            print(f"Training {model_name}...")
-            pipeline, preprocessing_details = self.create_pipeline(model, X_train, y_train)
-            param_grid = self.param_grids.get(model_name, {})
+            # The best candidates fitted on a fold or a subsample are refitted on every training
+            # row when the budget allows it, otherwise their partially trained pipeline is kept
+            tasks = [
+                (model_name, 1, n_rows, (model_name, pipelines[model_name][0], params))
+                for model_name, (params, _, _, fitted_rows) in best_candidates.items()
+                if fitted_rows < n_rows
+            ]
+            refits, _, _ = self.run_tasks(executor, _refit, tasks, deadline)
+            refitted = {model_name: pipeline for model_name, _, pipeline in refits if pipeline is not None}
+        finally:
+            _stop_executor(executor)
+            if self.cache_dir is None:
+                shutil.rmtree(cache_dir, ignore_errors=True)
 
-            search = RandomizedSearchCV(pipeline, param_distributions=param_grid, scoring=scorer, cv=5, n_iter=10, random_state=random_state)
-            search.fit(X_train, y_train)
+        results = {}
 
-            best_pipeline = search.best_estimator_
+        for model_name, (params, score, fitted, fitted_rows) in best_candidates.items():
+            best_pipeline = refitted.get(model_name, fitted)
+            preprocessing_details = pipelines[model_name][1]
             y_train_pred = best_pipeline.predict(X_train)
             y_test_pred = best_pipeline.predict(X_test)
 
@@ -147,12 +516,19 @@ class AutoMLPipeline:
             results[model_name] = {
                 'train': metrics_train,
                 'test': metrics_test,
-                'preprocessing': preprocessing_details
+                'preprocessing': preprocessing_details,
+                # Candidates cross-validated, and those left out when the budget ran out
+                'candidates': evaluated[model_name],
+                'skipped': skipped[model_name],
+                # Cross-validation score in metric units, and whether the pipeline saw every row
+                'cv': score if self.metric == 'r2' else -score,
+                'refitted': fitted_rows == n_rows or model_name in refitted
             }
 
-            if self.best_model is None or metrics_test[self.metric] < results[self.best_model]['test'][self.metric]:
+            if self.best_model is None or self.is_better(metrics_test[self.metric], results[self.best_model]['test'][self.metric]):
                 self.best_model = model_name
-                self.best_params = search.best_params_
+                self.best_params = params
+                self.best_pipeline = best_pipeline
                 self.best_preprocessing_details = preprocessing_details
 
         self.model_scores = results
@@ -160,6 +536,7 @@ class AutoMLPipeline:
         print(f"Best Model: {self.best_model}")
         print(f"Best Parameters: {self.best_params}")
         print(f"Best Preprocessing Details: {self.best_preprocessing_details}")
+        print(f"Training time: {time.time() - start_time:.2f}s")
 
         # Display all metrics for each model
         for model_name, metrics in results.items():
@@ -168,6 +545,27 @@ class AutoMLPipeline:
             print(f"Testing: {metrics['test']}")
             print(f"Preprocessing: {metrics['preprocessing']}")
 
+    def predict(self, X, batch_size=100_000):
+        if self.best_pipeline is None:
+            raise ValueError("No model has been trained yet.")
+        return predict_in_batches(self.best_pipeline, X, batch_size)
+
+    def save(self, path):
+        # Stores the fitted best pipeline with what a prediction service needs to describe it,
+        # load it back with learning.load_model (memory-mapped)
+        if self.best_pipeline is None:
+            raise ValueError("No model has been trained yet.")
+        return save_model({
+            'pipeline': self.best_pipeline,
+            'model': self.best_model,
+            'params': self.best_params,
+            'preprocessing': self.best_preprocessing_details,
+            'metric': self.metric,
+            'scores': {metric: float(value) for metric, value in self.model_scores[self.best_model]['test'].items()},
+            'columns': self.feature_names,
+            'numeric_columns': self.numeric_features
+        }, path)
+
     def plot_model_comparisons(self):
         if not self.model_scores:
             print("No models have been trained yet.")
@@ -187,11 +585,12 @@ if __name__ == "__main__":
     # Load sample dataset
     from sklearn.datasets import fetch_california_housing
 
-    data = pd.read_csv("data/learning/airbnb_lisbon/airbnb_lisbon_1480_2017-07-27.csv", header=0, sep=',')
+    data = load_data("data/learning/airbnb_lisbon/airbnb_lisbon_1480_2017-07-27.csv", header=0, sep=',')
     X = data.drop(['price'], axis=1)
     y = data.price
 
     # Initialize and run AutoMLPipeline
     automl = AutoMLPipeline(metric='rmse')  # Select the optimization metric
     automl.train(X, y, max_time=60)  # Set max training time to 60 seconds
+    automl.save("models/airbnb_lisbon.joblib")  # Serve it with app/main_serving.py
     automl.plot_model_comparisons()
\ No newline at end of file
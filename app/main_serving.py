@@ -0,0 +1,93 @@
+"""
+Script for serving the predictions of a model saved by AutoMLPipeline.save.
+
+Without --port, JSON records are read from stdin, one per line, and one {"prediction": ...} line is
+written to stdout per record, in the same order. With --port, an HTTP server answers
+`POST /predict` (a JSON record, or a list of records) and `GET /health`. Single records arriving
+together are micro-batched into one vectorised prediction.
+
+The artifact is memory-mapped, so the HTTP workers (forked processes sharing the listening socket)
+share the arrays of the fitted pipeline instead of each holding a copy.
+
+Usage:
+    python app/main_serving.py models/airbnb_lisbon.joblib < listings.jsonl > predictions.jsonl
+    python app/main_serving.py models/airbnb_lisbon.joblib --port 8000 --workers 4
+"""
+
+import argparse
+import logging
+import multiprocessing
+from http.server import ThreadingHTTPServer
+
+from learning import load_model, MicroBatcher, serve_jsonl, serve_http
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+
+def create_batcher(model_path: str, max_batch_size: int, max_delay: float) -> tuple[MicroBatcher, dict]:
+    """
+    Loads the artifact (memory-mapped) and starts its micro-batcher.
+
+    Returns:
+        tuple: The batcher and the model description served by /health.
+    """
+    artifact = load_model(model_path)
+    info = {key: artifact[key] for key in ("model", "metric", "scores", "columns")}
+    batcher = MicroBatcher(
+        artifact["pipeline"], artifact["columns"], max_batch_size, max_delay, artifact.get("numeric_columns")
+    )
+    return batcher, info
+
+
+def run_worker(server: ThreadingHTTPServer, model_path: str, max_batch_size: int, max_delay: float):
+    """
+    Serves HTTP requests on the shared socket, with the artifact loaded in this process.
+    """
+    batcher, info = create_batcher(model_path, max_batch_size, max_delay)
+    serve_http(batcher, info, server=server)
+
+
+def main():
+    """
+    Main function to serve the model given on the command line.
+    """
+
+    parser = argparse.ArgumentParser(description="Serve the predictions of a saved AutoML model.")
+    parser.add_argument("model", help="Artifact written by AutoMLPipeline.save.")
+    parser.add_argument("--port", type=int, help="Serve over HTTP on this port instead of stdin.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--workers", type=int, default=1, help="HTTP worker processes.")
+    parser.add_argument("--max-batch-size", type=int, default=256)
+    parser.add_argument("--max-delay-ms", type=float, default=2.0)
+    args = parser.parse_args()
+
+    max_delay = args.max_delay_ms / 1000
+
+    if args.port is None:
+        batcher, _ = create_batcher(args.model, args.max_batch_size, max_delay)
+        serve_jsonl(batcher)
+        return
+
+    # The socket is bound once, the forked workers accept connections on it in turn
+    server = ThreadingHTTPServer((args.host, args.port), None)
+    context = multiprocessing.get_context("fork")
+    workers = [
+        context.Process(target=run_worker, args=(server, args.model, args.max_batch_size, max_delay))
+        for _ in range(args.workers)
+    ]
+    for worker in workers:
+        worker.start()
+    logging.info(f"Serving {args.model} on http://{args.host}:{args.port} with {args.workers} workers")
+
+    try:
+        for worker in workers:
+            worker.join()
+    except KeyboardInterrupt:
+        for worker in workers:
+            worker.terminate()
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
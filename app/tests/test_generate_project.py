@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+
+from data_parsing import parse_file, write_project
+from data_parsing.generate_project import _precedence_arcs, generate_project
+
+
+def arc_count(data):
+    # Arcs between non-dummy jobs, the supersource and supersink arcs excluded
+    sink = data.general_info.jobs
+    return sum(
+        successor != sink for job in data.precedence_relations[1:] for successor in job.successors
+    )
+
+
+@pytest.mark.parametrize("jobs", [1, 2, 3, 4, 5])
+def test_tiny_projects(jobs):
+    data = generate_project(jobs, seed=0)
+
+    assert data.general_info.jobs == jobs + 2
+    assert len(data.precedence_relations) == jobs + 2
+
+
+@pytest.mark.parametrize(
+    "jobs, network_complexity", [(10, 2.5), (100, 9.5), (30, 100.0)]
+)
+def test_dense_projects_use_every_allowed_arc(jobs, network_complexity):
+    window = max(2, int(np.sqrt(jobs)))
+    capacity = sum(min(window, jobs - 1 - source) for source in range(jobs - 1))
+
+    data = generate_project(jobs, network_complexity=network_complexity, seed=0)
+
+    assert arc_count(data) == min(round(network_complexity * jobs), capacity)
+
+
+def test_arcs_stay_inside_the_window():
+    jobs = 50
+    window = max(2, int(np.sqrt(jobs)))
+
+    arcs = _precedence_arcs(jobs, 4.0, np.random.default_rng(0))
+
+    assert len(arcs) == round(4.0 * jobs)
+    assert all(0 < target - source <= window and target < jobs for source, target in arcs)
+
+
+def test_same_seed_same_project():
+    first = generate_project(40, seed=7)
+    second = generate_project(40, seed=7)
+
+    assert [job.successors for job in first.precedence_relations] == [
+        job.successors for job in second.precedence_relations
+    ]
+
+
+@pytest.mark.parametrize("jobs", [10, 1000])
+def test_generated_project_round_trips_through_parse_file(jobs, tmp_path):
+    data = generate_project(jobs, network_complexity=2.0, resources=3, seed=11)
+
+    path = tmp_path / "project.txt"
+    with open(path, "w") as file:
+        write_project(data, file)
+    with open(path, "r") as file:
+        parsed = parse_file(file)
+
+    assert parsed.general_info.jobs == data.general_info.jobs
+    assert parsed.general_info.horizon == data.general_info.horizon
+    assert [(job.job_number, job.successors) for job in parsed.precedence_relations] == [
+        (job.job_number, job.successors) for job in data.precedence_relations
+    ]
+    assert [(dr.job_number, dr.duration, dr.resources) for dr in parsed.durations_resources] == [
+        (dr.job_number, dr.duration, dr.resources) for dr in data.durations_resources
+    ]
+    assert {name: r.quantity for name, r in parsed.resource_availability.items()} == {
+        name: r.quantity for name, r in data.resource_availability.items()
+    }
+    assert parsed.projects_summary[0].due_date == data.projects_summary[0].due_date
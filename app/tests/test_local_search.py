@@ -0,0 +1,52 @@
+import numpy as np
+
+from csp_solvers.heuristic.local_search import ActivityList, _random_shift, activity_list, improve
+from csp_solvers.heuristic.solve import _instance_arrays, solve
+from data_parsing.generate_project import generate_project
+
+
+def test_undo_restores_the_schedule():
+    data = generate_project(60, max_duration=30, seed=4)
+    arrays = _instance_arrays(data)
+    solution = solve(data)
+    starts = np.array([solution[f"job_{number}"] for number in data.arrays.job_numbers])
+    schedule = ActivityList(*arrays, activity_list(starts, arrays[3]))
+    order, starts, free = schedule.order.copy(), schedule.starts.copy(), schedule.free.copy()
+
+    rng = np.random.default_rng(0)
+    bound = schedule.objective()[0]
+    for _ in range(500):
+        move = _random_shift(schedule, rng)
+        if move is None:
+            continue
+        saved, _ = schedule.shift(*move, bound)
+        schedule.undo(saved)
+
+    assert (schedule.order == order).all()
+    assert (schedule.starts == starts).all()
+    assert (schedule.free == free).all()
+
+
+def test_shift_decodes_like_a_full_decode():
+    data = generate_project(60, max_duration=30, seed=5)
+    arrays = _instance_arrays(data)
+    solution = solve(data)
+    starts = np.array([solution[f"job_{number}"] for number in data.arrays.job_numbers])
+    schedule = ActivityList(*arrays, activity_list(starts, arrays[3]))
+
+    rng = np.random.default_rng(1)
+    for _ in range(200):
+        move = _random_shift(schedule, rng)
+        if move is not None:
+            schedule.shift(*move)
+
+    decoded = ActivityList(*arrays, schedule.order)
+    assert (schedule.starts == decoded.starts).all()
+    assert (schedule.free == decoded.free).all()
+
+
+def test_islands_without_time_keep_the_start_schedule():
+    data = generate_project(30, seed=6)
+    solution = solve(data)
+
+    assert improve(data, solution, time_limit=0, islands=2) == solution
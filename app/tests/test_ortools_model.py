@@ -0,0 +1,30 @@
+import pytest
+
+from csp_solvers import ortools
+from data_parsing import ResourceAvailability
+from data_parsing.generate_project import generate_project
+
+
+def with_budget(budget):
+    # A generated project where every job consumes 2 units of a nonrenewable resource N1
+    data = generate_project(10, seed=3)
+    for dr in data.durations_resources:
+        dr.resources["N1"] = 2 if 1 < dr.job_number < data.general_info.jobs else 0
+    data.resource_availability["N1"] = ResourceAvailability("N1", budget, "nonrenewable")
+    data.reset_arrays()
+    return data
+
+
+def test_nonrenewable_budget_exceeded_is_rejected():
+    with pytest.raises(ValueError, match="N1"):
+        ortools.define_problem(with_budget(19))
+
+
+def test_nonrenewable_budget_met_is_solved():
+    model, start_times = ortools.define_problem(with_budget(20))
+    solver = ortools.create_solver(1, 5.0)
+
+    status, solution, _ = ortools.solve(model, start_times, with_budget(20), solver)
+
+    assert solver.StatusName(status) == "OPTIMAL"
+    assert solution
@@ -0,0 +1,36 @@
+import os
+import signal
+import time
+
+from csp_solvers import portfolio, python_constraint
+from data_parsing.generate_project import generate_project
+
+
+def test_failed_backend_does_not_block_the_race(monkeypatch):
+    def out_of_memory(*args, **kwargs):
+        raise MemoryError("instance too large")
+
+    monkeypatch.setattr(python_constraint, "define_problem", out_of_memory)
+    data = generate_project(20, seed=3)
+
+    start = time.perf_counter()
+    status, _, _, results = portfolio.solve(data, 30, backends=("PYTHON_CONSTRAINT",))
+
+    assert time.perf_counter() - start < 10
+    assert status == "UNKNOWN"
+    assert results["PYTHON_CONSTRAINT"]["status"] == "ERROR: MemoryError: instance too large"
+
+
+def test_killed_backend_does_not_block_the_race(monkeypatch):
+    def killed(*args, **kwargs):
+        os.kill(os.getpid(), signal.SIGKILL)
+
+    monkeypatch.setattr(python_constraint, "define_problem", killed)
+    data = generate_project(20, seed=3)
+
+    start = time.perf_counter()
+    status, _, _, results = portfolio.solve(data, 30, backends=("PYTHON_CONSTRAINT",))
+
+    assert time.perf_counter() - start < 10
+    assert status == "UNKNOWN"
+    assert results["PYTHON_CONSTRAINT"]["status"] == f"ERROR: exit code {-signal.SIGKILL}"
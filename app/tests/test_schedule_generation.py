@@ -0,0 +1,21 @@
+import pytest
+
+from csp_solvers import heuristic, validate
+from csp_solvers.heuristic import ScheduleScheme
+from data_parsing.generate_project import generate_project
+
+
+@pytest.mark.parametrize("scheme", [ScheduleScheme.SERIAL, ScheduleScheme.PARALLEL])
+@pytest.mark.parametrize("passes", [1, 5])
+def test_schedules_are_feasible(scheme, passes):
+    data = generate_project(300, seed=8)
+
+    solution = heuristic.solve(data, scheme, passes=passes, seed=0)
+
+    assert validate(solution, data).is_feasible
+
+
+def test_deterministic_pass_is_reproducible():
+    data = generate_project(300, seed=9)
+
+    assert heuristic.solve(data) == heuristic.solve(data)